@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+End-to-end load benchmark against the local stand-ins (benchmarks/standins.py).
+
+Builds a scratch working directory with a synthetic search_terms.txt and
+archive, points the code at the stand-ins, then runs, in order:
+
+    monitor  LiteratureMonitor().execute()
+    verify   verify_dois.main()
+    repair   repair_archives.main()
+
+and reports papers/sec per phase plus p50/p99 latency per stage. Stage
+latencies are taken by wrapping the functions each stage calls, so the code
+under test is unchanged.
+
+    python -m benchmarks.load_benchmark --terms 40 --archive-files 20 --llm-latency 0.2
+    python -m benchmarks.load_benchmark --json bench.json
+    python -m benchmarks.load_benchmark --compare bench.json   # exit 1 on regression
+    python -m benchmarks.load_benchmark --profile profiles/bench  # src/profiling.py output
+
+Streaming stages hand papers downstream while their request is open, so a
+pipeline that holds a backend slot while waiting for queue space can stall.
+The deadlock regression run fills the queues with more papers than they hold
+and fails (dumping every thread's stack) if the run does not finish in time:
+
+    python -m benchmarks.load_benchmark --terms 80 --papers-per-term 12 --phases monitor \
+        --no-rate-limits --no-pack --timeout 120
+
+and the same for packed research requests, including packs cut off and asked
+again:
+
+    python -m benchmarks.load_benchmark --terms 80 --papers-per-term 12 --phases monitor \
+        --no-rate-limits --timeout 120
+    python -m benchmarks.load_benchmark --terms 32 --papers-per-term 12 --phases monitor \
+        --no-rate-limits --llm-reasoning-words 500 --timeout 120
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import faulthandler
+import functools
+import threading
+import contextlib
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.synthetic import SyntheticCorpus, write_archives
+from benchmarks.standins import StandinSuite, add_fault_arguments, faults_from_args
+
+PHASES = ('monitor', 'verify', 'repair')
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class LatencyRecorder:
+    """Collects call durations per stage name."""
+
+    def __init__(self):
+        self.samples = {}
+        self.marks = {}
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def mark(self, name):
+        """Remember the first time (seconds since creation) name happened."""
+        with self._lock:
+            self.marks.setdefault(name, round(time.perf_counter() - self.started, 3))
+
+    def record(self, stage, seconds):
+        with self._lock:
+            self.samples.setdefault(stage, []).append(seconds)
+
+    def wrap(self, stage, func):
+        """Return func wrapped so that every call is timed under stage."""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+        return timed
+
+    def summary(self):
+        """Return stage -> count, p50, p99 and mean in milliseconds."""
+        return {
+            stage: {
+                'count': len(samples),
+                'p50_ms': round(percentile(samples, 50) * 1000, 2),
+                'p99_ms': round(percentile(samples, 99) * 1000, 2),
+                'mean_ms': round(sum(samples) / len(samples) * 1000, 2),
+            }
+            for stage, samples in sorted(self.samples.items())
+        }
+
+
+def prepare_workdir(workdir, corpus, args):
+    """Create search_terms.txt, the synthetic archive and the page template."""
+    terms = corpus.make_terms(args.terms, args.papers_per_term)
+    with open(os.path.join(workdir, 'search_terms.txt'), 'w') as f:
+        f.write("\n".join(terms) + "\n")
+    archived = write_archives(corpus, os.path.join(workdir, 'src', 'archive'),
+                              args.archive_files, args.papers_per_file)
+    shutil.copytree(os.path.join(REPO_ROOT, 'src', 'templates'),
+                    os.path.join(workdir, 'src', 'templates'), dirs_exist_ok=True)
+    return terms, archived
+
+
+@contextlib.contextmanager
+def _quiet(verbose):
+    """Silence the scripts' progress output unless verbose."""
+    if verbose:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def run_monitor(recorder, args):
+    from src.monitor import LiteratureMonitor
+
+    monitor = LiteratureMonitor()
+    monitor.STREAM_RESPONSES = not args.no_stream
+    monitor.PACK_SEARCH_TERMS = not args.no_pack
+    monitor._deep_research_query = recorder.wrap('query', monitor._deep_research_query)
+    monitor._stream_research_query = recorder.wrap('query', monitor._stream_research_query)
+    monitor._research_pack = recorder.wrap('query', monitor._research_pack)
+    monitor._parse_response = recorder.wrap('parse', monitor._parse_response)
+    monitor._verify_papers = recorder.wrap('verify', monitor._verify_papers)
+    monitor._generate_paper_summaries = recorder.wrap('summarize', monitor._generate_paper_summaries)
+    save = recorder.wrap('save', monitor._save_to_zotero)
+
+    def first_save(paper):
+        recorder.mark('first_paper')
+        return save(paper)
+    monitor._save_to_zotero = first_save
+    monitor.zot.create_items = recorder.wrap('zotero.create_items', monitor.zot.create_items)
+    monitor.generate_site = recorder.wrap('site', monitor.generate_site)
+    recorder.started = time.perf_counter()
+    with _quiet(args.verbose):
+        monitor.execute()
+    return len(recorder.samples.get('save', []))
+
+
+def run_verify(recorder, args):
+    import verify_dois
+    with _quiet(args.verbose):
+        results = verify_dois.main()
+    return sum(len(papers) for papers in results.values())
+
+
+def run_repair(recorder, args):
+    import repair_archives
+    from src.archive_index import load_archive_index
+
+    papers = sum(1 for p in load_archive_index(repair_archives.ARCHIVE_DIR).papers(prefix="papers_")
+                 if p['doi'])
+    repair_archives.call_perplexity = recorder.wrap('perplexity', repair_archives.call_perplexity)
+    with _quiet(args.verbose):
+        repair_archives.main()
+    return papers
+
+
+RUNNERS = {'monitor': run_monitor, 'verify': run_verify, 'repair': run_repair}
+
+
+_originals = {}
+
+
+def _instrument_crossref(recorder):
+    from src import crossref
+    _originals.setdefault('_lookup_bulk', crossref._lookup_bulk)
+    _originals.setdefault('lookup', crossref.lookup)
+    crossref._lookup_bulk = recorder.wrap('crossref.bulk', _originals['_lookup_bulk'])
+    crossref.lookup = recorder.wrap('crossref.lookup', _originals['lookup'])
+
+
+def run_benchmark(args):
+    """
+    Run the selected phases and return the report dictionary.
+
+    Environment variables and the working directory are changed before any
+    src module is imported, because several of them read their configuration
+    (endpoints, cache paths) at import time.
+    """
+    corpus = SyntheticCorpus(seed=args.seed, fake_rate=args.fake_rate,
+                             preprint_rate=args.preprint_rate)
+    workdir = args.workdir or tempfile.mkdtemp(prefix='literature-bench-')
+    os.makedirs(workdir, exist_ok=True)
+    terms, archived = prepare_workdir(workdir, corpus, args)
+
+    # Part of what the monitor "finds" is already in the library
+    known = [p['doi'] for term in terms[:int(len(terms) * args.known_fraction)]
+             for p in corpus.term_papers(term)]
+    suite = StandinSuite(
+        corpus,
+        crossref=faults_from_args(args, 'crossref'),
+        llm=faults_from_args(args, 'llm'),
+        zotero=faults_from_args(args, 'zotero'),
+        library_dois=known,
+        token_delay=args.llm_token_delay,
+        reasoning_words=args.llm_reasoning_words,
+    ).start()
+
+    previous_cwd = os.getcwd()
+    os.environ.update(suite.env())
+    os.environ.setdefault('LLM_CACHE_MODE', args.llm_cache)
+    os.chdir(workdir)
+    # Configure logging before src.monitor's basicConfig() call can
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO)
+    else:
+        logging.basicConfig(level=logging.WARNING)
+        logging.getLogger('literature_monitor').setLevel(logging.ERROR)
+    if args.no_rate_limits:
+        from src import scheduler
+        for name, (max_concurrency, _, burst) in scheduler.BACKENDS.items():
+            scheduler.BACKENDS[name] = (max_concurrency, 1000.0, max(burst, 100))
+
+    report = {
+        'config': {k: v for k, v in vars(args).items() if k not in ('json', 'compare')},
+        'workdir': workdir,
+        'terms': len(terms),
+        'archived_papers': archived,
+        'phases': {},
+    }
+    profiler = None
+    if args.profile:
+        from src.profiling import RunProfiler
+        profiler = RunProfiler(args.profile, memory=not args.profile_no_memory).start()
+    try:
+        for phase in args.phases:
+            recorder = LatencyRecorder()
+            _instrument_crossref(recorder)
+            start = time.perf_counter()
+            error = None
+            try:
+                with profiler.stage(phase) if profiler else contextlib.nullcontext():
+                    papers = RUNNERS[phase](recorder, args)
+            except Exception as e:
+                papers, error = 0, f"{type(e).__name__}: {e}"
+            elapsed = time.perf_counter() - start
+            report['phases'][phase] = {
+                'papers': papers,
+                'seconds': round(elapsed, 3),
+                'papers_per_sec': round(papers / elapsed, 2) if elapsed > 0 else 0.0,
+                'stages': recorder.summary(),
+            }
+            if 'first_paper' in recorder.marks:
+                report['phases'][phase]['first_paper_sec'] = recorder.marks['first_paper']
+            if error:
+                report['phases'][phase]['error'] = error
+    finally:
+        if profiler:
+            report['profile'] = profiler.stop()['directory']
+        os.chdir(previous_cwd)
+        suite.stop()
+    report['standins'] = suite.stats()
+    if not args.keep and not args.workdir:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return report
+
+
+def print_report(report):
+    print(f"{report['terms']} search terms, {report['archived_papers']} archived papers")
+    for phase, result in report['phases'].items():
+        print(f"\n{phase}: {result['papers']} papers in {result['seconds']:.2f}s "
+              f"({result['papers_per_sec']:.2f} papers/sec)")
+        if result.get('error'):
+            print(f"  FAILED: {result['error']}")
+        if 'first_paper_sec' in result:
+            print(f"  first paper saved after {result['first_paper_sec']:.2f}s")
+        print(f"  {'stage':<22}{'calls':>7}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+        for stage, s in result['stages'].items():
+            print(f"  {stage:<22}{s['count']:>7}{s['p50_ms']:>10.1f}{s['p99_ms']:>10.1f}{s['mean_ms']:>10.1f}")
+    print("\nstand-ins: " + ", ".join(
+        f"{name} {s['requests']} requests ({s['throttled']} throttled, {s['errors']} errors)"
+        for name, s in report['standins'].items()
+    ))
+    if report.get('profile'):
+        print(f"profiles: {report['profile']}")
+
+
+def compare(report, baseline, max_regression):
+    """
+    Compare papers/sec against a baseline report.
+
+    Returns:
+        list: Messages for phases that got slower than allowed
+    """
+    regressions = []
+    for phase, result in report['phases'].items():
+        before = baseline.get('phases', {}).get(phase, {}).get('papers_per_sec')
+        if not before:
+            continue
+        change = (result['papers_per_sec'] - before) / before
+        print(f"{phase}: {before:.2f} -> {result['papers_per_sec']:.2f} papers/sec ({change:+.1%})")
+        if change < -max_regression:
+            regressions.append(f"{phase} papers/sec dropped {-change:.1%}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end load benchmark against local stand-ins.")
+    parser.add_argument('--terms', type=int, default=20, help="search terms (default: 20)")
+    parser.add_argument('--papers-per-term', type=int, default=5,
+                        help="papers the LLM stand-in returns per term (default: 5)")
+    parser.add_argument('--archive-files', type=int, default=10,
+                        help="synthetic archive files (default: 10)")
+    parser.add_argument('--papers-per-file', type=int, default=20,
+                        help="papers per archive file (default: 20)")
+    parser.add_argument('--fake-rate', type=float, default=0.1,
+                        help="fraction of DOIs unknown to CrossRef (default: 0.1)")
+    parser.add_argument('--preprint-rate', type=float, default=0.05,
+                        help="fraction of arXiv DOIs (default: 0.05)")
+    parser.add_argument('--known-fraction', type=float, default=0.2,
+                        help="fraction of terms whose papers are already in Zotero (default: 0.2)")
+    parser.add_argument('--phases', type=lambda s: [p for p in s.split(',') if p],
+                        default=list(PHASES), help="comma-separated subset of monitor,verify,repair")
+    parser.add_argument('--llm-cache', default='off', choices=('off', 'readwrite', 'replay'),
+                        help="LLM_CACHE_MODE for the run (default: off)")
+    parser.add_argument('--no-rate-limits', action='store_true',
+                        help="lift the scheduler's per-backend rate budgets to measure code throughput")
+    parser.add_argument('--no-stream', action='store_true',
+                        help="wait for whole research replies instead of streaming them")
+    parser.add_argument('--no-pack', action='store_true',
+                        help="send one research request per search term instead of packing terms")
+    parser.add_argument('--workdir', help="reuse this directory (caches persist between runs)")
+    parser.add_argument('--keep', action='store_true', help="keep the scratch directory")
+    parser.add_argument('--json', help="write the report to this file")
+    parser.add_argument('--compare', help="baseline report to check for regressions")
+    parser.add_argument('--max-regression', type=float, default=0.1,
+                        help="allowed papers/sec drop against --compare (default: 0.1)")
+    parser.add_argument('--verbose', action='store_true', help="show the scripts' own output")
+    parser.add_argument('--timeout', type=float,
+                        help="fail with every thread's stack if the run takes longer (seconds)")
+    parser.add_argument('--profile', metavar='DIR',
+                        help="write per-phase and per-stage profiles (src/profiling.py) to DIR")
+    parser.add_argument('--profile-no-memory', action='store_true',
+                        help="with --profile, skip allocation tracing")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    unknown = set(args.phases) - set(PHASES)
+    if unknown:
+        parser.error(f"unknown phases: {', '.join(sorted(unknown))}")
+
+    if args.profile:
+        # The benchmark runs inside its scratch directory
+        args.profile = os.path.abspath(args.profile)
+    if args.timeout:
+        # A stalled pipeline never returns; dump the stacks and fail instead
+        faulthandler.dump_traceback_later(args.timeout, exit=True)
+    report = run_benchmark(args)
+    faulthandler.cancel_dump_traceback_later()
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport saved to: {args.json}")
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.max_regression)
+        if regressions:
+            print("REGRESSION: " + "; ".join(regressions))
+            return 1
+    return 1 if any(r.get('error') for r in report['phases'].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the per-paper parsing and normalization hot paths.
+
+Each case runs over a generated corpus (1k to 1M papers) that includes messy
+LLM output: URL- and 'doi:'-prefixed DOIs, [n] citation suffixes,
+parenthetical journals, prose TRLs and placeholder authors. Throughput is the
+best of --repeat timed runs; allocations are the tracemalloc peak and
+retained bytes of one extra run over at most --alloc-limit papers (tracing
+is several times slower than the code it measures), reported per paper.
+
+    python -m benchmarks.micro                        # 1k, 10k, 100k papers
+    python -m benchmarks.micro --full                 # ... and 1M
+    python -m benchmarks.micro --cases normalize_doi,parse_response --sizes 50000
+    python -m benchmarks.micro --json micro.json
+    python -m benchmarks.micro --compare micro.json   # exit 1 on regression
+"""
+
+import os
+import sys
+import gc
+import copy
+import json
+import time
+import random
+import shutil
+import logging
+import argparse
+import tempfile
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.synthetic import (SyntheticCorpus, archive_markdown, messy_doi,
+                                  messy_research_response)
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+FULL_SIZES = DEFAULT_SIZES + (1_000_000,)
+PAPERS_PER_RESPONSE = 10
+PAPERS_PER_FILE = 50
+DEFAULT_ALLOC_LIMIT = 100_000
+
+
+class Corpus:
+    """Inputs for every case, generated once per size."""
+
+    def __init__(self, size, seed=0):
+        rng = random.Random(seed)
+        papers = SyntheticCorpus(seed=seed, fake_rate=0.1, preprint_rate=0.05).papers(0, size)
+        self.size = size
+        self.dois = [messy_doi(p['doi'], rng) for p in papers]
+        self.responses = [
+            messy_research_response(papers[i:i + PAPERS_PER_RESPONSE], rng)
+            for i in range(0, size, PAPERS_PER_RESPONSE)
+        ]
+        self.archives = [
+            archive_markdown(papers[i:i + PAPERS_PER_FILE])
+            for i in range(0, size, PAPERS_PER_FILE)
+        ]
+        self.parsed = [dict(p, authors=list(p['authors'])) for p in papers]
+        for paper in rng.sample(self.parsed, size // 20):
+            paper['authors'] = ['Not specified']
+        self._dir = None
+        self._parent = None
+
+    def head(self, size):
+        """Return a Corpus over the first size papers (sharing this one's files)."""
+        if size >= self.size:
+            return self
+        head = copy.copy(self)
+        head.size = size
+        head.dois = self.dois[:size]
+        head.responses = self.responses[:-(-size // PAPERS_PER_RESPONSE)]
+        head.archives = self.archives[:-(-size // PAPERS_PER_FILE)]
+        head.parsed = self.parsed[:size]
+        head._parent = self
+        return head
+
+    def files(self):
+        """Write the archive contents to a scratch directory (once) and return the paths."""
+        if self._parent is not None:
+            return self._parent.files()[:len(self.archives)]
+        if self._dir is None:
+            self._dir = tempfile.mkdtemp(prefix='literature-micro-')
+            for i, content in enumerate(self.archives):
+                with open(os.path.join(self._dir, f"papers_{i:06d}.md"), 'w', encoding='utf-8') as f:
+                    f.write(content)
+        return [os.path.join(self._dir, f"papers_{i:06d}.md") for i in range(len(self.archives))]
+
+    def cleanup(self):
+        if self._dir and self._parent is None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+
+
+def _monitor():
+    """A LiteratureMonitor without __init__, which would connect to Zotero."""
+    from src.monitor import LiteratureMonitor
+    return LiteratureMonitor.__new__(LiteratureMonitor)
+
+
+def case_normalize_doi(corpus):
+    from src.doi_utils import normalize_doi
+    dois = corpus.dois
+    return lambda: [normalize_doi(doi) for doi in dois]
+
+
+def case_normalize_many(corpus):
+    from src.doi_utils import normalize_many
+    dois = corpus.dois
+    return lambda: normalize_many(dois, keys=True)
+
+
+def case_parse_response(corpus):
+    parse = _monitor()._parse_response
+    responses = corpus.responses
+    return lambda: [parse(response, verify=False) for response in responses]
+
+
+def case_validate(corpus):
+    validate = _monitor()._validate
+    papers = corpus.parsed
+    return lambda: [validate(paper, verify=False) for paper in papers]
+
+
+def case_parse_archive_content(corpus):
+    from src.archive_index import parse_archive_content
+    archives = corpus.archives
+    return lambda: [parse_archive_content(content) for content in archives]
+
+
+def case_parse_archive_markdown(corpus):
+    parse = _monitor()._parse_archive_markdown
+    archives = corpus.archives
+    return lambda: [parse(content) for content in archives]
+
+
+def case_verify_dois_parse_file(corpus):
+    import verify_dois
+    paths = corpus.files()
+    return lambda: [verify_dois.parse_archive_file(path) for path in paths]
+
+
+def case_repair_archives_parse_file(corpus):
+    import repair_archives
+    paths = corpus.files()
+    return lambda: [repair_archives.parse_archive_file(path) for path in paths]
+
+
+CASES = {
+    'normalize_doi': case_normalize_doi,
+    'normalize_many': case_normalize_many,
+    'parse_response': case_parse_response,
+    'validate': case_validate,
+    'parse_archive_content': case_parse_archive_content,
+    'parse_archive_markdown': case_parse_archive_markdown,
+    'verify_dois.parse_archive_file': case_verify_dois_parse_file,
+    'repair_archives.parse_archive_file': case_repair_archives_parse_file,
+}
+
+
+def measure(func, papers, repeat, alloc_func=None, alloc_papers=None):
+    """
+    Time func and record its allocations.
+
+    Args:
+        func (callable): Runs the case over the whole corpus
+        papers (int): Papers processed by func
+        repeat (int): Timed runs
+        alloc_func (callable): Traced instead of func, if given
+        alloc_papers (int): Papers processed by alloc_func
+
+    Returns:
+        dict: seconds (best run), papers_per_sec, peak and retained bytes per paper
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = (alloc_func or func)()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    alloc_papers = alloc_papers or papers
+
+    return {
+        'papers': papers,
+        'seconds': round(best, 4),
+        'papers_per_sec': round(papers / best) if best > 0 else 0,
+        'peak_bytes_per_paper': round(peak / alloc_papers, 1),
+        'retained_bytes_per_paper': round(retained / alloc_papers, 1),
+    }
+
+
+def run(sizes, cases, repeat, seed, alloc_limit=DEFAULT_ALLOC_LIMIT):
+    """Run every case at every size and return the results keyed 'case@size'."""
+    results = {}
+    for size in sizes:
+        print(f"Generating {size:,} papers...", flush=True)
+        corpus = Corpus(size, seed)
+        head = corpus.head(alloc_limit)
+        try:
+            for name in cases:
+                results[f"{name}@{size}"] = result = measure(
+                    CASES[name](corpus), size, repeat,
+                    CASES[name](head) if head is not corpus else None, head.size
+                )
+                print(f"  {name:<38}{result['papers_per_sec']:>12,} papers/s"
+                      f"{result['peak_bytes_per_paper']:>10,.0f} B/paper peak"
+                      f"{result['retained_bytes_per_paper']:>10,.0f} B/paper kept", flush=True)
+        finally:
+            corpus.cleanup()
+    return results
+
+
+def compare(results, baseline, max_regression):
+    """
+    Compare papers/sec against a baseline.
+
+    Returns:
+        list: Messages for cases that got slower than allowed
+    """
+    regressions = []
+    for key, result in results.items():
+        before = baseline.get(key, {}).get('papers_per_sec')
+        if not before:
+            continue
+        change = (result['papers_per_sec'] - before) / before
+        print(f"{key}: {before:,} -> {result['papers_per_sec']:,} papers/s ({change:+.1%})")
+        if change < -max_regression:
+            regressions.append(f"{key} dropped {-change:.1%}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the parsing hot paths.")
+    parser.add_argument('--sizes', type=lambda s: [int(n) for n in s.split(',') if n],
+                        help="comma-separated corpus sizes (default: 1000,10000,100000)")
+    parser.add_argument('--full', action='store_true', help="also run the 1,000,000 paper corpus")
+    parser.add_argument('--cases', type=lambda s: [c for c in s.split(',') if c],
+                        default=list(CASES), help=f"comma-separated subset of {', '.join(CASES)}")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case (default: 3)")
+    parser.add_argument('--alloc-limit', type=int, default=DEFAULT_ALLOC_LIMIT,
+                        help=f"papers traced for allocations (default: {DEFAULT_ALLOC_LIMIT})")
+    parser.add_argument('--seed', type=int, default=0, help="corpus seed")
+    parser.add_argument('--json', help="write the results to this file")
+    parser.add_argument('--compare', help="baseline results to check for regressions")
+    parser.add_argument('--max-regression', type=float, default=0.1,
+                        help="allowed papers/sec drop against --compare (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+
+    # Rejected papers are logged; keep that I/O out of the measurements
+    logging.getLogger('literature_monitor').setLevel(logging.CRITICAL)
+    results = run(sizes, args.cases, max(1, args.repeat), args.seed, max(1, args.alloc_limit))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.json}")
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        if regressions:
+            print("REGRESSION: " + "; ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,525 @@
+"""
+Local stand-ins for CrossRef, an OpenAI-compatible chat completions API and
+the Zotero Web API, so the pipeline can be exercised without live services.
+
+Each stand-in is a threaded HTTP/1.1 server (keep-alive, like the real APIs)
+answering from a SyntheticCorpus, with configurable latency, error rate and
+429 behaviour. Point the code at them through the environment variables from
+StandinSuite.env():
+
+    CROSSREF_API_URL  src/crossref.py
+    PPLX_API_BASE     LiteratureMonitor (perplexity provider), repair_archives.py
+    ZOTERO_API_URL    LiteratureMonitor
+
+Run `python -m benchmarks.standins` to serve them until interrupted.
+Uses only standard library.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote, urlencode
+
+from benchmarks.synthetic import SyntheticCorpus, research_response
+
+
+class Faults:
+    """Latency and failure injection for one stand-in."""
+
+    def __init__(self, latency=0.0, jitter=0.5, error_rate=0.0, throttle_rate=0.0,
+                 retry_after=1.0, seed=0):
+        """
+        Args:
+            latency (float): Mean response delay in seconds
+            jitter (float): Delay varies uniformly by +/- this fraction of latency
+            error_rate (float): Fraction of requests answered with HTTP 500
+            throttle_rate (float): Fraction of requests answered with HTTP 429
+            retry_after (float): Retry-After seconds sent with each 429
+            seed (int): Seed for the random draws
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self):
+        """
+        Decide the fate of one request.
+
+        Returns:
+            tuple: (delay seconds, None / 'error' / 'throttle')
+        """
+        with self._lock:
+            delay = self.latency * self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+            roll = self._rng.random()
+        if roll < self.throttle_rate:
+            return delay, 'throttle'
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, 'error'
+        return delay, None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _dispatch(self, method):
+        standin = self.server.standin
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        parts = urlsplit(self.path)
+        status, headers, payload = standin.serve(method, unquote(parts.path),
+                                                 parse_qs(parts.query), body)
+        if isinstance(payload, (dict, list)):
+            payload = json.dumps(payload).encode('utf-8')
+            headers.setdefault('Content-Type', 'application/json')
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, str(value))
+        if isinstance(payload, bytes):
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+        # Any other payload is an iterator of byte chunks, sent as they are produced
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for chunk in payload:
+            self.wfile.write(f"{len(chunk):x}\r\n".encode('ascii') + chunk + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients dropping idle keep-alive connections is not an error
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StandinServer:
+    """Base class: a local HTTP server that injects faults before answering."""
+
+    name = 'standin'
+
+    def __init__(self, corpus, faults=None, host='127.0.0.1', port=0):
+        """
+        Args:
+            corpus (SyntheticCorpus): Source of papers and DOIs
+            faults (Faults): Latency and failure injection (none by default)
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free one)
+        """
+        self.corpus = corpus
+        self.faults = faults or Faults()
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.standin = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        name=f"{self.name}-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def stats(self):
+        """Return request, 429 and error counts."""
+        return {'requests': self.requests, 'throttled': self.throttled, 'errors': self.errors}
+
+    def serve(self, method, path, query, body):
+        """Apply faults, then answer with handle()."""
+        delay, fault = self.faults.draw()
+        if delay > 0:
+            time.sleep(delay)
+        with self._lock:
+            self.requests += 1
+            if fault == 'throttle':
+                self.throttled += 1
+            elif fault == 'error':
+                self.errors += 1
+        if fault == 'throttle':
+            return 429, {'Retry-After': self.faults.retry_after}, {'error': 'Too Many Requests'}
+        if fault == 'error':
+            return 500, {}, {'error': 'Internal Server Error'}
+        return self.handle(method, path, query, body)
+
+    def handle(self, method, path, query, body):
+        """
+        Answer a request.
+
+        Args:
+            method (str): HTTP method
+            path (str): Unquoted URL path
+            query (dict): Parsed query string (name -> list of values)
+            body (bytes): Request body
+
+        Returns:
+            tuple: (status, headers dict, payload), the payload being a dict or
+                list (sent as JSON), bytes, or an iterator of bytes (sent chunked)
+        """
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+class CrossRefStandin(StandinServer):
+    """GET /works/{doi} and GET /works?filter=doi:A,doi:B,..."""
+
+    name = 'crossref'
+    RATE_HEADERS = {'X-Rate-Limit-Limit': 50, 'X-Rate-Limit-Interval': '1s'}
+
+    def handle(self, method, path, query, body):
+        headers = dict(self.RATE_HEADERS)
+        if path.startswith('/works/'):
+            work = self.corpus.work(path[len('/works/'):])
+            if work is None:
+                return 404, headers, b"Resource not found."
+            return 200, headers, {'status': 'ok', 'message-type': 'work', 'message': work}
+        if path == '/works':
+            filters = query.get('filter', [''])[0].split(',')
+            works = [self.corpus.work(f[len('doi:'):]) for f in filters if f.startswith('doi:')]
+            items = [w for w in works if w is not None]
+            return 200, headers, {'status': 'ok', 'message-type': 'work-list',
+                                  'message': {'total-results': len(items), 'items': items}}
+        return 404, headers, b"Resource not found."
+
+
+class ChatStandin(StandinServer):
+    """
+    POST /chat/completions in the OpenAI format. The reply depends on which of
+    the repo's prompts it receives: research queries list the term's papers
+    (one "=== TERM n ===" section per term for packed queries), batched
+    summary requests get a DOI -> summary JSON object, repair requests get the
+    real DOI for the title, anything else a one-line summary. Replies are cut
+    off at max_tokens (4 characters per token) like a real model's.
+    Requests with "stream": true get server-sent chat.completion.chunk events.
+    """
+
+    name = 'llm'
+
+    def __init__(self, corpus, faults=None, token_delay=0.0, reasoning_words=0, **kwargs):
+        """
+        Args:
+            corpus (SyntheticCorpus): Source of papers and DOIs
+            faults (Faults): Latency and failure injection
+            token_delay (float): Seconds to "generate" each word of a reply;
+                streamed replies are paced by it, others wait for the total
+            reasoning_words (int): Words of <think> reasoning per researched
+                term before the papers, as reasoning models write
+        """
+        super().__init__(corpus, faults, **kwargs)
+        self.token_delay = token_delay
+        self.reasoning_words = reasoning_words
+
+    _TERM = re.compile(r'papers about (.+?)\s+in biomedical engineering', re.DOTALL)
+    _TOPICS = re.compile(r'papers about each of these \d+ topics\s+in biomedical engineering'
+                         r' and robotics:\n(.*?)\n\s*\n', re.DOTALL)
+    _TOPIC = re.compile(r'^\s*\d+\.\s+(.+?)\s*$', re.MULTILINE)
+    _TITLE = re.compile(r'research paper titled: "(.*?)" by authors')
+    _DOI = re.compile(r'DOI: (\S+)')
+
+    def reply(self, prompt):
+        """Return the completion text for a user prompt."""
+        topics = self._TOPICS.search(prompt)
+        if topics:
+            terms = self._TOPIC.findall(topics.group(1))
+            sections = [f"=== TERM {i}: {term} ===\n{research_response(self.corpus.term_papers(term))}"
+                        for i, term in enumerate(terms, 1)]
+            return self._reasoning(len(terms)) + "\n\n".join(sections) + "\n\n=== END ==="
+        term = self._TERM.search(prompt)
+        if term:
+            return self._reasoning(1) + research_response(self.corpus.term_papers(term.group(1).strip()))
+        if 'JSON object mapping each DOI' in prompt:
+            return json.dumps({doi: f"Synthetic summary of {doi}."
+                               for doi in self._DOI.findall(prompt)})
+        title = self._TITLE.search(prompt)
+        if title:
+            return self.corpus.doi_for_title(title.group(1)) or "NOT FOUND"
+        return "Synthetic summary of the paper."
+
+    def _reasoning(self, terms):
+        if not self.reasoning_words:
+            return ''
+        return "<think>\n" + " ".join(["considering"] * (self.reasoning_words * terms)) + "\n</think>\n"
+
+    def handle(self, method, path, query, body):
+        if method != 'POST' or not path.endswith('/chat/completions'):
+            return 404, {}, {'error': 'Not Found'}
+        request = json.loads(body or b'{}')
+        prompt = next((m.get('content', '') for m in reversed(request.get('messages', []))
+                       if m.get('role') == 'user'), '')
+        content = self.reply(prompt)
+        finish_reason = 'stop'
+        limit = request.get('max_tokens')
+        if limit and len(content) > 4 * limit:
+            content, finish_reason = content[:4 * limit], 'length'
+        pieces = re.findall(r'\s*\S+', content) or [content]
+        if request.get('stream'):
+            return 200, {'Content-Type': 'text/event-stream'}, self._events(request, pieces, finish_reason)
+        if self.token_delay:
+            time.sleep(self.token_delay * len(pieces))
+        return 200, {}, {
+            'id': f"chatcmpl-standin-{self.requests}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'standin'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': finish_reason,
+            }],
+            'usage': self._usage(request, content),
+        }
+
+    def _usage(self, request, content):
+        prompt_tokens = sum(len(m.get('content', '')) for m in request.get('messages', [])) // 4
+        return {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': len(content) // 4,
+            'total_tokens': prompt_tokens + len(content) // 4,
+        }
+
+
+    def _events(self, request, pieces, finish_reason='stop'):
+        base = {
+            'id': f"chatcmpl-standin-{self.requests}",
+            'object': 'chat.completion.chunk',
+            'created': int(time.time()),
+            'model': request.get('model', 'standin'),
+        }
+        for piece in pieces:
+            if self.token_delay:
+                time.sleep(self.token_delay)
+            chunk = dict(base, choices=[{'index': 0, 'delta': {'content': piece},
+                                         'finish_reason': None}])
+            yield f"data: {json.dumps(chunk)}\n\n".encode('utf-8')
+        # Usage arrives with the final chunk, as Perplexity sends it
+        chunk = dict(base, choices=[{'index': 0, 'delta': {}, 'finish_reason': finish_reason}],
+                     usage=self._usage(request, ''.join(pieces)))
+        yield f"data: {json.dumps(chunk)}\n\n".encode('utf-8')
+        yield b"data: [DONE]\n\n"
+
+
+class ZoteroStandin(StandinServer):
+    """
+    The parts of the Zotero Web API the monitor uses: paged GET items and
+    collections (with Link and Last-Modified-Version headers, or as a
+    key -> version map with format=versions), GET deleted,
+    and POST items / collections with Zotero's write response format.
+    """
+
+    name = 'zotero'
+    PAGE_SIZE = 100
+
+    def __init__(self, corpus, faults=None, library_dois=(), **kwargs):
+        """
+        Args:
+            corpus (SyntheticCorpus): Source of papers and DOIs
+            faults (Faults): Latency and failure injection
+            library_dois (iterable): DOIs already in the library
+        """
+        super().__init__(corpus, faults, **kwargs)
+        self.version = 1
+        self.items = []
+        self.collections = []
+        self._next_key = 0
+        for doi in library_dois:
+            self._add(self.items, {'itemType': 'journalArticle', 'DOI': doi, 'title': doi})
+
+    def _add(self, objects, data):
+        self._next_key += 1
+        key = f"S{self._next_key:07d}"
+        data = dict(data, key=key, version=self.version)
+        obj = {'key': key, 'version': self.version, 'library': {'type': 'user'},
+               'links': {}, 'meta': {}, 'data': data}
+        objects.append(obj)
+        return obj
+
+    def _page(self, objects, path, query):
+        since = int(query.get('since', ['0'])[0])
+        selected = [o for o in objects if o['version'] > since]
+        if query.get('format') == ['versions']:
+            return 200, {'Last-Modified-Version': self.version}, {o['key']: o['version'] for o in selected}
+        start = int(query.get('start', ['0'])[0])
+        limit = min(int(query.get('limit', [str(self.PAGE_SIZE)])[0] or self.PAGE_SIZE),
+                    self.PAGE_SIZE)
+        headers = {'Last-Modified-Version': self.version, 'Total-Results': len(selected)}
+        if start + limit < len(selected):
+            params = {name: values[0] for name, values in query.items()}
+            params.update(start=start + limit, limit=limit)
+            headers['Link'] = f'<{self.url}{path}?{urlencode(params)}>; rel="next"'
+        return 200, headers, selected[start:start + limit]
+
+    def _create(self, objects, body):
+        payload = json.loads(body or b'[]')
+        self.version += 1
+        successful, success = {}, {}
+        for i, data in enumerate(payload):
+            obj = self._add(objects, data)
+            successful[str(i)] = obj
+            success[str(i)] = obj['key']
+        return 200, {'Last-Modified-Version': self.version}, {
+            'successful': successful, 'success': success, 'unchanged': {}, 'failed': {},
+        }
+
+    def handle(self, method, path, query, body):
+        match = re.match(r'^/(users|groups)/[^/]+/(items|collections|deleted)$', path)
+        if not match:
+            return 404, {}, b"Not found"
+        resource = match.group(2)
+        with self._lock:
+            if method == 'POST' and resource != 'deleted':
+                return self._create(getattr(self, resource), body)
+            if resource == 'deleted':
+                return 200, {'Last-Modified-Version': self.version}, {
+                    'collections': [], 'items': [], 'searches': [], 'tags': [], 'settings': [],
+                }
+            return self._page(getattr(self, resource), path, query)
+
+
+class StandinSuite:
+    """CrossRef, chat completions and Zotero stand-ins started together."""
+
+    def __init__(self, corpus=None, crossref=None, llm=None, zotero=None, library_dois=(),
+                 token_delay=0.0, reasoning_words=0):
+        """
+        Args:
+            corpus (SyntheticCorpus): Shared paper source (a default one if None)
+            crossref (Faults): Faults for the CrossRef stand-in
+            llm (Faults): Faults for the chat completions stand-in
+            zotero (Faults): Faults for the Zotero stand-in
+            library_dois (iterable): DOIs already in the Zotero library
+            token_delay (float): Per-word generation delay of the chat stand-in
+            reasoning_words (int): <think> words per researched term of the chat stand-in
+        """
+        self.corpus = corpus or SyntheticCorpus()
+        self.crossref = CrossRefStandin(self.corpus, crossref)
+        self.llm = ChatStandin(self.corpus, llm, token_delay=token_delay,
+                               reasoning_words=reasoning_words)
+        self.zotero = ZoteroStandin(self.corpus, zotero, library_dois=library_dois)
+        self.servers = [self.crossref, self.llm, self.zotero]
+
+    def start(self):
+        for server in self.servers:
+            server.start()
+        return self
+
+    def stop(self):
+        for server in self.servers:
+            server.stop()
+
+    def env(self):
+        """Environment variables that point the repo's code at the stand-ins."""
+        return {
+            'CROSSREF_API_URL': self.crossref.url,
+            'PPLX_API_BASE': self.llm.url,
+            'PPLX_API_KEY': 'standin',
+            'ZOTERO_API_URL': self.zotero.url,
+            'ZOTERO_USER_ID': '1',
+            'ZOTERO_API_KEY': 'standin',
+            # Keep the stand-ins reachable when an HTTP(S)_PROXY is configured
+            'NO_PROXY': ','.join(filter(None, [os.getenv('NO_PROXY'), '127.0.0.1', 'localhost'])),
+        }
+
+    def stats(self):
+        """Per-server request, 429 and error counts."""
+        return {server.name: server.stats() for server in self.servers}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def add_fault_arguments(parser):
+    """Add --<service>-latency/-error-rate/-throttle-rate options to an argparse parser."""
+    for service in ('crossref', 'llm', 'zotero'):
+        parser.add_argument(f'--{service}-latency', type=float, default=0.0,
+                            help=f"mean {service} response delay in seconds")
+        parser.add_argument(f'--{service}-error-rate', type=float, default=0.0,
+                            help=f"fraction of {service} requests answered with 500")
+        parser.add_argument(f'--{service}-throttle-rate', type=float, default=0.0,
+                            help=f"fraction of {service} requests answered with 429")
+    parser.add_argument('--llm-token-delay', type=float, default=0.0,
+                        help="seconds the LLM stand-in takes per generated word")
+    parser.add_argument('--llm-reasoning-words', type=int, default=0,
+                        help="<think> words the LLM stand-in writes per researched term")
+    parser.add_argument('--retry-after', type=float, default=1.0,
+                        help="Retry-After seconds sent with each 429 (default: 1)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for data and faults")
+
+
+def faults_from_args(args, service):
+    """Build the Faults for a service from add_fault_arguments() options."""
+    return Faults(
+        latency=getattr(args, f'{service}_latency'),
+        error_rate=getattr(args, f'{service}_error_rate'),
+        throttle_rate=getattr(args, f'{service}_throttle_rate'),
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the CrossRef, LLM and Zotero stand-ins.")
+    parser.add_argument('--fake-rate', type=float, default=0.1,
+                        help="fraction of synthetic DOIs unknown to CrossRef")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    suite = StandinSuite(
+        SyntheticCorpus(seed=args.seed, fake_rate=args.fake_rate),
+        crossref=faults_from_args(args, 'crossref'),
+        llm=faults_from_args(args, 'llm'),
+        zotero=faults_from_args(args, 'zotero'),
+        token_delay=args.llm_token_delay,
+        reasoning_words=args.llm_reasoning_words,
+    ).start()
+    for name, value in suite.env().items():
+        print(f"export {name}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        suite.stop()
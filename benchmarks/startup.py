@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Startup budget for the short entry points.
+
+Each path is started in a fresh interpreter (with -X importtime) in a scratch
+working directory, the way CI and maintenance commands start it:
+
+    regenerate  import regenerate_site
+    verify      import verify_dois
+    repair      import repair_archives
+    cleanup     import cleanup_archives
+    monitor     import src.monitor and construct LiteratureMonitor()
+
+Reported startup is the best wall time over --repeat runs minus that of a bare
+interpreter, so it is what the repo's own imports and setup cost. The slowest
+imports (cumulative, from -X importtime) are listed per path, and a path fails
+if it exceeds its budget or loads a provider SDK it should only load on use.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --paths verify,regenerate --top 20
+    python -m benchmarks.startup --json startup.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name: (module, setup statement, budget in ms)
+PATHS = {
+    'regenerate': ('regenerate_site', '', 100),
+    'verify': ('verify_dois', '', 100),
+    'repair': ('repair_archives', '', 100),
+    'cleanup': ('cleanup_archives', '', 100),
+    'monitor': ('src.monitor', 'src.monitor.LiteratureMonitor()', 250),
+}
+# Only imported once a client, the Zotero connection or the site template is used
+LAZY_MODULES = ('openai', 'anthropic', 'pyzotero', 'httpx', 'jinja2')
+
+_SCRIPT = """
+import sys, json, time
+start = time.perf_counter()
+import {module}
+{setup}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed,
+                   'loaded': [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def _env():
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [REPO_ROOT, env.get('PYTHONPATH')]))
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+    # Placeholder credentials: nothing may connect during startup
+    for name in ('ZOTERO_USER_ID', 'ZOTERO_API_KEY', 'PPLX_API_KEY'):
+        env.setdefault(name, 'startup-benchmark')
+    env['DOI_CACHE_PATH'] = '.cache/doi_cache.sqlite'
+    return env
+
+
+def _run(code, workdir, env, importtime=False):
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', code]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else
+                           f"exit code {result.returncode}")
+    return elapsed, result
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output.
+
+    Returns:
+        dict: Module name -> cumulative import time in ms
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = max(modules.get(name.strip(), 0), int(cumulative) / 1000)
+    return modules
+
+
+def measure(name, workdir, env, repeat, top):
+    """
+    Measure one path.
+
+    Returns:
+        dict: startup_ms, in_process_ms, budget_ms, lazy modules loaded,
+            slowest imports and whether the path is within budget
+    """
+    module, setup, budget = PATHS[name]
+    code = _SCRIPT.format(module=module, setup=setup, lazy=LAZY_MODULES)
+    bare = min(_run('pass', workdir, env)[0] for _ in range(repeat))
+    best, report = float('inf'), None
+    for _ in range(repeat):
+        elapsed, result = _run(code, workdir, env)
+        if elapsed < best:
+            best, report = elapsed, json.loads(result.stdout.strip().splitlines()[-1])
+    # One extra traced run for the import profile (tracing adds overhead)
+    _, traced = _run(code, workdir, env, importtime=True)
+    # Modules the interpreter loads before running any code are not ours
+    baseline = parse_importtime(_run('pass', workdir, env, importtime=True)[1].stderr)
+    imports = {m: ms for m, ms in parse_importtime(traced.stderr).items() if m not in baseline}
+    startup_ms = max(0.0, (best - bare) * 1000)
+    return {
+        'startup_ms': round(startup_ms, 1),
+        'in_process_ms': round(report['seconds'] * 1000, 1),
+        'budget_ms': budget,
+        'lazy_loaded': report['loaded'],
+        'slowest_imports': [[m, round(ms, 1)] for m, ms in
+                            sorted(imports.items(), key=lambda item: -item[1])[:top]],
+        'ok': startup_ms <= budget and not report['loaded'],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup budget for the short entry points.")
+    parser.add_argument('--paths', type=lambda s: [p for p in s.split(',') if p],
+                        default=list(PATHS), help=f"comma-separated subset of {', '.join(PATHS)}")
+    parser.add_argument('--repeat', type=int, default=5, help="timed starts per path (default: 5)")
+    parser.add_argument('--top', type=int, default=8, help="slowest imports to list (default: 8)")
+    parser.add_argument('--json', help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.paths) - set(PATHS)
+    if unknown:
+        parser.error(f"unknown paths: {', '.join(sorted(unknown))}")
+
+    workdir = tempfile.mkdtemp(prefix='literature-startup-')
+    with open(os.path.join(workdir, 'search_terms.txt'), 'w') as f:
+        f.write("startup benchmark\n")
+    env = _env()
+    results = {}
+    try:
+        for name in args.paths:
+            results[name] = result = measure(name, workdir, env, max(1, args.repeat), args.top)
+            status = 'ok' if result['ok'] else 'OVER BUDGET'
+            print(f"{name:<12}{result['startup_ms']:>8.1f} ms (budget {result['budget_ms']} ms)  {status}")
+            if result['lazy_loaded']:
+                print(f"  loaded at startup: {', '.join(result['lazy_loaded'])}")
+            for module, ms in result['slowest_imports']:
+                print(f"    {ms:>8.1f} ms  {module}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.json}")
+    return 0 if all(r['ok'] for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+Deterministic synthetic papers, search terms and archives for benchmarks.
+
+Paper i always has the same title, authors, keywords and DOI for a given seed,
+so the stand-in services and the benchmark drivers agree on what exists
+without sharing any state beyond the SyntheticCorpus object.
+Uses only standard library.
+"""
+
+import os
+import re
+import random
+import zlib
+
+REAL_PREFIX = "10.5555/bench."
+FAKE_PREFIX = "10.5555/fake."
+
+_ADJECTIVES = ['Adaptive', 'Closed-loop', 'Wearable', 'Implantable', 'Soft', 'Biohybrid',
+               'Low-power', 'Real-time', 'Bidirectional', 'High-density', 'Untethered',
+               'Sensorized', 'Learning-based', 'Compliant', 'Minimally invasive']
+_SUBJECTS = ['EMG decoding', 'intracortical recording', 'peripheral nerve stimulation',
+             'exoskeleton control', 'prosthetic hand', 'neural interface', 'muscle actuator',
+             'tactile feedback', 'gait rehabilitation', 'spinal cord stimulation',
+             'myoelectric prosthesis', 'brain-machine interface', 'soft gripper',
+             'cardiac patch', 'electrode array']
+_PURPOSES = ['for upper-limb amputees', 'in freely moving primates', 'with sparse data',
+             'under fatigue', 'for stroke survivors', 'in chronic implants',
+             'using transformers', 'with on-device inference', 'across sessions',
+             'for home use']
+_GIVEN = ['Alice', 'Bruno', 'Chen', 'Dana', 'Emeka', 'Farah', 'Goran', 'Hana', 'Ivan',
+          'Jia', 'Kofi', 'Lena', 'Mateo', 'Nadia', 'Omar', 'Priya', 'Quinn', 'Rosa']
+_FAMILY = ['Rossi', 'Nguyen', 'Müller', 'Okafor', 'Tanaka', 'García', 'Kowalski',
+           'Haddad', 'Larsen', 'Silva', 'Ivanova', 'Kim', 'Dubois', 'Patel', 'Moreau',
+           'Serdana', 'Lindqvist', 'Abebe']
+# Syllables of made-up method names, so titles are as distinct as real ones
+_SYLLABLES = ['ka', 'lo', 'mi', 'ren', 'tu', 'sa', 'vor', 'pen', 'dri', 'ax', 'nel', 'qui',
+              'zo', 'bar', 'fen', 'lis', 'mor', 'tak', 'vi', 'cen']
+_KEYWORDS = ['EMG', 'BCI', 'neuroprosthetics', 'soft robotics', 'machine learning',
+             'deep learning', 'haptics', 'rehabilitation', 'FES', 'implant',
+             'signal processing', 'control', 'biomechanics', 'wearables', 'sensors']
+
+
+class SyntheticCorpus:
+    """An indexable, effectively unbounded set of synthetic papers."""
+
+    def __init__(self, seed=0, fake_rate=0.1, preprint_rate=0.0):
+        """
+        Args:
+            seed (int): Seed shared by every generated value
+            fake_rate (float): Fraction of papers whose DOI does not exist in
+                CrossRef (the stand-in answers 404; repair finds the real one)
+            preprint_rate (float): Fraction of papers with an arXiv DOI
+        """
+        self.seed = seed
+        self.fake_rate = fake_rate
+        self.preprint_rate = preprint_rate
+        self.terms = {}
+
+    def _rng(self, i):
+        return random.Random(self.seed * 1_000_003 + i)
+
+    def paper(self, i, category=None):
+        """
+        Build paper i.
+
+        Args:
+            i (int): Paper index
+            category (str): Category to assign (defaults to one derived from i)
+
+        Returns:
+            dict: Paper metadata in the monitor's shape
+        """
+        rng = self._rng(i)
+        method = '-'.join(''.join(rng.choice(_SYLLABLES) for _ in range(3)).capitalize()
+                          for _ in range(2))
+        title = (f"{rng.choice(_ADJECTIVES)} {rng.choice(_SUBJECTS)} "
+                 f"{rng.choice(_PURPOSES)} via {method} ({i})")
+        draw = rng.random()
+        if draw < self.preprint_rate:
+            doi = f"10.48550/arXiv.{2400 + i % 100}.{i:05d}"
+        elif draw < self.preprint_rate + self.fake_rate:
+            doi = f"{FAKE_PREFIX}{i}"
+        else:
+            doi = f"{REAL_PREFIX}{i}"
+        return {
+            'title': title,
+            'authors': [f"{rng.choice(_GIVEN)} {rng.choice(_FAMILY)}"
+                        for _ in range(rng.randint(1, 6))],
+            'doi': doi,
+            'trl': rng.randint(1, 9),
+            'keywords': rng.sample(_KEYWORDS, rng.randint(2, 5)),
+            'summary': (f"This work presents a {title.split(' (')[0].lower()}. "
+                        f"It is evaluated on {rng.randint(3, 40)} participants."),
+            'category': category or rng.choice(_SUBJECTS).title(),
+        }
+
+    def papers(self, start, count, category=None):
+        """Build papers start .. start + count - 1."""
+        return [self.paper(i, category) for i in range(start, start + count)]
+
+    def work(self, doi):
+        """
+        Look a DOI up the way CrossRef would.
+
+        Returns:
+            dict or None: CrossRef work (DOI, title, author) or None if the DOI
+                does not exist
+        """
+        doi = doi.strip().lower()
+        if not doi.startswith(REAL_PREFIX):
+            return None
+        try:
+            i = int(doi[len(REAL_PREFIX):])
+        except ValueError:
+            return None
+        paper = self.paper(i)
+        return {
+            'DOI': doi,
+            'title': [paper['title']],
+            'author': [
+                {'given': ' '.join(name.split()[:-1]), 'family': name.split()[-1]}
+                for name in paper['authors']
+            ],
+        }
+
+    def doi_for_title(self, title):
+        """Return the real DOI of a generated paper by title, or None."""
+        match = re.search(r'\((\d+)\)$', title.strip())
+        if not match or self.paper(int(match.group(1)))['title'] != title.strip():
+            return None
+        return f"{REAL_PREFIX}{match.group(1)}"
+
+    def make_terms(self, count, papers_per_term, first_index=1_000_000):
+        """
+        Create search terms; each one "finds" its own block of papers.
+
+        Args:
+            count (int): Number of search terms
+            papers_per_term (int): Papers returned for each term
+            first_index (int): Index of the first paper returned for term 0
+
+        Returns:
+            list: Search terms
+        """
+        terms = []
+        for k in range(count):
+            term = f"{_SUBJECTS[k % len(_SUBJECTS)]} {_PURPOSES[k % len(_PURPOSES)]} {k}"
+            self.terms[term] = (first_index + k * papers_per_term, papers_per_term)
+            terms.append(term)
+        return terms
+
+    def term_papers(self, term, default_count=5):
+        """Return the papers a research query for term should report."""
+        if term not in self.terms:
+            # Unknown terms still get a stable block of papers
+            start = 10_000_000 + (zlib.crc32(term.encode('utf-8')) % 1_000_000) * default_count
+            self.terms[term] = (start, default_count)
+        start, count = self.terms[term]
+        return self.papers(start, count)
+
+
+def research_response(papers):
+    """Format papers the way the research prompt asks the model to."""
+    return "\n\n".join(
+        f"Title: {p['title']}\n"
+        f"Authors: {'; '.join(p['authors'])}\n"
+        f"DOI: {p['doi']}\n"
+        f"TRL: {p['trl']}\n"
+        f"Keywords: {', '.join(p['keywords'])}"
+        for p in papers
+    )
+
+
+_JOURNALS = ['Nature Biomedical Engineering', 'J Neural Eng, 2024', 'IEEE TNSRE',
+             'Science Robotics', 'bioRxiv preprint']
+_PLACEHOLDER_AUTHORS = ['Not specified', 'See article for full author list', 'et al.',
+                        '[Not provided]', 'Review article']
+
+
+def messy_doi(doi, rng):
+    """
+    Decorate a DOI the way LLM output does: URL and 'doi:' prefixes,
+    [n] citation suffixes, parenthetical journals or a placeholder.
+
+    Args:
+        doi (str): Clean DOI
+        rng (random.Random): Source of randomness
+
+    Returns:
+        str: The DOI as it might appear after 'DOI:' in a response
+    """
+    roll = rng.random()
+    if roll < 0.25:
+        return doi
+    if roll < 0.40:
+        return f"https://doi.org/{doi}"
+    if roll < 0.50:
+        return f"doi:{doi}"
+    if roll < 0.65:
+        return f"{doi}[{rng.randint(1, 20)}]"
+    if roll < 0.80:
+        return f"{doi} ({rng.choice(_JOURNALS)})"
+    if roll < 0.90:
+        return f"{doi} ({rng.choice(_JOURNALS)}) [{rng.randint(1, 20)}]"
+    if roll < 0.97:
+        return f"HTTPS://DOI.ORG/{doi}"
+    return "[Not provided in search results]"
+
+
+def messy_research_response(papers, rng):
+    """
+    Format papers like a real research reply: a preamble, decorated DOIs,
+    TRLs written as prose and the occasional placeholder author list.
+
+    Args:
+        papers (list): Papers to include
+        rng (random.Random): Source of randomness
+
+    Returns:
+        str: Response text for _parse_response
+    """
+    blocks = [f"Here are {len(papers)} recent peer-reviewed papers on this topic:"]
+    for p in papers:
+        authors = p['authors']
+        if rng.random() < 0.05:
+            authors = [rng.choice(_PLACEHOLDER_AUTHORS)]
+        elif rng.random() < 0.1:
+            authors = authors + ['et al.']
+        trl = rng.choice([str(p['trl']), f"{p['trl']} (prototype validated in lab)",
+                          f"Approximately {p['trl']}", "Not specified"])
+        blocks.append(
+            f"Title: {p['title']}\n"
+            f"Authors: {'; '.join(authors)}\n"
+            f"DOI: {messy_doi(p['doi'], rng)}\n"
+            f"TRL: {trl}\n"
+            f"Keywords: {', '.join(p['keywords'])}"
+        )
+    blocks.append("Note: availability of full text varies by publisher.")
+    return "\n\n".join(blocks)
+
+
+def archive_markdown(papers, heading="Research Papers Compilation"):
+    """Format papers as an archive file, grouped by category like _create_archive_file."""
+    categories = {}
+    for paper in papers:
+        categories.setdefault(paper['category'], []).append(paper)
+
+    lines = [f"# {heading}\n", "## Summary",
+             f"This compilation contains {len(papers)} new papers in biorobotics research.\n"]
+    for category, cat_papers in categories.items():
+        lines.append(f"## {category} ({len(cat_papers)} papers)\n")
+        for paper in cat_papers:
+            lines.extend([
+                f"### {paper['title']}\n",
+                f"**Authors:** {'; '.join(paper['authors'])}\n",
+                f"**DOI:** {paper['doi']}\n",
+                f"**TRL:** {paper['trl']}\n",
+                f"**Keywords:** {', '.join(paper['keywords'])}\n",
+                f"**Summary:** {paper['summary']}\n",
+                "---\n",
+            ])
+    return "\n".join(lines) + "\n"
+
+
+def write_archives(corpus, archive_dir, files, papers_per_file, first_index=0):
+    """
+    Write papers_YYYY-MM-DD.md archive files of synthetic papers.
+
+    Args:
+        corpus (SyntheticCorpus): Paper source
+        archive_dir (str): Target directory (created if missing)
+        files (int): Number of archive files
+        papers_per_file (int): Papers in each file
+        first_index (int): Index of the first paper
+
+    Returns:
+        int: Number of papers written
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    for f in range(files):
+        start = first_index + f * papers_per_file
+        year, day = 2020 + f // 336, f % 336
+        name = f"papers_{year}-{day // 28 + 1:02d}-{day % 28 + 1:02d}.md"
+        with open(os.path.join(archive_dir, name), 'w', encoding='utf-8') as out:
+            out.write(archive_markdown(corpus.papers(start, papers_per_file)))
+    return files * papers_per_file
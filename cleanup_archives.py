@@ -38,7 +38,10 @@ DOI verification completed on {datetime.now().strftime('%Y-%m-%d')}:
         content += "## Verified Papers\n\n"
         for paper in verified_in_file:
             content += f"### {paper['title']}\n\n"
-            content += f"**Authors:** {paper.get('authors', 'N/A')}\n\n"
+            authors = paper.get('authors') or 'N/A'
+            if isinstance(authors, list):
+                authors = '; '.join(authors)
+            content += f"**Authors:** {authors}\n\n"
             content += f"**DOI:** {paper.get('doi', 'N/A')}\n\n"
             details = paper.get('verification_details', {})
             if isinstance(details, dict):
@@ -58,12 +61,20 @@ DOI verification completed on {datetime.now().strftime('%Y-%m-%d')}:
     
     return content
 
-def main():
+def main(report=None):
+    """
+    Rewrite the archive files listed in a verification report.
+    
+    Args:
+        report (dict): Report in the verify_dois.py format (read from
+            REPORT_FILE if not given)
+    """
     print("=" * 60)
     print("CLEANING FAKE PAPERS FROM ARCHIVES")
     print("=" * 60)
     
-    report = load_report()
+    if report is None:
+        report = load_report()
     
     print(f"\nSummary from report:")
     print(f"  Total papers: {report['summary']['total']}")
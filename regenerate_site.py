@@ -5,69 +5,36 @@ This script can be run standalone to refresh the docs/ folder.
 """
 
 import os
-import re
-from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+
+from src.archive_index import load_archive_index
+from src.site_builder import build_site
 
 def parse_verified_papers():
     """Parse only verified papers from cleaned archive files."""
+    index = load_archive_index()
     papers = []
-    archive_dir = 'src/archive'
-    
-    if not os.path.exists(archive_dir):
-        return papers
     
-    for filename in sorted(os.listdir(archive_dir)):
-        if not filename.endswith('.md'):
-            continue
-            
-        filepath = os.path.join(archive_dir, filename)
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Only parse files with verified papers section
-        if '## Verified Papers' not in content:
+    # Only papers listed under a "## Verified Papers" section
+    for record in index.papers():
+        if record['section'] != 'Verified Papers' or not record['title']:
             continue
-        
-        # Extract verified papers section
-        in_verified = False
-        current_paper = None
-        
-        for line in content.split('\n'):
-            if line.startswith('## Verified Papers'):
-                in_verified = True
-                continue
-            if in_verified and line.startswith('## '):
-                # End of verified section
-                break
-            
-            if in_verified:
-                if line.startswith('### '):
-                    if current_paper and current_paper.get('title'):
-                        papers.append(current_paper)
-                    current_paper = {'title': line[4:].strip()}
-                elif current_paper:
-                    if line.startswith('**Authors:**'):
-                        current_paper['authors'] = line[12:].strip()
-                    elif line.startswith('**DOI:**'):
-                        current_paper['doi'] = line[8:].strip()
-                    elif line.startswith('**Verified Title:**'):
-                        # Use the real verified title
-                        current_paper['title'] = line[19:].strip()
-                    elif line.startswith('**Verified Authors:**'):
-                        current_paper['authors'] = line[21:].strip()
-        
-        # Add last paper
-        if current_paper and current_paper.get('title'):
-            papers.append(current_paper)
+        paper = dict(record)
+        # Use the real verified title/authors when present
+        if record['verified_title']:
+            paper['title'] = record['verified_title']
+        if record['verified_authors']:
+            paper['authors'] = record['verified_authors']
+        papers.append(paper)
     
     # Add default fields for template
     for paper in papers:
-        if 'trl' not in paper:
+        if not paper['category']:
+            paper['category'] = 'General Biorobotics'
+        if not paper['trl']:
             paper['trl'] = 'N/A'
-        if 'keywords' not in paper:
+        if not paper['keywords']:
             paper['keywords'] = ['verified paper']
-        if 'summary' not in paper:
+        if not paper['summary']:
             paper['summary'] = 'DOI verified against CrossRef.'
     
     return papers
@@ -82,21 +49,9 @@ def main():
     papers = parse_verified_papers()
     print(f"Found {len(papers)} verified papers")
     
-    # Setup Jinja2
-    env = Environment(loader=FileSystemLoader('src/templates'))
-    template = env.get_template('index.html')
-    
-    # Render template
-    html = template.render(
-        papers=papers,
-        updated=datetime.now().strftime("%Y-%m-%d %H:%M"),
-        count=len(papers),
-        total=len(papers)
-    )
-    
-    # Write output
-    with open('docs/index.html', 'w') as f:
-        f.write(html)
+    # Write data shards and render the page
+    manifest = build_site(papers, count=len(papers))
+    print(f"Wrote {len(manifest['shards'])} data shards to docs/data/")
     
     print(f"Generated docs/index.html with {len(papers)} verified papers")
     print("Site regeneration complete!")
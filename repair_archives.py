@@ -1,17 +1,21 @@
 #!/usr/bin/env python3
 """
 Repair archive papers by verifying DOIs and using Perplexity to find correct ones.
-Uses standard library only (no external dependencies like openai/requests).
+Uses standard library only (no external dependencies like openai/requests);
+HTTP goes through the pooled keep-alive transport in src/http_transport.py.
+DOI lookups go through src/crossref.py (bulk queries plus the shared DOI cache).
 """
 
 import os
-import re
-import json
 import time
-import urllib.request
-import urllib.error
 from pathlib import Path
 
+from src import crossref
+from src.scheduler import get_default_scheduler
+from src.http_transport import get_default_transport
+from src.llm_cache import get_default_cache as get_default_llm_cache, LLMCacheMiss
+from src.archive_index import load_archive_index, parse_archive_content
+
 ARCHIVE_DIR = "src/archive"
 REPORT_FILE = "repair_report.json"
 
@@ -32,18 +36,10 @@ if not PPLX_API_KEY:
         except Exception as e:
             print(f"Failed to read .env: {e}")
 
-PPLX_BASE_URL = "https://api.perplexity.ai/chat/completions"
+PPLX_BASE_URL = f"{os.getenv('PPLX_API_BASE', 'https://api.perplexity.ai')}/chat/completions"
 
 def call_perplexity(prompt):
-    """Call Perplexity API using urllib."""
-    if not PPLX_API_KEY:
-        return None
-        
-    headers = {
-        "Authorization": f"Bearer {PPLX_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
+    """Call Perplexity API over the shared transport (responses go through the shared LLM cache)."""
     data = {
         "model": "sonar-pro",
         "messages": [
@@ -53,82 +49,45 @@ def call_perplexity(prompt):
         "temperature": 0.1
     }
     
+    llm_cache = get_default_llm_cache()
+    try:
+        cached = llm_cache.get("perplexity", data["model"], data["temperature"], data["messages"])
+    except LLMCacheMiss as e:
+        print(f"  Perplexity replay miss: {e}")
+        return None
+    if cached is not None:
+        return cached.strip()
+    
+    if not PPLX_API_KEY:
+        return None
+        
+    headers = {
+        "Authorization": f"Bearer {PPLX_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    
     try:
-        req = urllib.request.Request(
-            PPLX_BASE_URL, 
-            data=json.dumps(data).encode('utf-8'),
-            headers=headers,
-            method="POST"
+        response = get_default_scheduler().call(
+            'perplexity', get_default_transport().post, PPLX_BASE_URL,
+            json_body=data, headers=headers, timeout=120
         )
-        with urllib.request.urlopen(req) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return result['choices'][0]['message']['content'].strip()
+        if response.status != 200:
+            print(f"  Perplexity API error: HTTP {response.status}")
+            return None
+        content = response.json()['choices'][0]['message']['content']
+        llm_cache.put("perplexity", data["model"], data["temperature"], data["messages"], content)
+        return content.strip()
     except Exception as e:
         print(f"  Perplexity API error: {e}")
         return None
 
 def parse_archive_file(filepath):
-    """Parse papers from a markdown archive file."""
-    papers = []
-    current_paper = None
-    current_category = "Unknown"
-    
+    """Parse papers with a DOI from a markdown archive file."""
     with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        content = f.read()
     
-    for line in lines:
-        line = line.strip()
-        # Detect category headers
-        if line.startswith('## ') and not line.startswith('## Summary'):
-            if '(' in line and 'papers)' in line:
-                current_category = line[3:].split(' (')[0].strip()
-            else:
-                current_category = line[3:].strip()
-            
-        # Start of a new paper
-        elif line.startswith('### '):
-            if current_paper and current_paper.get('doi'):
-                papers.append(current_paper)
-            current_paper = {
-                'title': line[4:].strip(), 
-                'category': current_category,
-                'source_file': os.path.basename(filepath),
-                'authors': '',
-                'doi': '',
-                'trl': '',
-                'keywords': '',
-                'summary': ''
-            }
-            
-        # Collect metadata
-        if current_paper:
-            if line.startswith('**Authors:**'):
-                current_paper['authors'] = line[12:].strip()
-            elif line.startswith('**DOI:**'):
-                doi = line[8:].strip()
-                # Clean up the DOI
-                doi = re.sub(r'\[?\d+\]?$', '', doi).strip()
-                prefixes = ['https://doi.org/', 'http://doi.org/', 'doi.org/', 'DOI: ', 'doi:']
-                for prefix in prefixes:
-                    if doi.lower().startswith(prefix.lower()):
-                        doi = doi[len(prefix):]
-                current_paper['doi'] = doi.strip()
-            elif line.startswith('**TRL:**'):
-                current_paper['trl'] = line[8:].strip()
-            elif line.startswith('**Keywords:**'):
-                current_paper['keywords'] = line[13:].strip()
-            elif line.startswith('**Summary:**'):
-                current_paper['summary'] = line[12:].strip()
-            elif line and not line.startswith('**') and not line.startswith('###'):
-                # Append to summary if it's a continuation
-                if current_paper.get('summary'):
-                    current_paper['summary'] += " " + line
-    
-    # Add the last paper
-    if current_paper and current_paper.get('doi'):
-        papers.append(current_paper)
-        
-    return papers
+    papers = parse_archive_content(content, os.path.basename(filepath))
+    return [p for p in papers if p['doi']]
 
 def verify_doi(doi):
     """Verify a DOI against CrossRef API. Returns (status, details)."""
@@ -136,44 +95,27 @@ def verify_doi(doi):
         return ("INVALID", "Empty DOI")
     
     # Skip preprints
-    if any(prefix in doi for prefix in ['10.48550/', '10.1101/', 'arXiv']):
+    if crossref.is_preprint(doi):
         return ("PREPRINT", "Preprint - not verified")
     
-    try:
-        url = f"https://api.crossref.org/works/{doi}"
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'DOIVerifier/1.0 (mailto:contact@example.com)'
+    entry = crossref.lookup(doi)
+    if entry['status'] == "VERIFIED":
+        return ("VERIFIED", {
+            'real_title': entry['title'],
+            'real_authors': entry['authors'][:3]
         })
-        
-        with urllib.request.urlopen(req, timeout=10) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode('utf-8'))
-                real_title = data.get('message', {}).get('title', [''])[0]
-                real_authors_list = data.get('message', {}).get('author', [])
-                author_names = [f"{a.get('given', '')} {a.get('family', '')}".strip() for a in real_authors_list[:3]]
-                return ("VERIFIED", {
-                    'real_title': real_title,
-                    'real_authors': ", ".join(author_names)
-                })
-                
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return ("FAKE", "DOI not found in CrossRef")
-    except Exception as e:
-        return ("ERROR", str(e))
-    
-    return ("ERROR", "Unknown error")
+    return (entry['status'], entry['detail'])
 
 def find_correct_doi(paper):
     """Use Perplexity to find the correct DOI."""
-    if not PPLX_API_KEY:
+    if not PPLX_API_KEY and get_default_llm_cache().mode != "replay":
         return None
 
     print(f"  Attempting repair for: {paper['title']}")
     
     prompt = (
         f"Find the correct DOI for the research paper titled: \"{paper['title']}\" "
-        f"by authors: \"{paper['authors']}\". "
+        f"by authors: \"{'; '.join(paper['authors'])}\". "
         "Return ONLY the DOI string (e.g., 10.xxxx/yyyy) or a JSON object with correct info. "
         "If you cannot find the exact paper, return 'NOT FOUND'."
     )
@@ -202,8 +144,16 @@ def main():
         print("WARNING: PPLX_API_KEY not found. Repair functionality disabled.")
     print("=" * 60)
     
-    archive_path = Path(ARCHIVE_DIR)
-    archive_files = sorted(archive_path.glob("papers_*.md"))
+    index = load_archive_index(ARCHIVE_DIR)
+    archive_files = [
+        Path(ARCHIVE_DIR) / name for name in sorted(index.files) if name.startswith("papers_")
+    ]
+    
+    # Resolve every archived DOI in bulk before the per-paper pass
+    crossref.verify_many(
+        p['doi'] for name in index.files if name.startswith("papers_")
+        for p in index.file_papers(name) if p['doi'] and not crossref.is_preprint(p['doi'])
+    )
     
     results = {
         'total': 0,
@@ -215,11 +165,7 @@ def main():
     
     for filepath in archive_files:
         print(f"\nProcessing {filepath.name}...")
-        try:
-            papers = parse_archive_file(filepath)
-        except Exception as e:
-            print(f"Error parsing {filepath.name}: {e}")
-            continue
+        papers = [p for p in index.file_papers(filepath.name) if p['doi']]
 
         valid_papers = []
         
@@ -270,7 +216,8 @@ def main():
                 # Group by category
                 by_category = {}
                 for p in valid_papers:
-                    cat = p['category']
+                    # Papers of a cleaned file stay under "## Verified Papers"
+                    cat = p['category'] or p['section'] or "Unknown"
                     if cat not in by_category:
                         by_category[cat] = []
                     by_category[cat].append(p)
@@ -281,10 +228,10 @@ def main():
                     f.write(f"## {cat} ({len(plist)} papers)\n\n")
                     for p in plist:
                         f.write(f"### {p['title']}\n")
-                        f.write(f"**Authors:** {p['authors']}\n")
+                        f.write(f"**Authors:** {'; '.join(p['authors'])}\n")
                         f.write(f"**DOI:** {p['doi']}\n")
                         f.write(f"**TRL:** {p['trl']}\n")
-                        f.write(f"**Keywords:** {p['keywords']}\n")
+                        f.write(f"**Keywords:** {', '.join(p['keywords'])}\n")
                         f.write(f"**Summary:** {p['summary']}\n\n")
             print(f"  Rewrote {filepath.name} with {len(valid_papers)} papers")
         else:
@@ -0,0 +1,301 @@
+"""
+Persistent index of papers parsed from the markdown files in src/archive.
+
+Every consumer (the monitor, verify_dois.py, repair_archives.py and
+regenerate_site.py) reads archive papers through this module, so they all see
+the same record shape. Parsed results are cached in a JSON index keyed by file
+name, mtime, size and content hash; only files that changed are reparsed.
+Uses only standard library so the stdlib-only scripts can import it.
+
+Paper record shape:
+    title (str), authors (list), doi (str, normalized), trl (str, as written),
+    keywords (list), summary (str), category (str or None), section (str or
+    None), source_file (str), verified_title (str), verified_authors (list)
+
+Only topic headers ("## Soft Robotics (3 papers)") set the category. The
+headers written by the summary and cleanup steps (SECTION_HEADERS) set the
+section instead and leave the category None, so papers under "## Verified
+Papers" fall back to the default category like any uncategorized paper.
+
+Each file entry also keeps the near-duplicate signature of every paper
+(src/near_duplicates.py), so the LSH index over the archive is rebuilt from
+stored band keys instead of rehashing every title.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+
+from src.doi_utils import normalize_doi
+from src.near_duplicates import NearDuplicateIndex, signature
+
+logger = logging.getLogger('literature_monitor')
+
+ARCHIVE_DIR = "src/archive"
+DEFAULT_INDEX_PATH = os.getenv("ARCHIVE_INDEX_PATH", ".cache/archive_index.json")
+
+# Bump when parse_archive_content changes so stale indexes are rebuilt
+PARSER_VERSION = 3
+
+# "## " headers that structure a file rather than name a category
+SECTION_HEADERS = ('Summary', 'Verified Papers', 'Removed Papers', 'Papers Removed')
+
+# Open indexes by (archive_dir, path), shared by everything in the process
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _new_paper(title, category, section, source_file):
+    return {
+        'title': title,
+        'authors': [],
+        'doi': '',
+        'trl': '',
+        'keywords': [],
+        'summary': '',
+        'category': category,
+        'section': section,
+        'source_file': source_file,
+        'verified_title': '',
+        'verified_authors': [],
+    }
+
+
+def parse_archive_content(content, source_file=''):
+    """
+    Parse papers from the content of an archive markdown file.
+
+    Args:
+        content (str): Markdown file content
+        source_file (str): File name recorded on each paper
+
+    Returns:
+        list: Paper records (see module docstring)
+    """
+    papers = []
+    current_paper = None
+    current_category = None
+    current_section = None
+
+    for line in content.split('\n'):
+        line = line.strip()
+
+        # Category headers close the current paper
+        if line.startswith('## '):
+            if current_paper:
+                papers.append(current_paper)
+                current_paper = None
+            if '(' in line and 'papers)' in line:
+                header = line[3:].split(' (')[0].strip()
+            else:
+                header = line[3:].strip()
+            if header.startswith(SECTION_HEADERS):
+                current_section = header
+                current_category = None
+            else:
+                current_section = None
+                current_category = header
+
+        # Start of a new paper
+        elif line.startswith('### '):
+            if current_paper:
+                papers.append(current_paper)
+            current_paper = _new_paper(line[4:].strip(), current_category, current_section, source_file)
+
+        # Paper metadata
+        elif current_paper is None:
+            continue
+        elif line.startswith('**Authors:**'):
+            current_paper['authors'] = [a.strip() for a in line[12:].split('; ') if a.strip()]
+        elif line.startswith('**DOI:**'):
+            current_paper['doi'] = normalize_doi(line[8:].strip())
+        elif line.startswith('**TRL:**'):
+            current_paper['trl'] = line[8:].strip()
+        elif line.startswith('**Keywords:**'):
+            current_paper['keywords'] = [k.strip() for k in line[13:].split(',') if k.strip()]
+        elif line.startswith('**Summary:**'):
+            current_paper['summary'] = line[12:].strip()
+        elif line.startswith('**Verified Title:**'):
+            current_paper['verified_title'] = line[19:].strip()
+        elif line.startswith('**Verified Authors:**'):
+            current_paper['verified_authors'] = [a.strip() for a in line[21:].split(', ') if a.strip()]
+        elif line and current_paper['summary'] and not line.startswith(('**', '#', '---', '|')):
+            # Continuation of a multi-line summary
+            current_paper['summary'] += " " + line
+
+    # Add the last paper
+    if current_paper:
+        papers.append(current_paper)
+
+    return papers
+
+
+def _copy_paper(paper):
+    copied = dict(paper)
+    for field in ('authors', 'keywords', 'verified_authors'):
+        copied[field] = list(paper[field])
+    return copied
+
+
+class ArchiveIndex:
+    """Incrementally maintained index of all papers in the archive directory."""
+
+    def __init__(self, archive_dir=ARCHIVE_DIR, path=DEFAULT_INDEX_PATH):
+        """
+        Args:
+            archive_dir (str): Directory containing the markdown archives
+            path (str): JSON file holding the persisted index, or None to
+                keep it in memory only
+        """
+        self.archive_dir = archive_dir
+        self.path = path
+        self.files = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable archive index {self.path}: {str(e)}")
+            return
+        if stored.get('parser_version') == PARSER_VERSION:
+            self.files = stored.get('files', {})
+
+    def refresh(self):
+        """
+        Reparse archive files that were added or changed since the last refresh.
+
+        Returns:
+            list: Names of the files that were (re)parsed
+        """
+        if not os.path.isdir(self.archive_dir):
+            if self.files:
+                self.files = {}
+                self._dirty = True
+            return []
+
+        reparsed = []
+        present = set()
+        for entry in os.scandir(self.archive_dir):
+            if not entry.is_file() or not entry.name.endswith('.md'):
+                continue
+            present.add(entry.name)
+            stat = entry.stat()
+            cached = self.files.get(entry.name)
+            if cached and cached['mtime'] == stat.st_mtime and cached['size'] == stat.st_size:
+                continue
+
+            with open(entry.path, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.sha1(raw).hexdigest()
+            if cached and cached['sha1'] == digest:
+                # Touched but unchanged: keep the parsed papers
+                cached['mtime'] = stat.st_mtime
+                self._dirty = True
+                continue
+
+            content = raw.decode('utf-8', errors='replace')
+            papers = parse_archive_content(content, entry.name)
+            self.files[entry.name] = {
+                'mtime': stat.st_mtime,
+                'size': stat.st_size,
+                'sha1': digest,
+                'has_removal_log': "Papers Removed" in content,
+                'papers': papers,
+                'signatures': [signature(p['title'], p['authors']) for p in papers],
+            }
+            reparsed.append(entry.name)
+            self._dirty = True
+
+        for name in set(self.files) - present:
+            del self.files[name]
+            self._dirty = True
+
+        return reparsed
+
+    def save(self):
+        """Write the index to disk if it changed."""
+        if not self.path or not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'parser_version': PARSER_VERSION, 'files': self.files}, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def papers(self, prefix='', skip_removal_logs=False):
+        """
+        Get copies of all indexed papers, ordered by file name.
+
+        Args:
+            prefix (str): Only include files whose name starts with this
+            skip_removal_logs (bool): Skip files that record removed papers
+
+        Returns:
+            list: Paper records (safe to modify)
+        """
+        papers = []
+        for name in sorted(self.files):
+            entry = self.files[name]
+            if not name.startswith(prefix):
+                continue
+            if skip_removal_logs and entry['has_removal_log']:
+                continue
+            papers.extend(_copy_paper(p) for p in entry['papers'])
+        return papers
+
+    def near_duplicates(self, prefix=''):
+        """
+        Build a near-duplicate index over the indexed papers.
+
+        Args:
+            prefix (str): Only include files whose name starts with this
+
+        Returns:
+            NearDuplicateIndex: Index populated from the stored signatures
+        """
+        index = NearDuplicateIndex()
+        for name in sorted(self.files):
+            if not name.startswith(prefix):
+                continue
+            entry = self.files[name]
+            for paper, stored in zip(entry['papers'], entry['signatures']):
+                index.add(paper, stored)
+        return index
+
+    def file_papers(self, name):
+        """Get copies of the papers indexed for a single file name."""
+        entry = self.files.get(name)
+        return [_copy_paper(p) for p in entry['papers']] if entry else []
+
+
+def load_archive_index(archive_dir=ARCHIVE_DIR, path=DEFAULT_INDEX_PATH):
+    """
+    Open the index, bring it up to date with the archive and persist it.
+
+    The index is kept for the life of the process, so later calls (the next
+    step of `python -m src.cli run-all`, or generate_site after execute) only
+    rescan file stats and reparse the files written in between.
+    """
+    key = (os.path.abspath(archive_dir), os.path.abspath(path) if path else None)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = ArchiveIndex(archive_dir, path)
+        reparsed = index.refresh()
+        if reparsed:
+            logger.info(f"Archive index: reparsed {len(reparsed)} changed files")
+        try:
+            index.save()
+        except OSError as e:
+            logger.warning(f"Could not persist archive index: {str(e)}")
+    return index
@@ -0,0 +1,162 @@
+"""
+Single entry point for the literature pipeline.
+
+    python -m src.cli monitor       # find, verify, summarize and store new papers
+    python -m src.cli verify        # verify every archived DOI (verify_dois.py)
+    python -m src.cli repair        # fix or drop fake DOIs (repair_archives.py)
+    python -m src.cli cleanup       # rewrite archives from the report (cleanup_archives.py)
+    python -m src.cli regenerate    # rebuild docs/ from verified papers (regenerate_site.py)
+    python -m src.cli run-all       # monitor, verify, repair in one process
+    python -m src.cli run-all --steps verify,cleanup,regenerate
+    python -m src.cli --profile run-all   # also write per-stage profiles (src/profiling.py)
+
+Steps chained in one process share the archive index (each later step only
+rescans file stats and reparses the files the previous step wrote), the DOI
+cache, the pooled HTTP connections and the request scheduler; cleanup takes
+the verification results in memory instead of re-reading the report.
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import contextlib
+
+# Allow `python src/cli.py` as well as `python -m src.cli`; the maintenance
+# scripts live in the repository root
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+logger = logging.getLogger('literature_monitor')
+
+DEFAULT_STEPS = ('monitor', 'verify', 'repair')
+
+
+class RunState:
+    """What one step hands to the next within a process."""
+
+    def __init__(self):
+        # Papers by verification status from the last verify step
+        self.verification = None
+
+
+def run_monitor(state, args):
+    from src.monitor import LiteratureMonitor
+    LiteratureMonitor(model=args.model, provider=args.provider).execute(run_id=args.run_id)
+
+
+def run_verify(state, args):
+    import verify_dois
+    state.verification = verify_dois.main(workers=args.workers)
+
+
+def run_repair(state, args):
+    import repair_archives
+    repair_archives.main()
+
+
+def run_cleanup(state, args):
+    import cleanup_archives
+    report = None
+    if state.verification is not None:
+        import verify_dois
+        report = verify_dois.build_report(state.verification)
+    cleanup_archives.main(report=report)
+
+
+def run_regenerate(state, args):
+    import regenerate_site
+    regenerate_site.main()
+
+
+STEPS = {
+    'monitor': (run_monitor, "find, verify, summarize and store new papers"),
+    'verify': (run_verify, "verify every archived DOI against CrossRef"),
+    'repair': (run_repair, "find correct DOIs for fake ones, drop the rest"),
+    'cleanup': (run_cleanup, "rewrite archives from the verification results"),
+    'regenerate': (run_regenerate, "rebuild docs/ from verified papers"),
+}
+# Steps whose failure stops run-all; the others are best effort, as in the
+# weekly workflow
+REQUIRED_STEPS = {'monitor'}
+
+
+def run_steps(steps, args, profiler=None):
+    """
+    Run steps in order, sharing state between them.
+
+    Args:
+        steps (list): Step names from STEPS
+        args (argparse.Namespace): Parsed command-line options
+        profiler (RunProfiler): Profiles each step as a stage, if given
+
+    Returns:
+        int: Exit code (1 if a required step failed)
+    """
+    state = RunState()
+    failed = []
+    for name in steps:
+        start = time.perf_counter()
+        try:
+            with profiler.stage(name) if profiler else contextlib.nullcontext():
+                STEPS[name][0](state, args)
+        except Exception as e:
+            logger.error(f"Step {name} failed: {str(e)}")
+            if name in REQUIRED_STEPS or len(steps) == 1:
+                return 1
+            failed.append(name)
+        logger.info(f"Step {name} finished in {time.perf_counter() - start:.1f}s")
+    if failed:
+        logger.warning(f"Completed with failed steps: {', '.join(failed)}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Literature monitor and archive maintenance.")
+    parser.add_argument('--model', default="sonar-reasoning-pro", help="monitor model")
+    parser.add_argument('--provider', default="perplexity",
+                        help="monitor provider: perplexity, anthropic, gemini or ollama")
+    parser.add_argument('--workers', type=int, default=3, help="concurrent CrossRef requests for verify")
+    parser.add_argument('--run-id', help="monitor run to start or resume (default: $RUN_ID or a new ID)")
+    parser.add_argument('--profile', action='store_true',
+                        help="write CPU profiles, sampled stacks and allocation snapshots per "
+                             "step and stage (see src/profiling.py)")
+    parser.add_argument('--profile-dir', help="run directory for --profile (default: profiles/<run id>)")
+    parser.add_argument('--profile-no-memory', action='store_true',
+                        help="with --profile, skip allocation tracing (faster, less skewed CPU profiles)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    for name, (_, description) in STEPS.items():
+        commands.add_parser(name, help=description)
+    run_all = commands.add_parser('run-all', help="run several steps in one process")
+    run_all.add_argument('--steps', type=lambda s: [step for step in s.split(',') if step],
+                         default=list(DEFAULT_STEPS),
+                         help=f"comma-separated steps (default: {','.join(DEFAULT_STEPS)})")
+    args = parser.parse_args(argv)
+
+    steps = args.steps if args.command == 'run-all' else [args.command]
+    unknown = set(steps) - set(STEPS)
+    if unknown:
+        parser.error(f"unknown steps: {', '.join(sorted(unknown))}")
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO,
+                            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if not args.profile:
+        return run_steps(steps, args)
+
+    from src.profiling import RunProfiler, PROFILE_DIR
+    from src.run_journal import new_run_id
+    # Name the run directory after the monitor run it profiles
+    args.run_id = args.run_id or os.getenv("RUN_ID") or new_run_id()
+    profiler = RunProfiler(args.profile_dir or os.path.join(PROFILE_DIR, args.run_id),
+                           memory=not args.profile_no_memory).start()
+    try:
+        return run_steps(steps, args, profiler)
+    finally:
+        summary = profiler.stop()
+        logger.info(f"Wrote profiles of {len(summary['stages'])} stages to {summary['directory']}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
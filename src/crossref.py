@@ -0,0 +1,163 @@
+"""
+CrossRef DOI verification shared by the monitor and the maintenance scripts.
+
+Single lookups use GET /works/{doi}. verify_many() resolves many DOIs at once
+with GET /works?filter=doi:A,doi:B,...&select=DOI,title,author and only falls
+back to single lookups when a bulk query cannot be used or fails. Every result
+goes through the shared DOI cache and the scheduler's 'crossref' budget.
+Uses only standard library so the stdlib-only scripts can import it.
+"""
+
+import os
+import logging
+
+from src.doi_cache import get_default_cache, cache_key
+from src.scheduler import get_default_scheduler, RateLimited
+from src.http_transport import get_default_transport, TransportError
+
+logger = logging.getLogger('literature_monitor')
+
+CROSSREF_API_URL = os.getenv("CROSSREF_API_URL", "https://api.crossref.org")
+BULK_SIZE = 50
+PREPRINT_MARKERS = ('10.48550/', '10.1101/', 'arXiv')
+
+
+def is_preprint(doi):
+    """Check whether a DOI belongs to a preprint server (arXiv, bioRxiv/medRxiv)."""
+    return any(marker in doi for marker in PREPRINT_MARKERS)
+
+
+def _author_names(work):
+    return [f"{a.get('given', '')} {a.get('family', '')}".strip() for a in work.get('author', [])]
+
+
+def _entry(doi, status, title='', authors=None, detail=''):
+    return {'doi': cache_key(doi), 'status': status, 'title': title,
+            'authors': authors or [], 'detail': detail}
+
+
+def _get(path, params=None, timeout=15):
+    scheduler = get_default_scheduler()
+    response = scheduler.call('crossref', get_default_transport().get,
+                              f"{CROSSREF_API_URL}{path}", params=params, timeout=timeout)
+    scheduler.limiter('crossref').update_from_headers(response.headers)
+    return response
+
+
+def lookup(doi):
+    """
+    Verify a single DOI, using the cache when possible.
+
+    Args:
+        doi (str): The DOI to verify
+
+    Returns:
+        dict: Entry with doi, status (VERIFIED, FAKE or ERROR), title, authors and detail
+    """
+    cache = get_default_cache()
+    cached = cache.get(doi)
+    if cached:
+        return cached
+
+    try:
+        response = _get(f"/works/{doi}")
+        if response.status == 200:
+            work = response.json().get('message', {})
+            entry = _entry(doi, 'VERIFIED', (work.get('title') or [''])[0], _author_names(work))
+        elif response.status == 404:
+            entry = _entry(doi, 'FAKE', detail="DOI not found in CrossRef")
+        else:
+            entry = _entry(doi, 'ERROR', detail=f"HTTP {response.status}")
+    except (TransportError, RateLimited, ValueError) as e:
+        entry = _entry(doi, 'ERROR', detail=str(e))
+
+    cache.set(doi, entry['status'], entry['title'], entry['authors'], entry['detail'])
+    return entry
+
+
+def _lookup_bulk(dois):
+    """
+    Resolve a chunk of DOIs with one filter query.
+
+    Returns:
+        dict or None: cache key -> entry, or None if the query failed
+    """
+    try:
+        response = _get('/works', params={
+            'filter': ','.join(f"doi:{doi}" for doi in dois),
+            'select': 'DOI,title,author',
+            'rows': len(dois),
+        }, timeout=30)
+    except (TransportError, RateLimited) as e:
+        logger.warning(f"Bulk CrossRef query for {len(dois)} DOIs failed: {str(e)}")
+        return None
+    if response.status != 200:
+        logger.warning(f"Bulk CrossRef query for {len(dois)} DOIs failed (status {response.status})")
+        return None
+    try:
+        items = response.json().get('message', {}).get('items', [])
+    except ValueError:
+        return None
+
+    found = {}
+    for work in items:
+        key = cache_key(work.get('DOI', ''))
+        found[key] = _entry(key, 'VERIFIED', (work.get('title') or [''])[0], _author_names(work))
+
+    # DOIs absent from the results do not exist in CrossRef
+    return {
+        cache_key(doi): found.get(cache_key(doi)) or
+        _entry(doi, 'FAKE', detail="DOI not found in CrossRef")
+        for doi in dois
+    }
+
+
+def verify_many(dois, bulk_size=BULK_SIZE):
+    """
+    Verify many DOIs with as few requests as possible.
+
+    Cached DOIs cost nothing; the rest are resolved in bulk filter queries of
+    up to bulk_size DOIs. DOIs that cannot be expressed in a filter (they
+    contain a comma) or whose bulk query failed are looked up one by one.
+
+    Args:
+        dois (iterable): DOIs to verify (preprints should be filtered out first)
+        bulk_size (int): DOIs per filter query
+
+    Returns:
+        dict: cache key -> entry (see lookup())
+    """
+    cache = get_default_cache()
+    results = {}
+    pending = []
+    fallback = []
+    for doi in dict.fromkeys(d for d in dois if d):
+        key = cache_key(doi)
+        if key in results:
+            continue
+        cached = cache.get(doi)
+        if cached:
+            results[key] = cached
+        elif ',' in doi:
+            fallback.append(doi)
+        else:
+            pending.append(doi)
+
+    for start in range(0, len(pending), bulk_size):
+        chunk = pending[start:start + bulk_size]
+        resolved = _lookup_bulk(chunk)
+        if resolved is None:
+            fallback.extend(chunk)
+            continue
+        for doi in chunk:
+            entry = resolved[cache_key(doi)]
+            cache.set(doi, entry['status'], entry['title'], entry['authors'], entry['detail'])
+            results[cache_key(doi)] = entry
+
+    for doi in fallback:
+        results[cache_key(doi)] = lookup(doi)
+
+    if pending:
+        logger.info(f"Verified {len(pending)} DOIs in {(len(pending) + bulk_size - 1) // bulk_size} "
+                    f"bulk CrossRef queries ({len(fallback)} single lookups)")
+    return results
@@ -0,0 +1,170 @@
+"""
+Persistent DOI verification cache shared by the monitor and the maintenance scripts.
+Uses only standard library (sqlite3) so the stdlib-only scripts can import it.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from src.doi_utils import doi_key
+
+DEFAULT_CACHE_PATH = os.getenv("DOI_CACHE_PATH", ".cache/doi_cache.sqlite")
+
+# Time-to-live per result kind, in seconds
+POSITIVE_TTL = 90 * 24 * 3600   # VERIFIED / PREPRINT: DOIs rarely disappear
+NEGATIVE_TTL = 14 * 24 * 3600   # FAKE: re-check occasionally in case it gets registered
+ERROR_TTL = 3600                # ERROR: transient failures, retry on the next run
+
+STATUSES = ('VERIFIED', 'FAKE', 'PREPRINT', 'ERROR')
+
+
+def cache_key(doi):
+    """
+    Build the cache key for a DOI.
+
+    Args:
+        doi (str): DOI, possibly with URL prefix, citation suffix or mixed case
+
+    Returns:
+        str: Canonical DOI key (see src.doi_utils.doi_key)
+    """
+    return doi_key(doi)
+
+
+class DOICache:
+    """On-disk cache of CrossRef verification results keyed by normalized DOI."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, positive_ttl=POSITIVE_TTL,
+                 negative_ttl=NEGATIVE_TTL, error_ttl=ERROR_TTL):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path (str): SQLite file path
+            positive_ttl (int): Seconds to keep VERIFIED/PREPRINT results
+            negative_ttl (int): Seconds to keep FAKE results
+            error_ttl (int): Seconds to keep ERROR results
+        """
+        self.path = path
+        self.ttls = {
+            'VERIFIED': positive_ttl,
+            'PREPRINT': positive_ttl,
+            'FAKE': negative_ttl,
+            'ERROR': error_ttl,
+        }
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS doi_verification (
+                doi TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                title TEXT,
+                authors TEXT,
+                detail TEXT,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, doi):
+        """
+        Look up a fresh cached result.
+
+        Args:
+            doi (str): The DOI to look up
+
+        Returns:
+            dict or None: Entry with doi, status, title, authors, detail and
+            fetched_at, or None when missing or expired
+        """
+        key = cache_key(doi)
+        if not key:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, title, authors, detail, fetched_at FROM doi_verification WHERE doi = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        status, title, authors, detail, fetched_at = row
+        if time.time() - fetched_at > self.ttls.get(status, 0):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {
+            'doi': key,
+            'status': status,
+            'title': title or '',
+            'authors': json.loads(authors) if authors else [],
+            'detail': detail or '',
+            'fetched_at': fetched_at,
+        }
+
+    def set(self, doi, status, title='', authors=None, detail=''):
+        """
+        Store a verification result.
+
+        Args:
+            doi (str): The verified DOI
+            status (str): One of VERIFIED, FAKE, PREPRINT or ERROR
+            title (str): CrossRef title, if any
+            authors (list): CrossRef author names, if any
+            detail (str): Free-form detail (e.g. error message)
+        """
+        key = cache_key(doi)
+        if not key or status not in STATUSES:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO doi_verification VALUES (?, ?, ?, ?, ?, ?)",
+                (key, status, title or '', json.dumps(authors or []), detail or '', time.time())
+            )
+            self._conn.commit()
+
+    def purge_expired(self):
+        """Delete all expired entries and return how many were removed."""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for status, ttl in self.ttls.items():
+                cursor = self._conn.execute(
+                    "DELETE FROM doi_verification WHERE status = ? AND fetched_at < ?",
+                    (status, now - ttl)
+                )
+                removed += cursor.rowcount
+            self._conn.commit()
+        return removed
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache():
+    """Return the process-wide cache at DEFAULT_CACHE_PATH."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = DOICache()
+        return _default_cache
@@ -0,0 +1,90 @@
+"""
+DOI string cleanup shared by the monitor, the archive index and the scripts.
+
+Every DOI goes through one compiled pattern that strips the URL or 'doi:'
+prefix and any trailing citation markers ([1]) or parenthetical notes
+(journal, year) in a single match. normalize_doi keeps the DOI's case for
+display; doi_key lower-cases it (DOIs are case-insensitive) and is the key
+every dedup set and cache uses, so the same paper is never counted, verified
+or summarized twice because of how it was written.
+Uses only standard library.
+"""
+
+import re
+
+_DOI_PATTERN = re.compile(r"""
+    (?:\s*(?:(?:https?://)?(?:dx\.|www\.)?doi\.org/|doi:))*   # URL or doi: prefixes
+    \s*
+    (?P<doi>.*?)
+    (?:\s*\[\d+\]|\s+\([^)]*\))*                       # [n] citations, (journal, year)
+    \s*$
+""", re.IGNORECASE | re.VERBOSE | re.DOTALL)
+
+
+def _normalize(doi, match=_DOI_PATTERN.match):
+    # Already clean: nothing to strip at either end
+    if doi.startswith('10.') and doi[-1] not in ') ]\t\n':
+        return doi
+    doi = match(doi).group('doi')
+    # Placeholder text like [Not provided in search results]
+    if doi.startswith('[') and doi.endswith(']'):
+        return ""
+    return doi
+
+
+def normalize_doi(doi):
+    """
+    Normalize a DOI by removing any URL prefix, reference numbers, and other artifacts.
+
+    Args:
+        doi (str): The DOI string which may include URL prefix, reference numbers, or other artifacts
+
+    Returns:
+        str: The normalized DOI without URL prefix, reference numbers, or artifacts
+            ("" for placeholders)
+    """
+    if not doi:
+        return doi
+    return _normalize(doi)
+
+
+def doi_key(doi):
+    """
+    Build the canonical key for a DOI, used for deduplication and caching.
+
+    Args:
+        doi (str): DOI in any of the forms normalize_doi accepts (or None)
+
+    Returns:
+        str: Lower-cased normalized DOI ("" for missing or placeholder DOIs)
+    """
+    if not doi:
+        return ''
+    return _normalize(doi).lower()
+
+
+def normalize_many(dois, keys=False):
+    """
+    Normalize a batch of DOIs.
+
+    Repeated inputs (the same DOI across archives, responses and the library)
+    are only normalized once.
+
+    Args:
+        dois (iterable): DOI strings (None and "" are passed through as "")
+        keys (bool): Return doi_key values instead of display forms
+
+    Returns:
+        list: Normalized DOIs (or keys) in input order
+    """
+    done = {}
+    results = []
+    for doi in dois:
+        result = done.get(doi)
+        if result is None:
+            result = _normalize(doi) if doi else ''
+            if keys:
+                result = result.lower()
+            done[doi] = result
+        results.append(result)
+    return results
@@ -0,0 +1,298 @@
+"""
+Pooled keep-alive HTTP transport shared by the monitor and the maintenance scripts.
+
+Connections are kept open per (scheme, host, port) and reused across requests,
+so repeated calls to api.crossref.org or api.perplexity.ai pay the TCP+TLS
+handshake once. Responses are requested gzip-compressed and decoded
+transparently. Uses only standard library (http.client) so the stdlib-only
+scripts can import it.
+
+Proxies are taken from the environment (HTTP_PROXY, HTTPS_PROXY, NO_PROXY, via
+urllib.request.getproxies()): HTTPS requests are tunnelled with CONNECT, plain
+HTTP requests are sent to the proxy with the absolute URL. Redirects are not
+followed; a 3xx response is returned to the caller like any other status.
+"""
+
+import gzip
+import json
+import zlib
+import base64
+import threading
+import http.client
+from urllib.parse import urlsplit, urlencode, unquote
+from urllib.request import getproxies, proxy_bypass_environment
+
+from src.metrics import get_default_metrics
+
+USER_AGENT = "LiteratureMonitor/1.0 (mailto:contact@example.com)"
+DEFAULT_TIMEOUT = 15
+DEFAULT_POOL_SIZE = 4
+
+# Maximum simultaneous connections per host
+POOL_SIZES = {
+    'api.crossref.org': 8,
+    'api.perplexity.ai': 4,
+}
+
+
+class TransportError(Exception):
+    """Raised when a request fails below the HTTP level (DNS, TLS, connection reset...)."""
+
+
+class Response:
+    """A fully read HTTP response."""
+
+    def __init__(self, status, headers, content, url):
+        self.status = status
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def status_code(self):
+        """Alias of status, for code written against requests."""
+        return self.status
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+def _proxy_for(scheme, host, proxies):
+    """
+    Find the proxy to use for an origin.
+
+    Args:
+        scheme (str): 'http' or 'https'
+        host (str): Target host name
+        proxies (dict): Scheme -> proxy URL, as returned by getproxies()
+
+    Returns:
+        tuple or None: (host, port, Proxy-Authorization header or None)
+    """
+    url = proxies.get(scheme)
+    if not url or proxy_bypass_environment(host, proxies):
+        return None
+    if '://' not in url:
+        url = f"http://{url}"
+    parts = urlsplit(url)
+    authorization = None
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        authorization = f"Basic {base64.b64encode(credentials.encode('utf-8')).decode('ascii')}"
+    return parts.hostname, parts.port or 8080, authorization
+
+
+class _HostPool:
+    """Idle connections for one origin plus a cap on connections in use."""
+
+    def __init__(self, scheme, host, port, size, proxy=None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        # (host, port, Proxy-Authorization) from _proxy_for(), or None
+        self.proxy = proxy
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self, timeout, reuse=True):
+        self._slots.acquire()
+        try:
+            return self._connection(timeout, reuse)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _connection(self, timeout, reuse):
+        with self._lock:
+            conn = self._idle.pop() if reuse and self._idle else None
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            if self.proxy is None:
+                conn = cls(self.host, self.port, timeout=timeout)
+            else:
+                proxy_host, proxy_port, authorization = self.proxy
+                conn = cls(proxy_host, proxy_port, timeout=timeout)
+                if self.scheme == 'https':
+                    headers = {'Proxy-Authorization': authorization} if authorization else None
+                    conn.set_tunnel(self.host, self.port, headers=headers)
+        else:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        return conn
+
+    def release(self, conn, reusable):
+        if reusable:
+            with self._lock:
+                self._idle.append(conn)
+        else:
+            conn.close()
+        self._slots.release()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def _decode(content, encoding):
+    encoding = (encoding or '').lower()
+    if encoding == 'gzip':
+        return gzip.decompress(content)
+    if encoding == 'deflate':
+        return zlib.decompress(content)
+    return content
+
+
+class HTTPTransport:
+    """Thread-safe HTTP client with per-host keep-alive connection pools."""
+
+    def __init__(self, pool_sizes=None, default_pool_size=DEFAULT_POOL_SIZE,
+                 timeout=DEFAULT_TIMEOUT, user_agent=USER_AGENT, proxies=None):
+        """
+        Args:
+            pool_sizes (dict): Host -> maximum connections (defaults to POOL_SIZES)
+            default_pool_size (int): Maximum connections for other hosts
+            timeout (float): Default socket timeout in seconds
+            user_agent (str): Default User-Agent header
+            proxies (dict): Scheme -> proxy URL plus 'no' for NO_PROXY hosts
+                (defaults to urllib.request.getproxies(), i.e. the environment)
+        """
+        self.pool_sizes = dict(POOL_SIZES if pool_sizes is None else pool_sizes)
+        self.default_pool_size = default_pool_size
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.proxies = getproxies() if proxies is None else dict(proxies)
+        self.connections_opened = 0
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, scheme, host, port):
+        key = (scheme, host, port)
+        with self._lock:
+            if key not in self._pools:
+                size = self.pool_sizes.get(host, self.default_pool_size)
+                proxy = _proxy_for(scheme, host, self.proxies)
+                self._pools[key] = _HostPool(scheme, host, port, size, proxy)
+            return self._pools[key]
+
+    def request(self, method, url, headers=None, body=None, json_body=None, params=None, timeout=None):
+        """
+        Perform a request, reusing a pooled connection when possible.
+
+        Redirects are not followed.
+
+        Args:
+            method (str): HTTP method
+            url (str): Absolute URL
+            headers (dict): Extra request headers
+            body (bytes): Raw request body
+            json_body: Object to send as a JSON body
+            params (dict): Query string parameters
+            timeout (float): Socket timeout (defaults to the transport's)
+
+        Returns:
+            Response: The response, whatever its status code
+
+        Raises:
+            TransportError: If the request could not be completed
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'https'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        path = parts.path or '/'
+        query = parts.query
+        if params:
+            query = f"{query}&{urlencode(params)}" if query else urlencode(params)
+        if query:
+            path = f"{path}?{query}"
+
+        request_headers = {
+            'User-Agent': self.user_agent,
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        }
+        request_headers.update(headers or {})
+        if json_body is not None:
+            body = json.dumps(json_body).encode('utf-8')
+            request_headers.setdefault('Content-Type', 'application/json')
+
+        pool = self._pool(scheme, parts.hostname, port)
+        if pool.proxy is not None and scheme == 'http':
+            # Plain HTTP through a proxy: absolute URL, credentials per request
+            path = f"http://{parts.netloc.rpartition('@')[2]}{path}"
+            if pool.proxy[2]:
+                request_headers.setdefault('Proxy-Authorization', pool.proxy[2])
+        timeout = timeout or self.timeout
+        # A pooled connection may have been closed by the server; idempotent
+        # requests are retried once on a new connection
+        retry = method in ('GET', 'HEAD')
+        for attempt in range(2):
+            conn = pool.acquire(timeout, reuse=attempt == 0)
+            # Whatever happens (including KeyboardInterrupt or a ValueError
+            # from an invalid header), the pool slot is given back; only a
+            # fully read response leaves the connection reusable
+            reusable = False
+            try:
+                fresh = conn.sock is None
+                if fresh:
+                    with self._lock:
+                        self.connections_opened += 1
+                try:
+                    conn.request(method, path, body=body, headers=request_headers)
+                    raw = conn.getresponse()
+                    content = raw.read()
+                except (OSError, http.client.HTTPException) as e:
+                    if fresh or attempt or not retry:
+                        raise TransportError(f"{method} {url} failed: {e}") from e
+                    continue
+                reusable = not raw.will_close
+            finally:
+                pool.release(conn, reusable)
+            # Wire sizes (compressed body), attributed to the caller's stage
+            metrics = get_default_metrics()
+            metrics.count('bytes_sent', len(body or b''))
+            metrics.count('bytes_received', len(content))
+            try:
+                content = _decode(content, raw.getheader('Content-Encoding'))
+            except (OSError, zlib.error) as e:
+                raise TransportError(f"Could not decode response from {url}: {e}") from e
+            return Response(raw.status, raw.headers, content, url)
+
+    def get(self, url, **kwargs):
+        """Perform a GET request (see request())."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Perform a POST request (see request())."""
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        """Close every idle pooled connection."""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+
+
+_default_transport = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport():
+    """Return the process-wide transport."""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HTTPTransport()
+        return _default_transport
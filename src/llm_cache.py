@@ -0,0 +1,195 @@
+"""
+Content-addressed cache of LLM responses with LRU eviction, a TTL and a strict
+replay mode for offline reruns and benchmarks.
+Uses only standard library so the stdlib-only scripts can import it.
+
+Modes (LLM_CACHE_MODE):
+    readwrite  serve fresh cached responses, record new ones (default)
+    replay     serve recorded responses only; a miss raises LLMCacheMiss
+    off        bypass the cache entirely
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+DEFAULT_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite")
+DEFAULT_MODE = os.getenv("LLM_CACHE_MODE", "readwrite")
+DEFAULT_TTL = int(os.getenv("LLM_CACHE_TTL", 24 * 3600))
+DEFAULT_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+MODES = ('readwrite', 'replay', 'off')
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay mode when no recorded response exists."""
+
+
+def prompt_hash(messages):
+    """Hash a chat message list (order and content sensitive)."""
+    payload = json.dumps(messages, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed LLM response cache."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, mode=DEFAULT_MODE, ttl=DEFAULT_TTL,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            path (str): SQLite file path
+            mode (str): One of readwrite, replay or off
+            ttl (int): Seconds a response stays fresh (ignored in replay mode)
+            max_bytes (int): Size cap; least recently used entries are evicted
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown LLM cache mode '{mode}', expected one of {', '.join(MODES)}")
+        self.path = path
+        self.mode = mode
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        if mode == 'off':
+            return
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                temperature REAL,
+                prompt_hash TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS llm_responses_lru ON llm_responses (last_used_at);
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def key(provider, model, temperature, messages):
+        """Build the cache key for a request."""
+        return hashlib.sha256(
+            f"{provider}\0{model}\0{temperature}\0{prompt_hash(messages)}".encode('utf-8')
+        ).hexdigest()
+
+    def get(self, provider, model, temperature, messages):
+        """
+        Look up a cached response.
+
+        Returns:
+            str or None: The response text, or None on a miss
+
+        Raises:
+            LLMCacheMiss: On a miss in replay mode
+        """
+        if self.mode == 'off':
+            return None
+        cache_key = self.key(provider, model, temperature, messages)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+            fresh = row is not None and (self.mode == 'replay' or now - row[1] <= self.ttl)
+            if fresh:
+                self._conn.execute(
+                    "UPDATE llm_responses SET last_used_at = ? WHERE cache_key = ?",
+                    (now, cache_key)
+                )
+                self._conn.commit()
+
+        if fresh:
+            self.hits += 1
+            return row[0]
+        self.misses += 1
+        if self.mode == 'replay':
+            raise LLMCacheMiss(f"No recorded {provider}/{model} response for this prompt")
+        return None
+
+    def put(self, provider, model, temperature, messages, response):
+        """Record a response (no-op outside readwrite mode)."""
+        if self.mode != 'readwrite' or response is None:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.key(provider, model, temperature, messages), provider, model,
+                 temperature, prompt_hash(messages), response,
+                 len(response.encode('utf-8')), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM llm_responses ORDER BY last_used_at"
+        ).fetchall()
+        doomed = []
+        for cache_key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((cache_key,))
+            total -= size
+        self._conn.executemany("DELETE FROM llm_responses WHERE cache_key = ?", doomed)
+
+    def cached_call(self, provider, model, temperature, messages, call, keep=None):
+        """
+        Return the cached response or compute, record and return it.
+
+        Args:
+            provider (str): Provider name (part of the key)
+            model (str): Model name (part of the key)
+            temperature (float): Sampling temperature (part of the key)
+            messages (list): Chat messages (hashed into the key)
+            call (callable): Zero-argument function performing the real request
+            keep (callable): Called with a new response; returning False
+                skips recording it (e.g. a reply cut off at the token limit)
+
+        Returns:
+            str: Response text
+        """
+        cached = self.get(provider, model, temperature, messages)
+        if cached is not None:
+            return cached
+        response = call()
+        if keep is None or keep(response):
+            self.put(provider, model, temperature, messages, response)
+        return response
+
+    def close(self):
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache():
+    """Return the process-wide cache configured from the LLM_CACHE_* variables."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = LLMCache()
+        return _default_cache
@@ -0,0 +1,258 @@
+"""
+Per-stage run metrics for the literature monitor.
+
+Code under `with metrics.timed('verify_doi'):` counts a call, its latency
+(in a histogram) and an error if it raises. Counters recorded while a stage
+is active on the same thread, like bytes from the HTTP transport, LLM token
+usage, 429/503 throttles from the request scheduler or errors that the code
+handles itself, are attributed to the innermost active stage ("other" when
+there is none). write() saves everything as JSON and in the Prometheus text
+exposition format, so weekly runs can be compared and scraped.
+Uses only standard library so the stdlib-only scripts can import it.
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_PREFIX = 'literature'
+DEFAULT_STAGE = 'other'
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus layout."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def cumulative(self):
+        """
+        Returns:
+            list: (upper bound, observations <= bound) pairs, ending with +Inf
+        """
+        pairs, total = [], 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            pairs.append((bound, total))
+        pairs.append((float('inf'), self.count))
+        return pairs
+
+    def quantile(self, q):
+        """Estimate a quantile as the upper bound of the bucket that contains it."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class MetricsRegistry:
+    """Thread-safe collection of per-stage latencies and counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Objects with stage_entered(stage) and stage_exited(stage) methods,
+        # called on the thread running the stage (see src/profiling.py)
+        self.hooks = []
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded so far and restart the run clock."""
+        with self._lock:
+            self._latency = {}
+            self._counters = {}
+            self._backends = {}
+            self._started = time.time()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current_stage(self):
+        """Return the innermost stage active on this thread, or DEFAULT_STAGE."""
+        stack = self._stack()
+        return stack[-1] if stack else DEFAULT_STAGE
+
+    @contextmanager
+    def timed(self, stage):
+        """
+        Count a call of a stage and record its latency.
+
+        Args:
+            stage (str): Stage name (e.g. 'research', 'verify_doi')
+        """
+        stack = self._stack()
+        stack.append(stage)
+        for hook in self.hooks:
+            hook.stage_entered(stage)
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.count('errors')
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            for hook in reversed(self.hooks):
+                hook.stage_exited(stage)
+            stack.pop()
+            with self._lock:
+                histogram = self._latency.get(stage)
+                if histogram is None:
+                    histogram = self._latency[stage] = Histogram()
+                histogram.observe(elapsed)
+                counters = self._counters.setdefault(stage, {})
+                counters['calls'] = counters.get('calls', 0) + 1
+
+    def count(self, name, value=1, stage=None):
+        """
+        Add to a counter of the current (or given) stage.
+
+        Args:
+            name (str): Counter name (e.g. 'errors', 'bytes_received')
+            value (int): Amount to add
+            stage (str): Stage to attribute it to (defaults to current_stage())
+        """
+        stage = stage or self.current_stage()
+        with self._lock:
+            counters = self._counters.setdefault(stage, {})
+            counters[name] = counters.get(name, 0) + value
+
+    def throttled(self, backend):
+        """Record a 429/503 answer from a backend (and for the current stage)."""
+        self.count('throttled')
+        with self._lock:
+            self._backends[backend] = self._backends.get(backend, 0) + 1
+
+    def snapshot(self, **info):
+        """
+        Build the JSON-serializable view of the metrics.
+
+        Args:
+            **info: Extra top-level fields (e.g. run_id)
+
+        Returns:
+            dict: Run timing, per-stage latency and counters, per-backend throttles
+        """
+        with self._lock:
+            stages = {}
+            for stage in sorted(set(self._counters) | set(self._latency)):
+                entry = {'counters': dict(sorted(self._counters.get(stage, {}).items()))}
+                histogram = self._latency.get(stage)
+                if histogram:
+                    entry['latency'] = {
+                        'count': histogram.count,
+                        'sum_seconds': round(histogram.sum, 6),
+                        'max_seconds': round(histogram.max, 6),
+                        'p50_seconds': round(histogram.quantile(0.5), 6),
+                        'p95_seconds': round(histogram.quantile(0.95), 6),
+                        'buckets': {('+Inf' if bound == float('inf') else str(bound)): count
+                                    for bound, count in histogram.cumulative()},
+                    }
+                stages[stage] = entry
+            return dict(info, **{
+                'timestamp': datetime.now().isoformat(),
+                'duration_seconds': round(time.time() - self._started, 3),
+                'stages': stages,
+                'backends': {name: {'throttled': count} for name, count in sorted(self._backends.items())},
+            })
+
+    def to_prometheus(self, snapshot=None):
+        """
+        Render metrics in the Prometheus text exposition format.
+
+        Args:
+            snapshot (dict): Output of snapshot() (taken now if omitted)
+
+        Returns:
+            str: Exposition text
+        """
+        snapshot = snapshot or self.snapshot()
+        p = METRIC_PREFIX
+        lines = [
+            f"# HELP {p}_run_duration_seconds Wall time from the start of the run to this export.",
+            f"# TYPE {p}_run_duration_seconds gauge",
+            f"{p}_run_duration_seconds {snapshot['duration_seconds']}",
+            f"# HELP {p}_stage_latency_seconds Latency of each instrumented call.",
+            f"# TYPE {p}_stage_latency_seconds histogram",
+        ]
+        for stage, entry in snapshot['stages'].items():
+            latency = entry.get('latency')
+            if not latency:
+                continue
+            for bound, count in latency['buckets'].items():
+                lines.append(f'{p}_stage_latency_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+            lines.append(f'{p}_stage_latency_seconds_sum{{stage="{stage}"}} {latency["sum_seconds"]}')
+            lines.append(f'{p}_stage_latency_seconds_count{{stage="{stage}"}} {latency["count"]}')
+
+        names = sorted({name for entry in snapshot['stages'].values() for name in entry['counters']})
+        for name in names:
+            lines.append(f"# TYPE {p}_stage_{name}_total counter")
+            for stage, entry in snapshot['stages'].items():
+                if name in entry['counters']:
+                    lines.append(f'{p}_stage_{name}_total{{stage="{stage}"}} {entry["counters"][name]}')
+
+        if snapshot['backends']:
+            lines.append(f"# HELP {p}_backend_throttled_total 429/503 answers per backend.")
+            lines.append(f"# TYPE {p}_backend_throttled_total counter")
+            for backend, entry in snapshot['backends'].items():
+                lines.append(f'{p}_backend_throttled_total{{backend="{backend}"}} {entry["throttled"]}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, directory='docs', basename='metrics', **info):
+        """
+        Write <basename>.json and <basename>.prom.
+
+        Args:
+            directory (str): Output directory
+            basename (str): File name without extension
+            **info: Extra top-level JSON fields (e.g. run_id)
+
+        Returns:
+            tuple: Paths of the JSON and Prometheus files
+        """
+        os.makedirs(directory, exist_ok=True)
+        snapshot = self.snapshot(**info)
+        json_path = os.path.join(directory, f"{basename}.json")
+        prom_path = os.path.join(directory, f"{basename}.prom")
+        with open(json_path, 'w') as f:
+            json.dump(snapshot, f, indent=2)
+        with open(prom_path, 'w') as f:
+            f.write(self.to_prometheus(snapshot))
+        return json_path, prom_path
+
+
+_default_metrics = None
+_default_lock = threading.Lock()
+
+
+def get_default_metrics():
+    """Return the process-wide metrics registry."""
+    global _default_metrics
+    with _default_lock:
+        if _default_metrics is None:
+            _default_metrics = MetricsRegistry()
+        return _default_metrics
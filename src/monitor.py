@@ -1,13 +1,28 @@
 import os
 import re
+import sys
 import json
+import asyncio
 import logging
-import requests
+import threading
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
-from openai import OpenAI
-from pyzotero import zotero
-from jinja2 import Environment, FileSystemLoader
+
+# Allow `python src/monitor.py` as well as `python -m src.monitor`
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import crossref
+from src.llm_cache import get_default_cache as get_default_llm_cache
+from src.doi_utils import normalize_doi, doi_key, normalize_many
+from src.archive_index import load_archive_index, parse_archive_content
+from src.site_builder import build_site
+from src.response_parser import ResponseParser, PackedResponseParser, parse_response
+from src.pipeline import Stage, run_pipeline
+from src.scheduler import get_default_scheduler
+from src.zotero_store import ZoteroWriteBuffer, CollectionCache, LibraryMirror
+from src.run_journal import RunJournal, new_run_id
+from src.metrics import get_default_metrics
+from src import query_planner
 
 # Setup logging
 logging.basicConfig(
@@ -19,6 +34,23 @@ logger = logging.getLogger('literature_monitor')
 class LiteratureMonitor:
     """Monitor biorobotics literature and add new papers to Zotero library."""
     
+    # Concurrency limit for each stage of the execute() pipeline
+    STAGE_CONCURRENCY = {
+        'query': 8,
+        'parse': 1,
+        'verify': 4,
+        'summarize': 4,
+        'save': 1,
+    }
+    PIPELINE_QUEUE_SIZE = 32
+    # Papers summarized per LLM request (1 disables batching)
+    SUMMARY_BATCH_SIZE = 8
+    # Stream research replies so each paper enters the pipeline as soon as
+    # its block is complete
+    STREAM_RESPONSES = True
+    # Ask for several search terms per research request (src/query_planner.py)
+    PACK_SEARCH_TERMS = True
+    
     def __init__(self, model="sonar-reasoning-pro", provider="perplexity"):
         """
         Initialize the literature monitor.
@@ -38,29 +70,94 @@ class LiteratureMonitor:
             
         self._check_environment(required_vars)
         
-        self.client = self._get_client(provider)
+        self.provider = provider
         self.model = model
+        self.llm_cache = get_default_llm_cache()
+        self.scheduler = get_default_scheduler()
+        self.metrics = get_default_metrics()
+        
+        # The provider SDK, the Zotero connection and the template engine are
+        # set up on first use, so paths that never touch them start fast
+        self._client = None
+        self._zot = None
+        self._template_env = None
+        self._setup_lock = threading.Lock()
+        # RunJournal of the current execute() call
+        self.journal = None
         
+        # Read search terms from search_terms.txt
+        with open('search_terms.txt', 'r') as f:
+            self.search_terms = [line.strip() for line in f if line.strip()]
+
+    @property
+    def client(self):
+        """LLM client for self.provider, created on first use."""
+        if self._client is None:
+            with self._setup_lock:
+                if self._client is None:
+                    self._client = self._get_client(self.provider)
+        return self._client
+
+    @property
+    def zot(self):
+        """Zotero connection, opened on first use."""
+        self._ensure_zotero()
+        return self._zot
+
+    @property
+    def collections(self):
+        """CollectionCache for the Zotero library."""
+        self._ensure_zotero()
+        return self._collections
+
+    @property
+    def zotero_buffer(self):
+        """ZoteroWriteBuffer batching item creation."""
+        self._ensure_zotero()
+        return self._zotero_buffer
+
+    @property
+    def library_mirror(self):
+        """LibraryMirror of the Zotero library's DOIs."""
+        self._ensure_zotero()
+        return self._library_mirror
+
+    @property
+    def template_env(self):
+        """Jinja2 environment for src/templates, created on first use."""
+        if self._template_env is None:
+            from jinja2 import Environment, FileSystemLoader
+            self._template_env = Environment(loader=FileSystemLoader('src/templates'))
+        return self._template_env
+
+    def _ensure_zotero(self):
+        if self._zot is None:
+            with self._setup_lock:
+                if self._zot is None:
+                    self._connect_zotero()
+
+    def _connect_zotero(self):
+        """Connect to Zotero and set up the helpers that use the connection."""
+        from pyzotero import zotero
         try:
-            self.zot = zotero.Zotero(
+            zot = zotero.Zotero(
                 os.getenv("ZOTERO_USER_ID"),
                 'user',
                 os.getenv("ZOTERO_API_KEY")
             )
-            # Test connection
-            self.zot.collections()
+            # Point at a different Zotero API server (e.g. a local stand-in)
+            if os.getenv("ZOTERO_API_URL"):
+                zot.endpoint = os.getenv("ZOTERO_API_URL")
+            # Loading the collection map also tests the connection
+            collections = CollectionCache(zot)
+            collections.load()
         except Exception as e:
             logger.error(f"Failed to connect to Zotero: {str(e)}")
             raise
-        
-        # Read search terms from search_terms.txt
-        with open('search_terms.txt', 'r') as f:
-            self.search_terms = [line.strip() for line in f if line.strip()]
-
-        # Setup template engine
-        self.template_env = Environment(
-            loader=FileSystemLoader('src/templates')
-        )
+        self._collections = collections
+        self._zotero_buffer = ZoteroWriteBuffer(zot)
+        self._library_mirror = LibraryMirror(zot)
+        self._zot = zot
 
     def _check_environment(self, required_vars):
         """Check if all required environment variables are set."""
@@ -80,21 +177,26 @@ class LiteratureMonitor:
         Returns:
             The initialized client
         """
+        # SDKs are imported here so only the selected provider's is loaded.
+        # SDK-level retries are disabled so 429s reach the request scheduler
         try:
             if provider == "anthropic":
                 from anthropic import Anthropic
-                return Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-            elif provider == "ollama":
-                return OpenAI(base_url="http://localhost:11434/v1")
+                return Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), max_retries=0)
+            from openai import OpenAI
+            if provider == "ollama":
+                return OpenAI(base_url="http://localhost:11434/v1", max_retries=0)
             elif provider == "gemini":
                 return OpenAI(
                     api_key=os.getenv("GEMINI_API_KEY"),
-                    base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+                    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+                    max_retries=0
                 )
             else:
                 return OpenAI(
                     api_key=os.getenv("PPLX_API_KEY"),
-                    base_url="https://api.perplexity.ai"
+                    base_url=os.getenv("PPLX_API_BASE", "https://api.perplexity.ai"),
+                    max_retries=0
                 )
         except Exception as e:
             logger.error(f"Failed to initialize {provider} client: {str(e)}")
@@ -107,29 +209,9 @@ class LiteratureMonitor:
         Returns:
             list: All historical papers found in archive files
         """
-        all_papers = []
-        archive_dir = 'src/archive'
-        
-        if not os.path.exists(archive_dir):
-            return all_papers
-            
-        # Find all markdown files in the archive directory
-        archive_files = [f for f in os.listdir(archive_dir) if f.endswith('.md')]
-        
-        for filename in archive_files:
-            try:
-                filepath = os.path.join(archive_dir, filename)
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                    
-                # Parse papers from the markdown file
-                papers = self._parse_archive_markdown(content)
-                all_papers.extend(papers)
-                
-            except Exception as e:
-                logger.error(f"Failed to load papers from {filename}: {str(e)}")
-                
-        return all_papers
+        with self.metrics.timed('load_archives'):
+            index = load_archive_index()
+            return [self._from_archive_record(record) for record in index.papers()]
 
     def _parse_archive_markdown(self, content):
         """
@@ -141,41 +223,31 @@ class LiteratureMonitor:
         Returns:
             list: Extracted paper dictionaries
         """
-        papers = []
-        current_paper = None
-        current_category = "General Biorobotics"
+        return [self._from_archive_record(record) for record in parse_archive_content(content)]
+
+    def _from_archive_record(self, record):
+        """
+        Convert an archive index record into the paper shape used by the monitor.
         
-        for line in content.split('\n'):
-            # Detect category headers
-            if line.startswith('## ') and ' papers)' in line:
-                current_category = line[3:].split(' (')[0].strip()
-                
-            # Start of a new paper
-            elif line.startswith('### '):
-                if current_paper:
-                    papers.append(current_paper)
-                current_paper = {'title': line[4:].strip(), 'category': current_category}
-                
-            # Paper metadata
-            elif current_paper and line.startswith('**Authors:**'):
-                current_paper['authors'] = line[12:].strip().split('; ')
-            elif current_paper and line.startswith('**DOI:**'):
-                current_paper['doi'] = self._normalize_doi(line[8:].strip())
-            elif current_paper and line.startswith('**TRL:**'):
-                try:
-                    current_paper['trl'] = int(line[8:].strip())
-                except ValueError:
-                    current_paper['trl'] = 1
-            elif current_paper and line.startswith('**Keywords:**'):
-                current_paper['keywords'] = [k.strip() for k in line[13:].split(',')]
-            elif current_paper and line.startswith('**Summary:**'):
-                current_paper['summary'] = line[12:].strip()
-        
-        # Add the last paper if there is one
-        if current_paper:
-            papers.append(current_paper)
-            
-        return papers
+        Args:
+            record (dict): Record from src/archive_index.py
+            
+        Returns:
+            dict: Paper metadata
+        """
+        try:
+            trl = int(record['trl'])
+        except ValueError:
+            trl = 1
+        return {
+            'title': record['title'],
+            'category': record['category'] or "General Biorobotics",
+            'authors': record['authors'],
+            'doi': record['doi'],
+            'trl': trl,
+            'keywords': record['keywords'],
+            'summary': record['summary'],
+        }
 
     def _categorize(self, paper):
         """
@@ -205,6 +277,167 @@ class LiteratureMonitor:
         # Default category
         return 'General Biorobotics'
 
+    def _chat(self, messages, temperature, max_tokens, on_text=None, on_finish=None):
+        """
+        Send a chat completion request through the LLM response cache and
+        the provider's request scheduler (which retries 429/503 responses).
+        
+        Args:
+            messages (list): Chat messages
+            temperature (float): Sampling temperature
+            max_tokens (int): Completion token limit
+            on_text (callable): Receives the reply in pieces as it is generated.
+                Replies are streamed when STREAM_RESPONSES is set and the
+                provider supports it; cached or non-streamed replies are
+                passed in one piece.
+            on_finish (callable): Called once the reply is complete with True
+                if it stopped at the token limit. Such replies are not cached,
+                so a cached reply always finished normally.
+            
+        Returns:
+            str: The response text
+        """
+        stream = on_text is not None and self.STREAM_RESPONSES and self.provider != "anthropic"
+        streamed = False
+        called = False
+        usage = None
+        truncated = False
+        
+        def stopped_at_limit(reason):
+            # OpenAI-compatible finish_reason, or Anthropic's stop_reason
+            return reason in ('length', 'max_tokens')
+        
+        def consume_stream():
+            nonlocal usage, truncated
+            pieces = []
+            # The scheduler slot covers opening the stream (where 429/503 are
+            # raised) but not reading it: on_text may block on a full pipeline
+            # queue that only stages needing this backend's slots can drain
+            chunks = self.scheduler.call(
+                self.provider,
+                self.client.chat.completions.create,
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            for chunk in chunks:
+                # Providers that report usage while streaming attach it to chunks
+                usage = getattr(chunk, 'usage', None) or usage
+                if chunk.choices and stopped_at_limit(chunk.choices[0].finish_reason):
+                    truncated = True
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    pieces.append(text)
+                    on_text(text)
+            return ''.join(pieces)
+        
+        def call():
+            nonlocal streamed, called, usage, truncated
+            called = True
+            if stream:
+                content = consume_stream()
+                streamed = True
+            else:
+                response = self.scheduler.call(
+                    self.provider,
+                    self.client.chat.completions.create,
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+                content = response.choices[0].message.content
+                usage = getattr(response, 'usage', None)
+                truncated = (stopped_at_limit(response.choices[0].finish_reason)
+                             or stopped_at_limit(getattr(response, 'stop_reason', None)))
+            # The SDKs do not use src.http_transport, so payload sizes stand
+            # in for bytes on the wire
+            self.metrics.count('llm_requests')
+            self.metrics.count('bytes_sent', len(json.dumps(messages).encode('utf-8')))
+            self.metrics.count('bytes_received', len((content or '').encode('utf-8')))
+            if usage is not None:
+                self.metrics.count('llm_prompt_tokens', getattr(usage, 'prompt_tokens', 0) or 0)
+                self.metrics.count('llm_completion_tokens', getattr(usage, 'completion_tokens', 0) or 0)
+            return content
+        
+        content = self.llm_cache.cached_call(self.provider, self.model, temperature, messages, call,
+                                             keep=lambda response: not truncated)
+        if not called:
+            self.metrics.count('llm_cache_hits')
+        if truncated:
+            self.metrics.count('llm_truncated')
+        if on_text is not None and not streamed:
+            on_text(content)
+        if on_finish is not None:
+            on_finish(truncated)
+        return content
+
+    def _research_messages(self, term):
+        """
+        Build the chat messages asking for papers on a search term.
+        
+        Args:
+            term (str): The search term
+            
+        Returns:
+            list: Chat messages
+        """
+        return [{
+            "role": "user",
+            "content": f"""Provide recent peer-reviewed papers about {term} 
+            in biomedical engineering and robotics. Include DOI (without URL prefix), TRL (1-9), and technical 
+            keywords. Format:
+            Title: [Title]
+            Authors: [Author1; Author2; Author3]
+            DOI: [DOI number only, e.g., 10.1234/example]
+            TRL: [Number]
+            Keywords: [Keyword1, Keyword2]
+            
+            IMPORTANT: 
+            - Provide actual author names, not placeholders like "Not specified" or "See article"
+            - Provide only the DOI number (e.g., 10.1234/example), not the full URL
+            - Skip papers where author information is unavailable"""
+        }]
+
+    def _packed_research_messages(self, terms):
+        """
+        Build the chat messages asking for papers on several search terms at once.
+        
+        Args:
+            terms (list): The search terms, numbered in this order
+            
+        Returns:
+            list: Chat messages
+        """
+        topics = "\n".join(f"            {i}. {term}" for i, term in enumerate(terms, 1))
+        return [{
+            "role": "user",
+            "content": f"""Provide recent peer-reviewed papers about each of these {len(terms)} topics
+            in biomedical engineering and robotics:
+{topics}
+            
+            Include DOI (without URL prefix), TRL (1-9), and technical keywords. Give each
+            topic its own section, in the order above, and end with === END ===. Format:
+            === TERM 1: [Topic] ===
+            Title: [Title]
+            Authors: [Author1; Author2; Author3]
+            DOI: [DOI number only, e.g., 10.1234/example]
+            TRL: [Number]
+            Keywords: [Keyword1, Keyword2]
+            
+            === TERM 2: [Topic] ===
+            ...
+            === END ===
+            
+            IMPORTANT: 
+            - Provide actual author names, not placeholders like "Not specified" or "See article"
+            - Provide only the DOI number (e.g., 10.1234/example), not the full URL
+            - Skip papers where author information is unavailable
+            - List each paper under one topic only"""
+        }]
+
     def _deep_research_query(self, term):
         """
         Query the AI provider for papers on a specific term.
@@ -215,79 +448,135 @@ class LiteratureMonitor:
         Returns:
             tuple: (search_term, AI-generated research results)
         """
-        try:
-            logger.info(f"Researching term: {term}")
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{
-                    "role": "user",
-                    "content": f"""Provide recent peer-reviewed papers about {term} 
-                    in biomedical engineering and robotics. Include DOI (without URL prefix), TRL (1-9), and technical 
-                    keywords. Format:
-                    Title: [Title]
-                    Authors: [Author1; Author2; Author3]
-                    DOI: [DOI number only, e.g., 10.1234/example]
-                    TRL: [Number]
-                    Keywords: [Keyword1, Keyword2]
-                    
-                    IMPORTANT: 
-                    - Provide actual author names, not placeholders like "Not specified" or "See article"
-                    - Provide only the DOI number (e.g., 10.1234/example), not the full URL
-                    - Skip papers where author information is unavailable"""
-                }],
-                temperature=0.2,
-                max_tokens=2000
-            )
-            # Return both the term and the response content
-            return (term, response.choices[0].message.content)
-        except Exception as e:
-            logger.error(f"API request failed: {str(e)}")
-            return (term, "")  # Return empty string to handle gracefully
+        with self.metrics.timed('research'):
+            try:
+                logger.info(f"Researching term: {term}")
+                content = self._chat(
+                    messages=self._research_messages(term),
+                    temperature=0.2,
+                    max_tokens=2000
+                )
+                self.metrics.count('terms')
+                # Return both the term and the response content
+                return (term, content)
+            except Exception as e:
+                self.metrics.count('errors')
+                logger.error(f"API request failed: {str(e)}")
+                return (term, "")  # Return empty string to handle gracefully
+
+    def _stream_research_query(self, term, on_paper):
+        """
+        Query the AI provider for papers on a term, handing each paper over
+        as soon as its block is complete instead of after the whole reply.
+        
+        Args:
+            term (str): The search term
+            on_paper (callable): Called with each parsed (not yet validated) paper
+            
+        Returns:
+            str: The complete reply, or None if the request failed
+        """
+        parser = ResponseParser(on_paper=on_paper)
+        with self.metrics.timed('research'):
+            try:
+                logger.info(f"Researching term (streaming): {term}")
+                content = self._chat(
+                    messages=self._research_messages(term),
+                    temperature=0.2,
+                    max_tokens=2000,
+                    on_text=parser.feed
+                )
+                parser.close()
+                self.metrics.count('terms')
+                return content
+            except Exception as e:
+                self.metrics.count('errors')
+                logger.error(f"API request failed after {len(parser.papers)} papers: {str(e)}")
+                return None
+
+    def _research_pack(self, terms, on_paper):
+        """
+        Query the AI provider for papers on several terms in one request.
+        
+        Papers are handed over as soon as their block is complete, whether or
+        not their term's section turns out to be complete. Sections are only
+        incomplete when the reply stopped at the token limit.
+        
+        Args:
+            terms (list): The search terms
+            on_paper (callable): Called as on_paper(term, paper) with each
+                parsed (not yet validated) paper
+            
+        Returns:
+            dict: term -> section text for the terms whose section was
+                complete, or None if the request failed
+        """
+        parser = PackedResponseParser(terms, on_paper=on_paper)
+        with self.metrics.timed('research'):
+            try:
+                logger.info(f"Researching {len(terms)} terms: {'; '.join(terms)}")
+                self._chat(
+                    messages=self._packed_research_messages(terms),
+                    temperature=0.2,
+                    max_tokens=query_planner.max_tokens(len(terms)),
+                    on_text=parser.feed,
+                    on_finish=parser.finish
+                )
+                sections = parser.sections()
+                self.metrics.count('terms', len(terms))
+                self.metrics.count('truncated_terms', len(terms) - len(sections))
+                return sections
+            except Exception as e:
+                self.metrics.count('errors')
+                logger.error(f"API request for {len(terms)} terms failed: {str(e)}")
+                return None
             
     def _save_to_zotero(self, paper):
         """
-        Save a paper to the Zotero library.
+        Queue a paper for saving to the Zotero library.
+        
+        Items are written in batches by self.zotero_buffer; the paper gets a
+        'zotero_key' (or 'zotero_error') once its batch is flushed.
         
         Args:
             paper (dict): Paper metadata
         """
-        try:
-            # Parse authors more robustly
-            creators = []
-            for author in paper['authors']:
-                parts = author.split()
-                if len(parts) > 1:
-                    creators.append({
-                        'creatorType': 'author', 
-                        'firstName': ' '.join(parts[:-1]), 
-                        'lastName': parts[-1]
-                    })
-                else:
-                    creators.append({
-                        'creatorType': 'author',
-                        'lastName': author,
-                        'firstName': ''
-                    })
-            
-            # Get or create collection
-            category_name = self._categorize(paper)
-            collection_id = self._get_or_create_collection(category_name)
-            
-            # Create item
-            result = self.zot.create_items([{
-                'itemType': 'journalArticle',
-                'title': paper['title'],
-                'creators': creators,
-                'DOI': paper['doi'],
-                'tags': [{'tag': k} for k in paper['keywords']],
-                'collections': [collection_id] if collection_id else [],
-                'extra': f"TRL: {paper['trl']} | Added: {datetime.now().isoformat()}"
-            }])
-            logger.info(f"Added paper to Zotero: {paper['title']}")
-            return result
-        except Exception as e:
-            logger.error(f"Failed to save paper to Zotero: {str(e)}")
-            return None
+        with self.metrics.timed('zotero_save'):
+            try:
+                # Parse authors more robustly
+                creators = []
+                for author in paper['authors']:
+                    parts = author.split()
+                    if len(parts) > 1:
+                        creators.append({
+                            'creatorType': 'author', 
+                            'firstName': ' '.join(parts[:-1]), 
+                            'lastName': parts[-1]
+                        })
+                    else:
+                        creators.append({
+                            'creatorType': 'author',
+                            'lastName': author,
+                            'firstName': ''
+                        })
+            
+                # Get or create collection
+                category_name = self._categorize(paper)
+                collection_id = self._get_or_create_collection(category_name)
+            
+                # Queue item; the buffer creates it in the next batch
+                self.zotero_buffer.add({
+                    'itemType': 'journalArticle',
+                    'title': paper['title'],
+                    'creators': creators,
+                    'DOI': paper['doi'],
+                    'tags': [{'tag': k} for k in paper['keywords']],
+                    'collections': [collection_id] if collection_id else [],
+                    'extra': f"TRL: {paper['trl']} | Added: {datetime.now().isoformat()}"
+                }, paper)
+            except Exception as e:
+                self.metrics.count('errors')
+                logger.error(f"Failed to save paper to Zotero: {str(e)}")
 
     def _get_or_create_collection(self, category_name):
         """
@@ -300,62 +589,24 @@ class LiteratureMonitor:
             str: The collection ID
         """
         try:
-            collections = self.zot.collections()
-            
-            # Look for existing collection
-            for collection in collections:
-                if collection['data']['name'] == category_name:
-                    return collection['key']
-            
-            # Create new collection if not found
-            result = self.zot.create_collections([{'name': category_name}])
-            if result and 'successful' in result and result['successful']:
-                return result['successful']['0']
-            
-            # Return None if we couldn't create or find collection
-            return None
+            return self.collections.get_or_create(category_name)
         except Exception as e:
             logger.error(f"Error with Zotero collection: {str(e)}")
             return None
 
-    def _parse_response(self, content):
-        papers = []
-        current = {}
-        
-        for line in content.split('\n'):
-            if line.startswith('Title:'):
-                if current.get('title'):  # We've hit a new paper
-                    papers.append(current)
-                    current = {}
-                current['title'] = line[6:].strip()
-            elif line.startswith('Authors:'):
-                current['authors'] = line[8:].strip().split('; ')
-            elif line.startswith('DOI:'):
-                current['doi'] = self._normalize_doi(line[4:].strip())
-            elif line.startswith('TRL:'):
-                # Extract the first number found or default to 5
-                trl_text = line[4:].strip()
-                try:
-                    # Try direct conversion first
-                    current['trl'] = int(trl_text)
-                except ValueError:
-                    # Look for any numbers in the string
-                    numbers = re.findall(r'\d+', trl_text)
-                    if numbers:
-                        # Use the first number found
-                        current['trl'] = int(numbers[0])
-                    else:
-                        # Default to 5 (middle of the TRL scale)
-                        current['trl'] = 5
-                        logger.warning(f"Could not parse TRL value '{trl_text}', defaulting to 5")
-            elif line.startswith('Keywords:'):
-                current['keywords'] = [k.strip() for k in line[9:].split(',')]
-                
-        # Add the last paper if not already added
-        if current.get('title'):
-            papers.append(current)
-                
-        return [p for p in papers if self._validate(p)]
+    def _parse_response(self, content, verify=True):
+        """
+        Parse papers from an AI research response.
+        
+        Args:
+            content (str): Raw response text
+            verify (bool): Also check DOIs against CrossRef (see _verify_paper)
+            
+        Returns:
+            list: Valid paper dictionaries
+        """
+        papers = parse_response(content)
+        return [p for p in papers if self._validate(p, verify=verify)]
 
     def _normalize_doi(self, doi):
         """
@@ -367,38 +618,15 @@ class LiteratureMonitor:
         Returns:
             str: The normalized DOI without URL prefix, reference numbers, or artifacts
         """
-        if not doi:
-            return doi
-        
-        # Remove common URL prefixes
-        doi = doi.strip()
-        prefixes = ['https://doi.org/', 'http://doi.org/', 'doi.org/', 'DOI: ', 'doi:']
-        for prefix in prefixes:
-            if doi.startswith(prefix):
-                doi = doi[len(prefix):]
-            elif doi.lower().startswith(prefix.lower()):
-                doi = doi[len(prefix):]
-        
-        # Remove reference numbers like [1], [2], [3], etc.
-        doi = re.sub(r'\[\d+\]$', '', doi)
-        
-        # Remove parenthetical information at the end (e.g., journal names, dates)
-        # Only if it's at the very end and in parentheses
-        doi = re.sub(r'\s*\([^)]*\)\s*\[\d+\]$', '', doi)
-        doi = re.sub(r'\s*\([^)]*\)$', '', doi)
-        
-        # Remove placeholder text if present
-        if doi.startswith('[') and doi.endswith(']'):
-            return ""  # Return empty string for placeholder DOIs like [Not provided in search results]
-        
-        return doi.strip()
+        return normalize_doi(doi)
 
-    def _validate(self, paper):
+    def _validate(self, paper, verify=True):
         """
         Validate that a paper has all required fields and valid data.
         
         Args:
             paper (dict): Paper metadata
+            verify (bool): Also check the DOI against CrossRef
             
         Returns:
             bool: True if paper is valid
@@ -438,15 +666,45 @@ class LiteratureMonitor:
                     logger.warning(f"Rejecting paper with invalid author: {paper.get('title', 'Unknown')}")
                     return False
         
-        # Verify DOI exists in CrossRef (skip for preprints like arXiv/bioRxiv)
+        if verify:
+            return self._verify_paper(paper)
+        
+        return True
+
+    def _verify_paper(self, paper):
+        """
+        Check a paper's DOI against CrossRef (preprints like arXiv/bioRxiv are skipped).
+        
+        Args:
+            paper (dict): Paper metadata
+            
+        Returns:
+            bool: True if the DOI is verified or belongs to a preprint server
+        """
         doi = paper.get('doi', '')
-        if doi and not any(prefix in doi for prefix in ['10.48550/', '10.1101/']):
+        if doi and not crossref.is_preprint(doi):
             if not self._verify_doi(doi):
                 logger.warning(f"Rejecting paper with unverified DOI: {paper.get('title', 'Unknown')}")
                 return False
         
         return True
 
+    def _verify_papers(self, papers):
+        """
+        Verify several papers, resolving their DOIs in bulk CrossRef queries.
+        
+        Args:
+            papers (list): Paper metadata dictionaries
+            
+        Returns:
+            list: The papers whose DOIs are verified or belong to preprints
+        """
+        with self.metrics.timed('verify_bulk'):
+            crossref.verify_many(
+                p['doi'] for p in papers if p.get('doi') and not crossref.is_preprint(p['doi'])
+            )
+        return [paper for paper in papers if self._verify_paper(paper)]
+
     def _verify_doi(self, doi):
         """
         Verify that a DOI exists by checking against CrossRef API.
@@ -460,59 +718,54 @@ class LiteratureMonitor:
         if not doi:
             return False
         
-        try:
-            url = f"https://api.crossref.org/works/{doi}"
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'LiteratureMonitor/1.0 (mailto:contact@example.com)'
-            })
-            if response.status_code == 200:
+        with self.metrics.timed('verify_doi'):
+            entry = crossref.lookup(doi)
+            if entry['status'] == 'VERIFIED':
                 logger.info(f"DOI verified: {doi}")
                 return True
-            else:
-                logger.warning(f"DOI verification failed (status {response.status_code}): {doi}")
-                return False
-        except requests.RequestException as e:
-            logger.warning(f"DOI verification request failed for {doi}: {str(e)}")
+            if entry['status'] == 'ERROR':
+                # Not answered (network, throttling); FAKE is a normal outcome
+                self.metrics.count('errors')
+            logger.warning(f"DOI verification failed ({entry['detail']}): {doi}")
             return False
 
     def generate_site(self, new_papers):
         """Generate the HTML site with all papers."""
-        try:
-            os.makedirs('docs', exist_ok=True)
-            
-            # Load historical papers from archives
-            historical_papers = self.load_papers_from_archives()
-            
-            # Combine with new papers
-            all_papers = historical_papers + new_papers
-            
-            # Remove duplicates based on DOI
-            unique_papers = []
-            seen_dois = set()
-            for paper in all_papers:
-                if paper.get('doi') and paper['doi'].lower() not in seen_dois:
-                    unique_papers.append(paper)
-                    seen_dois.add(paper['doi'].lower())
-            
-            # Add category to each paper before rendering
-            for paper in unique_papers:
-                if 'category' not in paper:
-                    paper['category'] = self._categorize(paper)
-            
-            # Use the Jinja2 template
-            template = self.template_env.get_template('index.html')
-            
-            with open('docs/index.html', 'w') as f:
-                f.write(template.render(
-                    papers=unique_papers,
-                    updated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        with self.metrics.timed('generate_site'):
+            try:
+                os.makedirs('docs', exist_ok=True)
+            
+                # Load historical papers from archives
+                historical_papers = self.load_papers_from_archives()
+            
+                # Combine with new papers
+                all_papers = historical_papers + new_papers
+            
+                # Remove duplicates based on the canonical DOI key
+                unique_papers = []
+                seen_dois = set()
+                keys = normalize_many((paper.get('doi') for paper in all_papers), keys=True)
+                for paper, key in zip(all_papers, keys):
+                    if key and key not in seen_dois:
+                        unique_papers.append(paper)
+                        seen_dois.add(key)
+            
+                # Add category to each paper before rendering
+                for paper in unique_papers:
+                    if 'category' not in paper:
+                        paper['category'] = self._categorize(paper)
+            
+                # Write the JSON data shards and render the page shell
+                build_site(
+                    unique_papers,
                     count=len(new_papers),  # Only count new papers in the update message
-                    total=len(unique_papers)  # Total papers displayed
-                ))
+                    template_env=self.template_env
+                )
             
-            logger.info(f"Generated site with {len(new_papers)} new papers and {len(unique_papers)} total papers")
-        except Exception as e:
-            logger.error(f"Failed to generate site: {str(e)}")
+                logger.info(f"Generated site with {len(new_papers)} new papers and {len(unique_papers)} total papers")
+            except Exception as e:
+                self.metrics.count('errors')
+                logger.error(f"Failed to generate site: {str(e)}")
             
     def _generate_paper_summary(self, paper):
         """
@@ -524,8 +777,9 @@ class LiteratureMonitor:
         Returns:
             str: Summary of the paper
         """
-        try:
-            prompt = f"""Provide a concise 2-3 sentence technical summary of this paper:
+        with self.metrics.timed('summary'):
+            try:
+                prompt = f"""Provide a concise 2-3 sentence technical summary of this paper:
             Title: {paper['title']}
             Authors: {'; '.join(paper['authors'])}
             DOI: {paper['doi']}
@@ -534,16 +788,98 @@ class LiteratureMonitor:
             Focus on the key innovation and potential impact for biorobotics research.
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=200
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Failed to generate summary: {str(e)}")
-            return "Summary unavailable due to technical error."
+                return self._chat(
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,
+                    max_tokens=200
+                ).strip()
+            except Exception as e:
+                self.metrics.count('errors')
+                logger.error(f"Failed to generate summary: {str(e)}")
+                return "Summary unavailable due to technical error."
+
+    def _generate_paper_summaries(self, papers):
+        """
+        Generate AI summaries for several papers with a single request.
+        
+        The model is asked for a JSON object mapping each DOI to its summary.
+        Papers that are missing from the reply, or whose entry is malformed,
+        fall back to _generate_paper_summary.
+        
+        Args:
+            papers (list): Paper metadata dictionaries
+            
+        Returns:
+            list: Summaries, in the same order as papers
+        """
+        if len(papers) == 1:
+            return [self._generate_paper_summary(papers[0])]
+        
+        summaries = {}
+        with self.metrics.timed('summary_batch'):
+            try:
+                listing = "\n\n".join(
+                    f"""Title: {paper['title']}
+            Authors: {'; '.join(paper.get('authors', []))}
+            DOI: {paper['doi']}
+            Keywords: {', '.join(paper.get('keywords', []))}"""
+                    for paper in papers
+                )
+                prompt = f"""Provide a concise 2-3 sentence technical summary of each of these papers:
+            
+            {listing}
+            
+            Focus on the key innovation and potential impact for biorobotics research.
+            Reply with ONLY a JSON object mapping each DOI exactly as given above to its
+            summary string, e.g. {{"10.1234/example": "Summary..."}}. No markdown, no other text.
+            """
+            
+                content = self._chat(
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,
+                    max_tokens=200 * len(papers) + 100
+                )
+                summaries = self._parse_summary_batch(content)
+            except Exception as e:
+                self.metrics.count('errors')
+                logger.error(f"Failed to generate batched summaries: {str(e)}")
+        
+        results = []
+        for paper in papers:
+            summary = summaries.get(doi_key(paper['doi']))
+            if not summary:
+                logger.info(f"Batched summary missing for {paper['doi']}, retrying individually")
+                summary = self._generate_paper_summary(paper)
+            results.append(summary)
+        return results
+
+    def _parse_summary_batch(self, content):
+        """
+        Extract the DOI -> summary mapping from a batched summary reply.
+        
+        Args:
+            content (str): Raw model output
+            
+        Returns:
+            dict: DOI key -> summary, containing only well-formed entries
+        """
+        # Drop reasoning blocks and code fences some models wrap around JSON
+        content = re.sub(r'<think>.*?</think>', '', content or '', flags=re.DOTALL)
+        start, end = content.find('{'), content.rfind('}')
+        if start == -1 or end <= start:
+            return {}
+        try:
+            data = json.loads(content[start:end + 1])
+        except ValueError:
+            logger.warning("Batched summary reply was not valid JSON")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            doi_key(str(doi)): summary.strip()
+            for doi, summary in data.items()
+            if isinstance(summary, str) and summary.strip()
+        }
 
     def _create_archive_file(self, papers_with_summaries):
         """
@@ -606,44 +942,230 @@ class LiteratureMonitor:
         words = term.strip().split()
         return ' '.join(word.capitalize() for word in words)
     
-    def execute(self):
-        """Execute the literature monitoring process."""
+    async def _run_pipeline(self, existing_dois, near_duplicates=None):
+        """
+        Run query -> parse -> verify -> summarize -> save as a streaming pipeline.
+        
+        Papers from the first term to return move downstream while slower
+        terms are still being researched. With STREAM_RESPONSES, each paper
+        moves on as soon as its block of the reply has been generated. With
+        PACK_SEARCH_TERMS, related terms share a request (src/query_planner.py);
+        terms whose section of the reply was cut off are asked again in
+        smaller packs.
+        
+        With self.journal set, term replies, verified DOIs, summaries and
+        Zotero keys recorded by an earlier attempt of the run are reused
+        instead of calling the services again, and new ones are recorded.
+        
+        Args:
+            existing_dois (set): DOI keys (src.doi_utils.doi_key) already in the library;
+                updated in place with newly accepted DOIs
+            near_duplicates (NearDuplicateIndex): Archived papers; papers that
+                match one under another DOI are dropped before verification.
+                Updated in place with newly verified papers
+            
+        Returns:
+            list: New papers with summaries, in search-term order
+        """
+        term_order = {term: i for i, term in enumerate(self.search_terms)}
+        parse_order = {}
+        term_counts = {}
+        journal = self.journal
+        replies, verified_keys, summaries, saved = (
+            (journal.entries(stage) for stage in ('query', 'verify', 'summary', 'save'))
+            if journal else ({}, {}, {}, {})
+        )
+        
+        planner = query_planner.QueryPlanner() if self.PACK_SEARCH_TERMS else None
+        
+        def query(term, emit):
+            if term in replies:
+                logger.info(f"Reusing journaled reply for: {term}")
+                for paper in parse_response(replies[term]):
+                    emit((term, paper))
+                return
+            content = self._stream_research_query(term, lambda paper: emit((term, paper)))
+            if planner and content:
+                planner.record(1, 1)
+            if journal and content:
+                journal.record('query', term, content)
+        
+        def query_pack(pack, emit):
+            pending = []
+            for term in pack:
+                if term in replies:
+                    query(term, emit)
+                else:
+                    pending.append(term)
+            while pending:
+                batch, pending = pending[:planner.pack_size], pending[planner.pack_size:]
+                if len(batch) == 1:
+                    query(batch[0], emit)
+                    continue
+                sections = self._research_pack(batch, lambda term, paper: emit((term, paper)))
+                if sections is None:
+                    continue
+                planner.record(len(batch), len(sections))
+                if journal:
+                    for term, section in sections.items():
+                        journal.record('query', term, section)
+                # Terms are only missing when the reply hit the token limit.
+                # Papers already emitted from a cut-off section are dropped
+                # as duplicates when the term is asked again
+                pending = [term for term in batch if term not in sections] + pending
+        
+        def query_whole(term):
+            if term in replies:
+                logger.info(f"Reusing journaled reply for: {term}")
+                return (term, replies[term])
+            result = self._deep_research_query(term)
+            if journal and result[1]:
+                journal.record('query', term, result[1])
+            return result
+        
+        def parse(result):
+            term, response = result
+            if isinstance(response, dict):
+                # A single paper from a streamed reply
+                found = [response] if self._validate(response, verify=False) else []
+            elif response:
+                found = self._parse_response(response, verify=False)
+            else:
+                return []
+            
+            papers = []
+            for paper in found:
+                paper_doi = doi_key(paper.get('doi'))
+                if not paper_doi or paper_doi in existing_dois:
+                    continue
+                match = near_duplicates.find(paper) if near_duplicates else None
+                if match:
+                    logger.info(f"Skipping near duplicate of {match['doi']} ({match['title']}): "
+                                f"{paper.get('title', '')} [{paper_doi}]")
+                    continue
+                # Store the source search term as the category
+                paper['source_term'] = term
+                # Format the term for use as a category name
+                paper['category'] = self._format_category_name(term)
+                parse_order[id(paper)] = (term_order.get(term, 0), term_counts.get(term, 0))
+                term_counts[term] = term_counts.get(term, 0) + 1
+                existing_dois.add(paper_doi)  # Prevent duplicates within batch
+                papers.append(paper)
+            return papers
+        
+        def verify(papers):
+            fresh = [paper for paper in papers if doi_key(paper['doi']) not in verified_keys]
+            passed = {id(paper) for paper in self._verify_papers(fresh)} if fresh else set()
+            verified = []
+            for paper in papers:
+                if id(paper) in passed:
+                    if journal:
+                        journal.record('verify', doi_key(paper['doi']), True)
+                elif doi_key(paper['doi']) not in verified_keys:
+                    continue
+                verified.append(paper)
+            if near_duplicates is None:
+                return verified
+            # Index only verified papers, so a copy with a made-up DOI cannot
+            # shadow the real one later in the run
+            unique = []
+            for paper in verified:
+                match = near_duplicates.check_and_add(paper)
+                if match:
+                    logger.info(f"Skipping near duplicate of {match['doi']} ({match['title']}): "
+                                f"{paper['title']}")
+                else:
+                    unique.append(paper)
+            return unique
+        
+        def summarize(papers):
+            fresh = []
+            for paper in papers:
+                key = doi_key(paper['doi'])
+                if key in summaries:
+                    paper['summary'] = summaries[key]
+                else:
+                    fresh.append(paper)
+            if fresh:
+                for paper, summary in zip(fresh, self._generate_paper_summaries(fresh)):
+                    paper['summary'] = summary
+                    if journal:
+                        journal.record('summary', doi_key(paper['doi']), summary)
+            return papers
+        
+        def save(paper):
+            key = doi_key(paper['doi'])
+            if key in saved:
+                # Created in Zotero by an earlier attempt of this run
+                paper['zotero_key'] = saved[key]
+            else:
+                self._save_to_zotero(paper)
+            return paper
+        
+        limits = self.STAGE_CONCURRENCY
+        if planner:
+            items = planner.plan(self.search_terms)
+            query_stage = Stage('query', query_pack, limits['query'], stream=True)
+            logger.info(f"Researching {len(self.search_terms)} terms in {len(items)} requests "
+                        f"(pack size {planner.pack_size})")
+        elif self.STREAM_RESPONSES:
+            items = self.search_terms
+            query_stage = Stage('query', query, limits['query'], stream=True)
+        else:
+            items = self.search_terms
+            query_stage = Stage('query', query_whole, limits['query'])
+        new_papers = await run_pipeline(
+            items,
+            [
+                query_stage,
+                Stage('parse', parse, limits['parse'], fan_out=True),
+                Stage('verify', verify, limits['verify'], batch_size=crossref.BULK_SIZE),
+                Stage('summarize', summarize, limits['summarize'],
+                      batch_size=self.SUMMARY_BATCH_SIZE),
+                Stage('save', save, limits['save']),
+            ],
+            queue_size=self.PIPELINE_QUEUE_SIZE
+        )
+        if planner:
+            planner.save()
+        return sorted(new_papers, key=lambda p: parse_order[id(p)])
+    
+    def execute(self, run_id=None):
+        """
+        Execute the literature monitoring process.
+        
+        Completed work is recorded in a RunJournal under run_id; calling
+        execute() again with the same run_id after a failure resumes from the
+        last completed step instead of repeating the paid and external calls.
+        
+        Args:
+            run_id (str): Run to start or resume (defaults to the RUN_ID
+                environment variable, or a new ID)
+        """
+        journal = RunJournal(run_id or os.getenv("RUN_ID") or new_run_id())
+        if journal.complete:
+            logger.info(f"Run {journal.run_id} already completed, nothing to do")
+            journal.close()
+            return
+        if journal.resumed:
+            logger.info(f"Resuming run {journal.run_id}")
+        self.journal = journal
+        self.metrics.reset()
         new_papers = []
+        completed = False
         
         try:
-            # Get existing DOIs to avoid duplicates
-            existing_items = self.zot.everything(self.zot.items())
-            existing_dois = {
-                item['data'].get('DOI', '').lower() 
-                for item in existing_items 
-                if 'DOI' in item['data']
-            }
-            
-            with ThreadPoolExecutor() as executor:
-                results = list(executor.map(self._deep_research_query, self.search_terms))
-                
-                for term, response in results:
-                    if not response:
-                        continue
-                    
-                    papers = self._parse_response(response)
-                    for paper in papers:
-                        paper_doi = paper.get('doi', '').lower()
-                        if paper_doi and paper_doi not in existing_dois:
-                            # Store the source search term as the category
-                            paper['source_term'] = term
-                            # Format the term for use as a category name
-                            paper['category'] = self._format_category_name(term)
-                            
-                            # Generate summary for the paper
-                            paper['summary'] = self._generate_paper_summary(paper)
-                            self._save_to_zotero(paper)
-                            new_papers.append(paper)
-                            existing_dois.add(paper_doi)  # Prevent duplicates within batch
+            new_papers = journal.get('result', 'papers')
+            if new_papers is None:
+                new_papers = self._collect_papers(journal)
+            else:
+                logger.info(f"Reusing {len(new_papers)} journaled papers")
             
             if new_papers:
                 # Create archive file with summaries
-                self._create_archive_file(new_papers)
+                if journal.get('done', 'archive') is None:
+                    if self._create_archive_file(new_papers):
+                        journal.record('done', 'archive', True)
                 
                 # Generate the website
                 self.generate_site(new_papers)
@@ -663,10 +1185,72 @@ class LiteratureMonitor:
             else:
                 logger.info("No new papers found")
                 self.generate_site([])  # Generate site with no new papers
+            journal.finish()
+            completed = True
                 
         except Exception as e:
-            logger.error(f"Execution error: {str(e)}")
+            logger.error(f"Execution error (resume with run ID {journal.run_id}): {str(e)}")
             raise
+        finally:
+            self._write_metrics(journal, completed, len(new_papers or []))
+            self.journal = None
+            journal.close()
+
+    def _write_metrics(self, journal, completed, count):
+        """
+        Write this run's per-stage metrics next to docs/update.json.
+        
+        Args:
+            journal (RunJournal): Journal of the current run
+            completed (bool): Whether the run finished
+            count (int): Number of new papers
+        """
+        try:
+            json_path, prom_path = self.metrics.write(
+                'docs',
+                run_id=journal.run_id,
+                resumed=journal.resumed,
+                completed=completed,
+                provider=self.provider,
+                model=self.model,
+                new_papers=count
+            )
+            logger.info(f"Wrote run metrics to {json_path} and {prom_path}")
+        except OSError as e:
+            logger.warning(f"Could not write run metrics: {str(e)}")
+
+    def _collect_papers(self, journal):
+        """
+        Run the pipeline and record its result in the journal.
+        
+        Args:
+            journal (RunJournal): Journal of the current run
+            
+        Returns:
+            list: New papers with summaries
+        """
+        # Get existing DOIs to avoid duplicates from the incrementally synced mirror
+        self.library_mirror.sync()
+        existing_dois = self.library_mirror.dois()
+        # Papers this run already saved are in the library now, but still
+        # belong in this run's archive
+        existing_dois -= set(journal.entries('save'))
+        # Catch papers we already have under a different DOI
+        near_duplicates = load_archive_index().near_duplicates()
+        
+        self.zotero_buffer.on_saved = (
+            lambda paper: journal.record('save', doi_key(paper['doi']), paper['zotero_key'])
+        )
+        try:
+            with self.metrics.timed('pipeline'):
+                new_papers = asyncio.run(self._run_pipeline(existing_dois, near_duplicates))
+        finally:
+            # Write any partially filled batch, even if the pipeline failed
+            self.zotero_buffer.flush()
+            self.zotero_buffer.on_saved = None
+            self.collections.save()
+        journal.record('result', 'papers', new_papers)
+        return new_papers
 
 if __name__ == "__main__":
     LiteratureMonitor().execute()
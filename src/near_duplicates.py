@@ -0,0 +1,227 @@
+"""
+Near-duplicate detection for papers whose DOIs differ.
+
+Research replies often repeat a paper we already have under a different (or
+made-up) DOI. Each paper is described by the character shingles of its
+normalized title plus its author surnames; a MinHash signature of that set is
+split into LSH bands, so a lookup only compares against papers that share a
+band instead of the whole corpus. Candidates are then confirmed with the exact
+Jaccard similarity of their shingle sets.
+
+Signatures of archived papers are stored in the archive index
+(src/archive_index.py), so each archived paper is only hashed once.
+Uses only standard library.
+"""
+
+import re
+import zlib
+import base64
+import struct
+import hashlib
+import threading
+import unicodedata
+
+SHINGLE_SIZE = 5
+NUM_HASHES = 40
+BANDS = 8
+ROWS = NUM_HASHES // BANDS
+# Jaccard similarity of shingle sets above which two papers are the same
+SIMILARITY_THRESHOLD = 0.8
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+_HASHES_FORMAT = f'<{NUM_HASHES}I'
+_BANDS_FORMAT = f'<{BANDS}I'
+# Author "names" models use when they do not know the authors
+_PLACEHOLDER_AUTHORS = {'al', 'specified', 'provided', 'available', 'unknown', 'list', 'article'}
+
+
+def _normalize_text(text):
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode('ascii')
+    return _NON_ALNUM_RE.sub(' ', text.lower()).strip()
+
+
+def shingles(title, authors=()):
+    """
+    Build the feature set compared between papers.
+
+    Args:
+        title (str): Paper title
+        authors (list): Author names
+
+    Returns:
+        set: Title character shingles and 'au:'-prefixed author surnames
+    """
+    text = _normalize_text(title)
+    if len(text) <= SHINGLE_SIZE:
+        features = {text} if text else set()
+    else:
+        features = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    for author in authors or ():
+        words = _normalize_text(author).split()
+        if words and len(words[-1]) > 1 and words[-1] not in _PLACEHOLDER_AUTHORS:
+            features.add(f"au:{words[-1]}")
+    return features
+
+
+def _band_keys(features):
+    if not features:
+        return ()
+    # One digest per feature provides all NUM_HASHES hash values
+    hashed = [struct.unpack(_HASHES_FORMAT, hashlib.shake_128(f.encode('utf-8')).digest(4 * NUM_HASHES))
+              for f in features]
+    packed = struct.pack(_HASHES_FORMAT, *map(min, zip(*hashed)))
+    step = 4 * ROWS
+    return tuple(zlib.crc32(packed[i:i + step]) for i in range(0, len(packed), step))
+
+
+def signature(title, authors=()):
+    """
+    Compute the persisted LSH signature of a paper.
+
+    Args:
+        title (str): Paper title
+        authors (list): Author names
+
+    Returns:
+        str: Base64-encoded band keys ("" for papers without a title)
+    """
+    keys = _band_keys(shingles(title, authors))
+    return base64.b64encode(struct.pack(_BANDS_FORMAT, *keys)).decode('ascii') if keys else ''
+
+
+def _decode_signature(value):
+    try:
+        return struct.unpack(_BANDS_FORMAT, base64.b64decode(value))
+    except (ValueError, struct.error):
+        return ()
+
+
+def similarity(a, b):
+    """
+    Exact Jaccard similarity of two papers' shingle sets.
+
+    Args:
+        a (dict): Paper with 'title' and 'authors'
+        b (dict): Paper with 'title' and 'authors'
+
+    Returns:
+        float: Similarity between 0 and 1
+    """
+    return _jaccard(shingles(a.get('title'), a.get('authors')),
+                    shingles(b.get('title'), b.get('authors')))
+
+
+def _jaccard(first, second):
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class NearDuplicateIndex:
+    """LSH index over paper titles and authors."""
+
+    def __init__(self, threshold=SIMILARITY_THRESHOLD):
+        """
+        Args:
+            threshold (float): Minimum Jaccard similarity to count as a duplicate
+        """
+        self.threshold = threshold
+        self._papers = []
+        # Shingle sets of papers that have been candidates, computed on demand
+        self._features = {}
+        self._buckets = [{} for _ in range(BANDS)]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._papers)
+
+    @classmethod
+    def from_papers(cls, papers, threshold=SIMILARITY_THRESHOLD):
+        """
+        Build an index over existing papers.
+
+        Args:
+            papers (list): Papers with 'title' and 'authors'
+            threshold (float): Minimum Jaccard similarity to count as a duplicate
+
+        Returns:
+            NearDuplicateIndex: The populated index
+        """
+        index = cls(threshold)
+        for paper in papers:
+            index.add(paper)
+        return index
+
+    def _add(self, paper, keys):
+        if not keys:
+            return
+        position = len(self._papers)
+        self._papers.append({'title': paper.get('title', ''), 'authors': paper.get('authors') or [],
+                             'doi': paper.get('doi', '')})
+        for bucket, key in zip(self._buckets, keys):
+            bucket.setdefault(key, []).append(position)
+
+    def _find(self, features, keys):
+        candidates = set()
+        for bucket, key in zip(self._buckets, keys):
+            candidates.update(bucket.get(key, ()))
+        best, best_score = None, self.threshold
+        for position in candidates:
+            candidate = self._papers[position]
+            known = self._features.get(position)
+            if known is None:
+                known = self._features[position] = shingles(candidate['title'], candidate['authors'])
+            score = _jaccard(features, known)
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best
+
+    def find(self, paper):
+        """
+        Look for an indexed paper that is a near duplicate of paper.
+
+        Args:
+            paper (dict): Paper with 'title' and 'authors'
+
+        Returns:
+            dict or None: Title, authors and DOI of the closest match
+        """
+        features = shingles(paper.get('title'), paper.get('authors'))
+        keys = _band_keys(features)
+        with self._lock:
+            return self._find(features, keys) if keys else None
+
+    def add(self, paper, stored=None):
+        """
+        Index a paper.
+
+        Args:
+            paper (dict): Paper with 'title' and 'authors'
+            stored (str): Its signature() if already known
+        """
+        keys = _decode_signature(stored) if stored else ()
+        if not keys:
+            keys = _band_keys(shingles(paper.get('title'), paper.get('authors')))
+        with self._lock:
+            self._add(paper, keys)
+
+    def check_and_add(self, paper):
+        """
+        Index paper unless it is a near duplicate of an indexed one.
+
+        Args:
+            paper (dict): Paper with 'title' and 'authors'
+
+        Returns:
+            dict or None: The match that made paper a duplicate, or None if
+                paper was new (and has been indexed)
+        """
+        features = shingles(paper.get('title'), paper.get('authors'))
+        keys = _band_keys(features)
+        if not keys:
+            return None
+        with self._lock:
+            match = self._find(features, keys)
+            if match is None:
+                self._add(paper, keys)
+            return match
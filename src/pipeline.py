@@ -0,0 +1,139 @@
+"""
+Small asyncio staged pipeline used by LiteratureMonitor.execute().
+
+Each stage runs a blocking callable in a thread pool with its own concurrency
+limit. Stages are connected by bounded queues, so an item moves downstream as
+soon as its stage finishes instead of waiting for the whole batch. Streaming
+stages go further and hand outputs downstream while they are still running.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('literature_monitor')
+
+_DONE = object()
+
+
+class Stage:
+    """A pipeline stage wrapping a blocking callable."""
+
+    def __init__(self, name, func, concurrency=1, fan_out=False, batch_size=1, batch_wait=1.0,
+                 stream=False):
+        """
+        Args:
+            name (str): Stage name used in log messages
+            func (callable): Blocking function taking one item. Returning None
+                drops the item.
+            concurrency (int): Maximum number of items processed at once
+            fan_out (bool): If True, func returns an iterable of items that are
+                each passed downstream
+            batch_size (int): If greater than 1, func receives a list of up to
+                this many items and returns an iterable of outputs
+            batch_wait (float): Seconds to wait for a batch to fill up before
+                processing a partial one
+            stream (bool): If True, func is called as func(item, emit) and
+                every emit(output) call passes output downstream immediately
+                (blocking while the next queue is full); its return value is
+                ignored
+        """
+        self.name = name
+        self.func = func
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.fan_out = fan_out or self.batch_size > 1
+        self.stream = stream
+
+
+async def _run_stage(stage, inbox, outbox, executor):
+    loop = asyncio.get_running_loop()
+
+    async def next_batch(first):
+        """Collect up to batch_size items; returns (batch, upstream_done)."""
+        batch = [first]
+        deadline = loop.time() + stage.batch_wait
+        while len(batch) < stage.batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(inbox.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def emit(output):
+        # Called from the executor thread running a streaming stage
+        asyncio.run_coroutine_threadsafe(outbox.put(output), loop).result()
+
+    async def worker():
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                # Let sibling workers see the sentinel too
+                await inbox.put(_DONE)
+                return
+            done = False
+            if stage.batch_size > 1:
+                item, done = await next_batch(item)
+            try:
+                if stage.stream:
+                    await loop.run_in_executor(executor, stage.func, item, emit)
+                    result = None
+                else:
+                    result = await loop.run_in_executor(executor, stage.func, item)
+            except Exception as e:
+                logger.error(f"Pipeline stage '{stage.name}' failed: {str(e)}")
+                result = None
+            if result is not None:
+                for output in (result if stage.fan_out else [result]):
+                    await outbox.put(output)
+            if done:
+                await inbox.put(_DONE)
+                return
+
+    await asyncio.gather(*(worker() for _ in range(stage.concurrency)))
+    await outbox.put(_DONE)
+
+
+async def run_pipeline(items, stages, queue_size=32):
+    """
+    Push items through the stages and collect what comes out of the last one.
+
+    Args:
+        items (iterable): Inputs for the first stage
+        stages (list): Stage objects, in order
+        queue_size (int): Capacity of each inter-stage queue
+
+    Returns:
+        list: Outputs of the final stage, in completion order
+    """
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    outputs = []
+
+    async def feed():
+        for item in items:
+            await queues[0].put(item)
+        await queues[0].put(_DONE)
+
+    async def drain():
+        while True:
+            item = await queues[-1].get()
+            if item is _DONE:
+                return
+            outputs.append(item)
+
+    workers = sum(stage.concurrency for stage in stages)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        await asyncio.gather(
+            feed(),
+            drain(),
+            *(_run_stage(stage, queues[i], queues[i + 1], executor)
+              for i, stage in enumerate(stages))
+        )
+    return outputs
@@ -0,0 +1,299 @@
+"""
+Profiling mode for the monitor and the maintenance scripts (--profile).
+
+While a RunProfiler is active, every stage timed through src.metrics, and
+every step it is given with stage(), is profiled on the thread that runs it.
+The run directory gets, per stage:
+
+    <stage>.pstats            cProfile statistics of all its calls (a nested
+                              stage pauses its parent, so time is counted in
+                              the innermost stage)
+    <stage>.collapsed         wall-clock stacks sampled every few milliseconds
+                              from the threads running the stage, one
+                              "frame;frame;... count" line per stack (input for
+                              flamegraph.pl, speedscope or inferno)
+    <stage>.tracemalloc.txt   top allocation sites after the stage call that
+                              grew traced memory the most (<stage>.tracemalloc
+                              is the raw snapshot for tracemalloc.Snapshot.load)
+
+plus all.collapsed (every stage under its own root frame), run.tracemalloc.txt
+(allocations still live at the end) and summary.json. Run it against the
+stand-ins (python -m benchmarks.load_benchmark --profile DIR) to reproduce a
+profile without touching the real services.
+
+Profiling slows a run down: cProfile roughly doubles CPU time, and tracing
+allocations makes allocation-heavy code (streamed SDK responses) several times
+slower still, which skews the CPU profiles towards it. Pass memory=False
+(--profile-no-memory) for CPU profiles closer to an unprofiled run.
+Uses only standard library.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import pstats
+import cProfile
+import linecache
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+from src.metrics import get_default_metrics
+
+# Default parent directory of run directories
+PROFILE_DIR = "profiles"
+SAMPLE_INTERVAL = 0.005
+# Allocation sites are reported by their innermost frame; every extra frame
+# makes tracing slower
+TRACEMALLOC_FRAMES = 1
+TOP_ALLOCATIONS = 25
+MAX_STACK_DEPTH = 64
+# A stage call must grow traced memory this much more than the stage's
+# previous largest growth before another snapshot is taken
+SNAPSHOT_MIN_GROWTH = 256 * 1024
+
+_UNSAFE_RE = re.compile(r'[^A-Za-z0-9_.-]+')
+# Allocations made by the profiler, tracemalloc and the import system itself
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+def _frame_label(code):
+    # Last two path components keep __init__.py and same-named modules apart
+    path = code.co_filename
+    short = os.path.join(os.path.basename(os.path.dirname(path)), os.path.basename(path))
+    return f"{code.co_name} ({short}:{code.co_firstlineno})".replace(';', ',')
+
+
+def _enable(profile):
+    # Python 3.12+ allows one active cProfile per process; a call that
+    # overlaps another thread's is then only sampled
+    try:
+        profile.enable()
+        return profile
+    except ValueError:
+        return None
+
+
+def _merge_profiles(profiles):
+    stats = None
+    for profile in profiles:
+        try:
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        except TypeError:
+            # A call too short to record any function
+            continue
+    return stats
+
+
+def _write_top_allocations(snapshot, path, title, limit=TOP_ALLOCATIONS):
+    statistics = snapshot.filter_traces(_SNAPSHOT_FILTERS).statistics('lineno')
+    total = sum(stat.size for stat in statistics)
+    with open(path, 'w') as f:
+        f.write(f"# {title}\n")
+        f.write(f"# {total / 1024:.1f} KiB traced in {len(statistics)} allocation sites\n\n")
+        for rank, stat in enumerate(statistics[:limit], 1):
+            frame = stat.traceback[0]
+            f.write(f"{rank:>3}. {frame.filename}:{frame.lineno}: "
+                    f"{stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+            line = linecache.getline(frame.filename, frame.lineno).strip()
+            if line:
+                f.write(f"       {line}\n")
+
+
+class _StageProfile:
+    """Everything recorded for one stage name."""
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.profiles = []
+        self.samples = Counter()
+        self.largest_growth = 0
+        self.snapshot = None
+
+
+class RunProfiler:
+    """CPU profiles, sampled stacks and allocation snapshots per stage."""
+
+    def __init__(self, directory, interval=SAMPLE_INTERVAL, nframes=TRACEMALLOC_FRAMES, memory=True):
+        """
+        Args:
+            directory (str): Run directory to write the profiles to
+            interval (float): Seconds between stack samples
+            nframes (int): Frames kept per tracemalloc traceback
+            memory (bool): Trace allocations and take tracemalloc snapshots
+        """
+        self.directory = directory
+        self.interval = interval
+        self.nframes = nframes
+        self.memory = memory
+        self._stages = {}
+        # Thread id -> stack of (stage, cProfile.Profile, start, traced bytes at entry)
+        self._threads = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+        self._started = None
+        self._owns_tracemalloc = False
+
+    def start(self):
+        """Start tracing allocations and sampling stacks; returns self."""
+        os.makedirs(self.directory, exist_ok=True)
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self._owns_tracemalloc = True
+        get_default_metrics().hooks.append(self)
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, name='profile-sampler', daemon=True)
+        self._sampler.start()
+        self._started = time.perf_counter()
+        return self
+
+    def stop(self):
+        """
+        Stop profiling and write the run directory.
+
+        Returns:
+            dict: The summary written to summary.json
+        """
+        metrics = get_default_metrics()
+        if self in metrics.hooks:
+            metrics.hooks.remove(self)
+        self._stop.set()
+        self._sampler.join()
+        elapsed = time.perf_counter() - self._started
+        tracing = tracemalloc.is_tracing()
+        final = tracemalloc.take_snapshot() if tracing else None
+        peak = tracemalloc.get_traced_memory()[1]
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+        return self._write(final, peak, elapsed)
+
+    @contextmanager
+    def stage(self, name):
+        """Profile the enclosed code as a stage (e.g. one CLI step)."""
+        self.stage_entered(name)
+        try:
+            yield
+        finally:
+            self.stage_exited(name)
+
+    def stage_entered(self, stage):
+        """Start profiling a stage call on the current thread."""
+        with self._lock:
+            stack = self._threads.setdefault(threading.get_ident(), [])
+            if stack and stack[-1][1] is not None:
+                stack[-1][1].disable()
+        profile = _enable(cProfile.Profile())
+        with self._lock:
+            stack.append((stage, profile, time.perf_counter(), tracemalloc.get_traced_memory()[0]))
+
+    def stage_exited(self, stage):
+        """Finish the current thread's innermost stage call and resume its parent."""
+        with self._lock:
+            stack = self._threads.get(threading.get_ident())
+            # Entered before the profiler started
+            if not stack or stack[-1][0] != stage:
+                return
+            _, profile, start, traced = stack.pop()
+        if profile is not None:
+            profile.disable()
+        elapsed = time.perf_counter() - start
+        growth = tracemalloc.get_traced_memory()[0] - traced
+
+        with self._lock:
+            data = self._stages.setdefault(stage, _StageProfile())
+            data.calls += 1
+            data.seconds += elapsed
+            if profile is not None:
+                data.profiles.append(profile)
+            snapshot = self.memory and growth > data.largest_growth + SNAPSHOT_MIN_GROWTH
+            if snapshot:
+                data.largest_growth = growth
+        if snapshot:
+            taken = tracemalloc.take_snapshot()
+            with self._lock:
+                data.snapshot = taken
+        if stack and stack[-1][1] is not None:
+            parent = stack[-1]
+            stack[-1] = parent[:1] + (_enable(parent[1]),) + parent[2:]
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                active = {thread: stack[-1][0] for thread, stack in self._threads.items() if stack}
+            if not active:
+                continue
+            frames = sys._current_frames()
+            samples = []
+            for thread, stage in active.items():
+                frame = frames.get(thread)
+                labels = []
+                while frame is not None and len(labels) < MAX_STACK_DEPTH:
+                    labels.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                if labels:
+                    samples.append((stage, ';'.join(reversed(labels))))
+            with self._lock:
+                for stage, stack in samples:
+                    self._stages.setdefault(stage, _StageProfile()).samples[stack] += 1
+
+    def _write(self, final, peak, elapsed):
+        summary = {
+            'directory': os.path.abspath(self.directory),
+            'seconds': round(elapsed, 3),
+            'sample_interval': self.interval,
+            'peak_traced_bytes': peak,
+            'stages': {},
+        }
+        combined = Counter()
+        for name, data in sorted(self._stages.items()):
+            base = os.path.join(self.directory, _UNSAFE_RE.sub('_', name))
+            entry = {
+                'calls': data.calls,
+                'seconds': round(data.seconds, 3),
+                'samples': sum(data.samples.values()),
+                'largest_memory_growth_bytes': data.largest_growth,
+                'files': [],
+            }
+            stats = _merge_profiles(data.profiles)
+            if stats is not None:
+                stats.dump_stats(f"{base}.pstats")
+                entry['files'].append(f"{base}.pstats")
+            if data.samples:
+                with open(f"{base}.collapsed", 'w') as f:
+                    for stack, count in sorted(data.samples.items()):
+                        f.write(f"{stack} {count}\n")
+                        combined[f"{name};{stack}"] += count
+                entry['files'].append(f"{base}.collapsed")
+            if data.snapshot is not None:
+                data.snapshot.dump(f"{base}.tracemalloc")
+                _write_top_allocations(data.snapshot, f"{base}.tracemalloc.txt",
+                                       f"{name}: after the call that grew traced memory by "
+                                       f"{data.largest_growth / 1024:.1f} KiB")
+                entry['files'] += [f"{base}.tracemalloc.txt", f"{base}.tracemalloc"]
+            summary['stages'][name] = entry
+
+        if combined:
+            with open(os.path.join(self.directory, 'all.collapsed'), 'w') as f:
+                for stack, count in sorted(combined.items()):
+                    f.write(f"{stack} {count}\n")
+        if final is not None:
+            _write_top_allocations(final, os.path.join(self.directory, 'run.tracemalloc.txt'),
+                                   f"end of run (peak {peak / 1024:.1f} KiB traced)")
+        with open(os.path.join(self.directory, 'summary.json'), 'w') as f:
+            json.dump(summary, f, indent=2)
+        return summary
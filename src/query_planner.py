@@ -0,0 +1,160 @@
+"""
+Packs several search terms into one research request.
+
+Each line of search_terms.txt used to cost one deep-research request. The
+planner groups terms into packs of related terms (by shared words, so e.g. the
+decoding terms share a request) and LiteratureMonitor asks for one section per
+term in a single reply; src/response_parser.py splits the reply back into
+terms, so categories are still per term.
+
+The pack size adapts to how much fits in a reply: a reply that stopped at the
+token limit (the provider's finish reason, not a missing end marker) shrinks
+the pack size at once, and the terms it did not complete are asked again in
+smaller packs; a run without truncation grows it by one for the next run. The
+size is kept in .cache/.
+Uses only standard library.
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from datetime import datetime
+
+logger = logging.getLogger('literature_monitor')
+
+DEFAULT_PLANNER_PATH = os.getenv("QUERY_PLANNER_PATH", ".cache/query_planner.json")
+INITIAL_PACK_SIZE = 4
+MAX_PACK_SIZE = 8
+# Completion budget per packed term, and the most one request may ask for
+TOKENS_PER_TERM = 2000
+MAX_PACK_TOKENS = 8000
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_STOP_WORDS = {'and', 'for', 'the', 'with', 'from', 'into', 'onto', 'using', 'based', 'patients'}
+
+
+def _words(term):
+    return {word for word in _WORD_RE.findall(term.lower())
+            if len(word) > 2 and word not in _STOP_WORDS}
+
+
+def pack_terms(terms, size):
+    """
+    Group terms into packs, keeping terms that share words together.
+
+    Packs are seeded in the terms' order, and each is filled with the
+    remaining terms sharing the most words with it (ties go to the earlier
+    term), so the result is deterministic.
+
+    Args:
+        terms (list): Search terms
+        size (int): Maximum terms per pack
+
+    Returns:
+        list: Lists of terms
+    """
+    if size <= 1:
+        return [[term] for term in terms]
+    remaining = [(term, _words(term)) for term in terms]
+    packs = []
+    while remaining:
+        term, words = remaining.pop(0)
+        pack = [term]
+        words = set(words)
+        while remaining and len(pack) < size:
+            best = max(range(len(remaining)),
+                       key=lambda i: (len(words & remaining[i][1]), -i))
+            term, more = remaining.pop(best)
+            pack.append(term)
+            words |= more
+        packs.append(pack)
+    return packs
+
+
+def max_tokens(count):
+    """
+    Completion token limit for a request covering count terms.
+
+    Args:
+        count (int): Terms in the request
+
+    Returns:
+        int: max_tokens for the request
+    """
+    return min(TOKENS_PER_TERM * count, MAX_PACK_TOKENS)
+
+
+class QueryPlanner:
+    """Adaptive pack size, persisted between runs."""
+
+    def __init__(self, path=DEFAULT_PLANNER_PATH, max_pack_size=MAX_PACK_SIZE):
+        """
+        Args:
+            path (str): JSON file holding the pack size between runs
+            max_pack_size (int): Upper bound for the pack size
+        """
+        self.path = path
+        self.max_pack_size = max(1, max_pack_size)
+        self.pack_size = min(self._load(), self.max_pack_size)
+        self.requests = 0
+        self.truncated = 0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return max(1, int(json.load(f)['pack_size']))
+        except (OSError, ValueError, KeyError, TypeError):
+            return INITIAL_PACK_SIZE
+
+    def plan(self, terms):
+        """
+        Split the search terms into packs of the current size.
+
+        Args:
+            terms (list): Search terms
+
+        Returns:
+            list: Lists of terms, one per request
+        """
+        return pack_terms(terms, self.pack_size)
+
+    def record(self, requested, completed):
+        """
+        Record the outcome of one packed request.
+
+        Args:
+            requested (int): Terms asked for
+            completed (int): Terms whose section was complete in the reply
+                (all of them unless the reply stopped at the token limit)
+        """
+        with self._lock:
+            self.requests += 1
+            if completed >= requested:
+                return
+            self.truncated += 1
+            # What fitted is the new size; nothing fitting halves it
+            fitted = completed or requested // 2
+            if fitted < self.pack_size:
+                logger.info(f"Packed reply cut off after {completed} of {requested} terms; "
+                            f"pack size {self.pack_size} -> {max(1, fitted)}")
+                self.pack_size = max(1, fitted)
+
+    def save(self):
+        """Persist the pack size for the next run, growing it after a run without truncation."""
+        with self._lock:
+            size = self.pack_size
+            if self.requests and not self.truncated:
+                size = min(self.max_pack_size, size + 1)
+            state = {'pack_size': size, 'updated': datetime.now().isoformat(),
+                     'requests': self.requests, 'truncated': self.truncated}
+        directory = os.path.dirname(self.path)
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(state, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not persist query planner state: {str(e)}")
@@ -0,0 +1,94 @@
+"""
+Thread-safe token bucket used to pace requests to rate-limited APIs.
+Uses only standard library so the stdlib-only scripts can import it.
+"""
+
+import re
+import time
+import threading
+
+# CrossRef polite pool (requests with a mailto in the User-Agent)
+CROSSREF_RATE = 10.0
+CROSSREF_BURST = 10
+
+
+def parse_interval(value):
+    """
+    Parse a CrossRef X-Rate-Limit-Interval header value.
+
+    Args:
+        value (str): Interval such as "1s", "60s" or "1m"
+
+    Returns:
+        float or None: Interval in seconds, or None if unparseable
+    """
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*', value or '')
+    if not match:
+        return None
+    amount = float(match.group(1))
+    unit = match.group(2) or 's'
+    return amount * {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}[unit]
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` acquisitions per second with bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Maximum burst size (defaults to rate, at least 1)
+        """
+        self._lock = threading.Lock()
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` tokens are available, then take them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def set_rate(self, rate, capacity=None):
+        """Change the refill rate (and optionally burst size) in place."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            if capacity is not None:
+                self.capacity = float(capacity)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def update_from_headers(self, headers):
+        """
+        Adopt the limit advertised by X-Rate-Limit-Limit / X-Rate-Limit-Interval.
+
+        Args:
+            headers: Mapping-like response headers (may be None)
+        """
+        if not headers:
+            return
+        limit = headers.get('X-Rate-Limit-Limit')
+        interval = parse_interval(headers.get('X-Rate-Limit-Interval'))
+        try:
+            limit = float(limit)
+        except (TypeError, ValueError):
+            return
+        if limit <= 0 or not interval:
+            return
+        rate = limit / interval
+        if abs(rate - self.rate) > 1e-9:
+            self.set_rate(rate, capacity=max(1.0, limit))
@@ -0,0 +1,231 @@
+"""
+Incremental parser for research replies in the Title:/Authors:/DOI:/TRL:/
+Keywords: block format requested by LiteratureMonitor.
+
+Text can be fed in arbitrary pieces (e.g. streamed completion deltas); only
+complete lines are interpreted. A paper is handed out as soon as it is
+complete - all five fields seen, or the next Title: line started - so callers
+can act on the first paper while the model is still writing the rest.
+
+Replies covering several search terms (src/query_planner.py) put each term's
+papers under a "=== TERM n: ... ===" header and end with "=== END ===";
+PackedResponseParser splits them back into terms. Whether the reply was cut
+off is taken from the provider's stop reason, not from the markers, since
+models also drop the end marker from replies they finished.
+Uses only standard library.
+"""
+
+import re
+import logging
+
+from src.doi_utils import normalize_doi
+
+logger = logging.getLogger('literature_monitor')
+
+FIELDS = ('title', 'authors', 'doi', 'trl', 'keywords')
+
+# "=== TERM 2: topic ===" (models sometimes use ### or ** instead of ===)
+_SECTION_RE = re.compile(r'^\s*[=#*]+\s*TERM\s+(\d+)\s*[:.)-]', re.IGNORECASE)
+_END_RE = re.compile(r'^\s*[=#*]+\s*END\s*[=#*]*\s*$', re.IGNORECASE)
+
+
+def _parse_trl(text):
+    try:
+        # Try direct conversion first
+        return int(text)
+    except ValueError:
+        # Look for any numbers in the string and use the first one
+        numbers = re.findall(r'\d+', text)
+        if numbers:
+            return int(numbers[0])
+        # Default to 5 (middle of the TRL scale)
+        logger.warning(f"Could not parse TRL value '{text}', defaulting to 5")
+        return 5
+
+
+class ResponseParser:
+    """Turns research reply text into paper dictionaries as it arrives."""
+
+    def __init__(self, on_paper=None):
+        """
+        Args:
+            on_paper (callable): Called with each paper as soon as it is complete
+        """
+        self.on_paper = on_paper
+        self.papers = []
+        self._buffer = ''
+        self._current = {}
+        # After a paper is handed out early, ignore lines until the next Title:
+        self._emitted = False
+
+    def feed(self, text):
+        """
+        Add text to the reply.
+
+        Args:
+            text (str): Next piece of the reply
+
+        Returns:
+            list: Papers completed by this piece
+        """
+        self._buffer += text
+        if '\n' not in self._buffer:
+            return []
+        *lines, self._buffer = self._buffer.split('\n')
+        completed = []
+        for line in lines:
+            self._line(line, completed)
+        return completed
+
+    def close(self):
+        """
+        Finish the reply, completing the last paper.
+
+        Returns:
+            list: Papers completed by the end of the reply
+        """
+        completed = []
+        if self._buffer:
+            self._line(self._buffer, completed)
+            self._buffer = ''
+        if self._current.get('title'):
+            self._complete(completed)
+        return completed
+
+    def _complete(self, completed):
+        paper, self._current = self._current, {}
+        self.papers.append(paper)
+        completed.append(paper)
+        if self.on_paper:
+            self.on_paper(paper)
+
+    def _line(self, line, completed):
+        current = self._current
+        if line.startswith('Title:'):
+            if current.get('title'):  # We've hit a new paper
+                self._complete(completed)
+            self._emitted = False
+            self._current['title'] = line[6:].strip()
+            return
+        if self._emitted:
+            return
+        if line.startswith('Authors:'):
+            current['authors'] = line[8:].strip().split('; ')
+        elif line.startswith('DOI:'):
+            current['doi'] = normalize_doi(line[4:].strip())
+        elif line.startswith('TRL:'):
+            current['trl'] = _parse_trl(line[4:].strip())
+        elif line.startswith('Keywords:'):
+            current['keywords'] = [k.strip() for k in line[9:].split(',')]
+        else:
+            return
+        if current.get('title') and all(field in current for field in FIELDS):
+            self._complete(completed)
+            self._emitted = True
+
+
+def parse_response(content):
+    """
+    Parse a complete research reply.
+
+    Args:
+        content (str): Reply text
+
+    Returns:
+        list: Paper dictionaries (not yet validated)
+    """
+    parser = ResponseParser()
+    parser.feed(content)
+    parser.close()
+    return parser.papers
+
+
+class PackedResponseParser:
+    """Splits a reply covering several terms into per-term sections as it arrives."""
+
+    def __init__(self, terms, on_paper=None):
+        """
+        Args:
+            terms (list): The terms, in the order they were numbered in the prompt
+            on_paper (callable): Called as on_paper(term, paper) with each
+                paper as soon as it is complete
+        """
+        self.terms = list(terms)
+        self.on_paper = on_paper
+        # term -> lines of its section; a section is complete once the next
+        # header or the end marker follows it, or the reply ends untruncated
+        self._lines = {}
+        self._complete = []
+        self._term = None
+        self._parser = None
+        self._buffer = ''
+
+    def feed(self, text):
+        """
+        Add text to the reply.
+
+        Args:
+            text (str): Next piece of the reply
+        """
+        self._buffer += text
+        if '\n' not in self._buffer:
+            return
+        *lines, self._buffer = self._buffer.split('\n')
+        for line in lines:
+            self._line(line)
+
+    def finish(self, truncated=False):
+        """
+        End the reply.
+
+        Args:
+            truncated (bool): The reply stopped at the token limit. The section
+                still open was then cut off, and terms without a section were
+                never reached; otherwise every term is complete (a term
+                without a section had no papers).
+        """
+        if self._buffer:
+            self._line(self._buffer)
+            self._buffer = ''
+        if truncated:
+            if self._parser:
+                self._parser.close()
+            self._term = self._parser = None
+            return
+        self._end_section()
+        for term in self.terms:
+            self._lines.setdefault(term, [])
+            if term not in self._complete:
+                self._complete.append(term)
+
+    def sections(self):
+        """
+        Returns:
+            dict: term -> section text, for the terms whose section is complete
+        """
+        return {term: '\n'.join(self._lines[term]) for term in self._complete}
+
+    def _end_section(self):
+        if self._term is not None:
+            self._parser.close()
+            if self._term not in self._complete:
+                self._complete.append(self._term)
+        self._term = self._parser = None
+
+    def _line(self, line):
+        header = _SECTION_RE.match(line)
+        if header or _END_RE.match(line):
+            self._end_section()
+            index = int(header.group(1)) - 1 if header else -1
+            if 0 <= index < len(self.terms):
+                term = self._term = self.terms[index]
+                self._lines.setdefault(term, [])
+                on_paper = self.on_paper
+                self._parser = ResponseParser(
+                    on_paper=(lambda paper: on_paper(term, paper)) if on_paper else None
+                )
+            return
+        # Text outside any section (e.g. <think> reasoning) is ignored
+        if self._term is not None:
+            self._lines[self._term].append(line)
+            self._parser.feed(line + '\n')
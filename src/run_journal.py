@@ -0,0 +1,136 @@
+"""
+Per-run journal of completed LiteratureMonitor.execute() work.
+
+Each paid or external step records its output under the run ID as soon as it
+completes: the reply for each search term, verified DOIs, summaries, Zotero
+item keys, the final paper list and the archive/site steps. Rerunning with the
+same run ID (RUN_ID, or --run-id on the CLI) resumes from those records
+instead of repeating the calls. Uses only standard library (sqlite3).
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+
+logger = logging.getLogger('literature_monitor')
+
+DEFAULT_JOURNAL_PATH = os.getenv("RUN_JOURNAL_PATH", ".cache/run_journal.sqlite")
+# Journals of runs older than this are deleted when a journal is opened
+JOURNAL_TTL = 30 * 24 * 3600
+
+
+def new_run_id():
+    """Create a run ID that sorts by start time."""
+    return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+class RunJournal:
+    """SQLite-backed record of one run's completed work."""
+
+    def __init__(self, run_id, path=DEFAULT_JOURNAL_PATH, ttl=JOURNAL_TTL):
+        """
+        Open (and create if needed) the journal for a run.
+
+        Args:
+            run_id (str): Run identifier; reusing one resumes that run
+            path (str): SQLite file path
+            ttl (int): Seconds to keep journals of other runs
+        """
+        self.run_id = run_id
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                started_at REAL NOT NULL,
+                finished_at REAL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                run_id TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (run_id, stage, key)
+            )
+        """)
+        cutoff = time.time() - ttl
+        self._conn.execute(
+            "DELETE FROM entries WHERE run_id IN "
+            "(SELECT run_id FROM runs WHERE started_at < ? AND run_id != ?)",
+            (cutoff, run_id)
+        )
+        self._conn.execute("DELETE FROM runs WHERE started_at < ? AND run_id != ?", (cutoff, run_id))
+
+        row = self._conn.execute(
+            "SELECT finished_at FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        self.resumed = row is not None
+        self.complete = bool(row and row[0])
+        if row is None:
+            self._conn.execute("INSERT INTO runs VALUES (?, ?, NULL)", (run_id, time.time()))
+        self._conn.commit()
+
+    def record(self, stage, key, value):
+        """
+        Record a completed piece of work.
+
+        Args:
+            stage (str): Stage name (e.g. 'query', 'summary')
+            key (str): Item within the stage (e.g. search term, DOI key)
+            value: JSON-serializable output
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (self.run_id, stage, key, json.dumps(value))
+            )
+            self._conn.commit()
+
+    def get(self, stage, key, default=None):
+        """Return the recorded output of one item, or default."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE run_id = ? AND stage = ? AND key = ?",
+                (self.run_id, stage, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def entries(self, stage):
+        """
+        Return everything recorded for a stage.
+
+        Returns:
+            dict: key -> output
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM entries WHERE run_id = ? AND stage = ?",
+                (self.run_id, stage)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def finish(self):
+        """Mark the run complete; later opens with this run ID do nothing."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET finished_at = ? WHERE run_id = ?", (time.time(), self.run_id)
+            )
+            self._conn.commit()
+        self.complete = True
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,252 @@
+"""
+Per-backend request scheduler with adaptive concurrency and 429/503 backoff.
+
+Every external service (LLM providers, CrossRef, Zotero) gets a BackendLimiter
+with a concurrency limit and a token-bucket rate budget. Concurrency grows by
+one after a window of successful calls and is halved when the service answers
+429 or 503, in which case all callers pause for Retry-After (or an exponential
+backoff) before the request is retried.
+Uses only standard library so the stdlib-only scripts can import it.
+"""
+
+import re
+import time
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+from src.rate_limit import TokenBucket, CROSSREF_RATE, CROSSREF_BURST
+from src.metrics import get_default_metrics
+
+logger = logging.getLogger('literature_monitor')
+
+THROTTLE_STATUSES = (429, 503)
+# pyzotero errors carry the status only in their message ("Code: 503"), and a
+# 429 without a backoff header as TooManyRetriesError
+_MESSAGE_STATUS_RE = re.compile(r'^\s*Code: (\d{3})\s*$', re.MULTILINE)
+_THROTTLE_ERRORS = ('TooManyRetriesError',)
+# Longest pause after a throttle, whether backoff or server-requested
+MAX_BACKOFF = 60.0
+
+# name: (max concurrency, requests per second, burst)
+BACKENDS = {
+    'perplexity': (8, 50 / 60, 5),
+    'gemini': (4, 15 / 60, 2),
+    'ollama': (2, 100.0, 2),
+    'anthropic': (4, 50 / 60, 5),
+    'crossref': (5, CROSSREF_RATE, CROSSREF_BURST),
+    'zotero': (2, 5.0, 5),
+}
+
+
+class RateLimited(Exception):
+    """Raised when a backend keeps throttling after all retries."""
+
+    def __init__(self, backend, retry_after=None):
+        super().__init__(f"{backend} is rate limiting requests")
+        self.backend = backend
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value (str): Delay in seconds or an HTTP date
+
+    Returns:
+        float or None: Seconds to wait, or None if unparseable
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def throttle_info(outcome):
+    """
+    Detect a 429/503 from an exception or response object.
+
+    Works with requests/openai/anthropic responses and errors (status_code),
+    urllib HTTPError (code), objects exposing a `response` with headers and
+    pyzotero errors (status in the message).
+
+    Returns:
+        tuple: (is_throttled, retry_after_seconds or None)
+    """
+    status = None
+    for attr in ('status_code', 'status', 'code'):
+        value = getattr(outcome, attr, None)
+        if isinstance(value, int):
+            status = value
+            break
+    response = getattr(outcome, 'response', None)
+    if status is None and response is not None:
+        status = getattr(response, 'status_code', None)
+    if status is None and isinstance(outcome, Exception):
+        if type(outcome).__name__ in _THROTTLE_ERRORS:
+            status = 429
+        else:
+            match = _MESSAGE_STATUS_RE.search(str(outcome))
+            status = int(match.group(1)) if match else None
+    if status not in THROTTLE_STATUSES:
+        return False, None
+
+    headers = getattr(outcome, 'headers', None)
+    if headers is None and response is not None:
+        headers = getattr(response, 'headers', None)
+    retry_after = parse_retry_after(headers.get('Retry-After')) if headers else None
+    return True, retry_after
+
+
+class BackendLimiter:
+    """AIMD concurrency limit plus token-bucket rate budget for one backend."""
+
+    def __init__(self, name, max_concurrency, rate, burst=None, initial_concurrency=2):
+        """
+        Args:
+            name (str): Backend name
+            max_concurrency (int): Upper bound for in-flight requests
+            rate (float): Requests per second budget
+            burst (int): Token bucket capacity
+            initial_concurrency (int): Starting concurrency limit
+        """
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = min(self.max_concurrency, max(1, initial_concurrency))
+        self.bucket = TokenBucket(rate, burst)
+        self.throttled = 0
+        self._active = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """Hold one concurrency slot and one rate token for the duration of a call."""
+        with self._cond:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._active < self.limit:
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else None)
+            self._active += 1
+        try:
+            self.bucket.acquire()
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def record_success(self):
+        """Additive increase: raise the limit after `limit` consecutive successes."""
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_concurrency:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def record_throttle(self, retry_after=None, attempt=0):
+        """
+        Multiplicative decrease: halve the limit and pause every caller.
+
+        Args:
+            retry_after (float): Server-requested delay in seconds, if any
+                (capped at MAX_BACKOFF)
+            attempt (int): Retry attempt number, used for exponential backoff
+        """
+        # A huge Retry-After (or a far-future date) would stall every caller
+        delay = retry_after if retry_after is not None else 2 ** attempt + random.random()
+        delay = min(MAX_BACKOFF, delay)
+        with self._cond:
+            self.throttled += 1
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        get_default_metrics().throttled(self.name)
+        logger.warning(f"{self.name} throttled; concurrency limit {self.limit}, pausing {delay:.1f}s")
+
+    def update_from_headers(self, headers):
+        """Adopt a rate advertised by X-Rate-Limit-* response headers."""
+        self.bucket.update_from_headers(headers)
+
+
+class RequestScheduler:
+    """Registry of BackendLimiters with a retrying call() helper."""
+
+    def __init__(self, backends=None):
+        """
+        Args:
+            backends (dict): name -> (max concurrency, rate, burst); defaults to BACKENDS
+        """
+        self._config = dict(BACKENDS if backends is None else backends)
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, name):
+        """Get (creating on first use) the limiter for a backend."""
+        with self._lock:
+            if name not in self._limiters:
+                max_concurrency, rate, burst = self._config.get(name, (4, 5.0, 5))
+                self._limiters[name] = BackendLimiter(name, max_concurrency, rate, burst)
+            return self._limiters[name]
+
+    def call(self, name, func, *args, retries=4, **kwargs):
+        """
+        Run func under the backend's limits, retrying on 429/503.
+
+        A throttle is recognised whether func raises it (e.g. openai
+        RateLimitError, urllib HTTPError) or returns it (e.g. a requests
+        Response with status_code 429).
+
+        Args:
+            name (str): Backend name
+            func (callable): The request to perform
+            retries (int): Retries after throttled attempts
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            RateLimited: If the backend is still throttling after all retries
+        """
+        limiter = self.limiter(name)
+        for attempt in range(retries + 1):
+            with limiter.slot():
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    throttled, retry_after = throttle_info(e)
+                    if not throttled:
+                        raise
+                else:
+                    throttled, retry_after = throttle_info(result)
+                    if not throttled:
+                        limiter.record_success()
+                        return result
+            limiter.record_throttle(retry_after, attempt)
+        raise RateLimited(name, retry_after)
+
+
+_default_scheduler = None
+_default_lock = threading.Lock()
+
+
+def get_default_scheduler():
+    """Return the process-wide scheduler."""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RequestScheduler()
+        return _default_scheduler
@@ -0,0 +1,188 @@
+"""
+Build the GitHub Pages site: paginated JSON data shards, a prebuilt search
+index, and a light index.html that renders the first shard and fetches the
+rest on demand.
+"""
+
+import os
+import re
+import json
+import glob
+from datetime import datetime
+
+DOCS_DIR = "docs"
+TEMPLATE_DIR = "src/templates"
+SHARD_SIZE = 100
+
+# Field weights for the search index; a match in the title ranks highest
+SEARCH_FIELDS = {
+    'title': 3,
+    'keywords': 2,
+    'category': 1,
+    'authors': 1,
+}
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'by', 'for', 'from', 'in', 'into',
+    'is', 'of', 'on', 'or', 'the', 'to', 'with',
+}
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def _as_list(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def site_record(paper, paper_id):
+    """
+    Reduce a paper to the fields the page displays.
+
+    Args:
+        paper (dict): Paper metadata (authors/keywords may be str or list)
+        paper_id (int): Position of the paper in the site listing
+
+    Returns:
+        dict: JSON-serializable record
+    """
+    return {
+        'id': paper_id,
+        'title': paper.get('title', ''),
+        'authors': _as_list(paper.get('authors')),
+        'doi': paper.get('doi', ''),
+        'trl': paper.get('trl', 'N/A'),
+        'keywords': _as_list(paper.get('keywords')),
+        'summary': paper.get('summary', ''),
+        'category': paper.get('category', ''),
+    }
+
+
+def write_data_shards(records, docs_dir=DOCS_DIR, shard_size=SHARD_SIZE, search_index=None):
+    """
+    Write records as docs/data/papers-NNNN.json shards plus a manifest.
+
+    Args:
+        records (list): Records from site_record()
+        docs_dir (str): Site output directory
+        shard_size (int): Records per shard
+        search_index (str): Path of the search index relative to docs_dir
+
+    Returns:
+        dict: The manifest
+    """
+    data_dir = os.path.join(docs_dir, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+
+    shards = []
+    for start in range(0, len(records), shard_size):
+        name = f"papers-{len(shards):04d}.json"
+        chunk = records[start:start + shard_size]
+        with open(os.path.join(data_dir, name), 'w', encoding='utf-8') as f:
+            json.dump(chunk, f, separators=(',', ':'))
+        shards.append({'file': f"data/{name}", 'count': len(chunk)})
+
+    # Remove shards left over from a larger previous build
+    current = {os.path.basename(shard['file']) for shard in shards}
+    for path in glob.glob(os.path.join(data_dir, 'papers-*.json')):
+        if os.path.basename(path) not in current:
+            os.remove(path)
+
+    categories = {}
+    for record in records:
+        categories[record['category']] = categories.get(record['category'], 0) + 1
+
+    manifest = {
+        'total': len(records),
+        'shard_size': shard_size,
+        'shards': shards,
+        'categories': categories,
+        'search_index': search_index,
+    }
+    with open(os.path.join(data_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def tokenize(text):
+    """Split text into lower-cased search tokens (same rule as the page script)."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def build_search_index(records):
+    """
+    Build a compact inverted index over title, authors, keywords and category.
+
+    The result has a sorted `tokens` list (so the page can do prefix matches
+    with a binary search) and an aligned `postings` list where each entry is a
+    flat [id, score, id, score, ...] array.
+
+    Args:
+        records (list): Records from site_record()
+
+    Returns:
+        dict: JSON-serializable index
+    """
+    scores = {}
+    for record in records:
+        for field, weight in SEARCH_FIELDS.items():
+            value = record[field]
+            text = ' '.join(value) if isinstance(value, list) else str(value)
+            for token in set(tokenize(text)):
+                per_paper = scores.setdefault(token, {})
+                per_paper[record['id']] = per_paper.get(record['id'], 0) + weight
+
+    tokens = sorted(scores)
+    postings = []
+    for token in tokens:
+        flat = []
+        for paper_id, score in sorted(scores[token].items()):
+            flat.extend((paper_id, score))
+        postings.append(flat)
+    return {'tokens': tokens, 'postings': postings}
+
+
+def write_search_index(records, docs_dir=DOCS_DIR):
+    """Write docs/data/search-index.json and return its path relative to docs_dir."""
+    data_dir = os.path.join(docs_dir, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    with open(os.path.join(data_dir, 'search-index.json'), 'w', encoding='utf-8') as f:
+        json.dump(build_search_index(records), f, separators=(',', ':'))
+    return 'data/search-index.json'
+
+
+def build_site(papers, count, template_env=None, docs_dir=DOCS_DIR, shard_size=SHARD_SIZE):
+    """
+    Write the data shards and search index, then render docs/index.html.
+
+    Args:
+        papers (list): Papers to publish, in display order
+        count (int): Number of new papers to announce
+        template_env: Jinja2 Environment (defaults to src/templates)
+        docs_dir (str): Site output directory
+        shard_size (int): Records per shard
+
+    Returns:
+        dict: The manifest
+    """
+    os.makedirs(docs_dir, exist_ok=True)
+    records = [site_record(paper, i) for i, paper in enumerate(papers)]
+    search_index = write_search_index(records, docs_dir)
+    manifest = write_data_shards(records, docs_dir, shard_size, search_index)
+
+    if template_env is None:
+        from jinja2 import Environment, FileSystemLoader
+        template_env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+    template = template_env.get_template('index.html')
+
+    with open(os.path.join(docs_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(template.render(
+            manifest=manifest,
+            first_shard=records[:shard_size],
+            stopwords=sorted(STOPWORDS),
+            updated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            count=count,
+            total=len(records)
+        ))
+    return manifest
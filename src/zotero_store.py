@@ -0,0 +1,332 @@
+"""
+Helpers that cut down round trips to the Zotero web API.
+"""
+
+import os
+import json
+import atexit
+import sqlite3
+import logging
+import threading
+
+from src.doi_utils import doi_key, normalize_many
+from src.scheduler import get_default_scheduler
+from src.metrics import get_default_metrics
+
+logger = logging.getLogger('literature_monitor')
+
+# Maximum number of items the Zotero API accepts per write request
+ZOTERO_WRITE_BATCH = 50
+
+DEFAULT_COLLECTIONS_PATH = ".cache/zotero_collections.json"
+DEFAULT_MIRROR_PATH = ".cache/zotero_mirror.sqlite"
+
+
+class ZoteroWriteBuffer:
+    """Collect prepared Zotero items and create them in batched requests."""
+
+    def __init__(self, zot, batch_size=ZOTERO_WRITE_BATCH, on_saved=None):
+        """
+        Args:
+            zot: pyzotero Zotero client
+            batch_size (int): Items per create_items() call (max 50)
+            on_saved (callable): Called with each paper once Zotero has
+                confirmed its item (paper['zotero_key'] is set)
+        """
+        self.zot = zot
+        self.batch_size = max(1, min(batch_size, ZOTERO_WRITE_BATCH))
+        self.on_saved = on_saved
+        self.write_calls = 0
+        self._pending = []
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def add(self, item, paper):
+        """
+        Queue an item for creation, flushing when a full batch is ready.
+
+        Args:
+            item (dict): Zotero item data
+            paper (dict): Paper the item was built from; receives
+                'zotero_key' on success or 'zotero_error' on failure
+        """
+        with self._lock:
+            self._pending.append((item, paper))
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+        self._write(batch)
+
+    def flush(self):
+        """Create all queued items. Safe to call repeatedly."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        for start in range(0, len(batch), self.batch_size):
+            self._write(batch[start:start + self.batch_size])
+
+    def _write(self, batch):
+        if not batch:
+            return
+        self.write_calls += 1
+        metrics = get_default_metrics()
+        try:
+            with metrics.timed('zotero_write'):
+                result = get_default_scheduler().call(
+                    'zotero', self.zot.create_items, [item for item, _ in batch]
+                ) or {}
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} papers to Zotero: {str(e)}")
+            for _, paper in batch:
+                paper['zotero_error'] = str(e)
+            return
+        metrics.count('items_written', len(batch), stage='zotero_write')
+
+        # Results are keyed by the item's index within the request
+        successful = result.get('successful', {})
+        unchanged = result.get('unchanged', {})
+        failed = result.get('failed', {})
+        for index, (_, paper) in enumerate(batch):
+            key = str(index)
+            if key in successful:
+                paper['zotero_key'] = successful[key].get('key')
+                logger.info(f"Added paper to Zotero: {paper['title']}")
+            elif key in unchanged:
+                paper['zotero_key'] = unchanged[key]
+            else:
+                message = failed.get(key, {}).get('message', 'no result returned')
+                paper['zotero_error'] = message
+                metrics.count('errors', stage='zotero_write')
+                logger.error(f"Failed to save paper to Zotero: {paper['title']} ({message})")
+                continue
+            if self.on_saved:
+                self.on_saved(paper)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+        return False
+
+
+class CollectionCache:
+    """In-process map of Zotero collection names to keys."""
+
+    def __init__(self, zot, path=DEFAULT_COLLECTIONS_PATH):
+        """
+        Args:
+            zot: pyzotero Zotero client
+            path (str): JSON file used to persist the map between runs, or
+                None to keep it in memory only
+        """
+        self.zot = zot
+        self.path = path
+        # Library version at which the map was known to match the collections
+        self.collections_version = None
+        self._keys = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _response_version(self):
+        return int(self.zot.request.headers.get('last-modified-version', 0))
+
+    def load(self):
+        """
+        Load the name -> key map. The persisted copy is reused when no
+        collection was added, changed or deleted since its version (item
+        writes bump the library version but not the collections). Any API
+        error propagates, so this doubles as a connection test.
+        """
+        with self._lock:
+            if self._keys is not None:
+                return
+            scheduler = get_default_scheduler()
+            stored = self._read()
+            since = stored.get('collections_version') if stored else None
+            if since is not None:
+                changed = scheduler.call('zotero', self.zot.collection_versions, since=since)
+                current_version = self._response_version()
+                deleted = scheduler.call('zotero', self.zot.deleted, since=since).get('collections', [])
+                if not changed and not deleted:
+                    self._keys = stored.get('collections', {})
+                    self.collections_version = current_version
+                    self._dirty = current_version != since
+                    return
+            collections = scheduler.call('zotero', lambda: self.zot.everything(self.zot.collections()))
+            self._keys = {collection['data']['name']: collection['key'] for collection in collections}
+            self.collections_version = self._response_version()
+            self._dirty = True
+
+    def get_or_create(self, name):
+        """
+        Get a collection key by name, creating the collection if needed.
+
+        Args:
+            name (str): Collection name
+
+        Returns:
+            str: The collection key, or None if it could not be created
+        """
+        self.load()
+        with self._lock:
+            if name in self._keys:
+                return self._keys[name]
+
+            result = get_default_scheduler().call(
+                'zotero', self.zot.create_collections, [{'name': name}]
+            )
+            if result and result.get('successful'):
+                key = result['successful']['0']['key']
+                self._keys[name] = key
+                # The version is kept as loaded: the next load sees the new
+                # collection as a change and refetches the map once
+                self._dirty = True
+                return key
+            return None
+
+    def save(self):
+        """Persist the map if it changed since it was loaded."""
+        with self._lock:
+            if not self.path or not self._dirty or self._keys is None:
+                return
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, 'w') as f:
+                    json.dump({
+                        'library_id': str(self.zot.library_id),
+                        'collections_version': self.collections_version,
+                        'collections': self._keys
+                    }, f, indent=2)
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"Could not persist collection cache: {str(e)}")
+
+    def _read(self):
+        if not self.path or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable collection cache {self.path}: {str(e)}")
+            return None
+        if stored.get('library_id') != str(self.zot.library_id):
+            return None
+        return stored
+
+
+class LibraryMirror:
+    """Local SQLite mirror of item keys, DOIs and versions in a Zotero library."""
+
+    def __init__(self, zot, path=DEFAULT_MIRROR_PATH):
+        """
+        Args:
+            zot: pyzotero Zotero client
+            path (str): SQLite file holding the mirror
+        """
+        self.zot = zot
+        self.path = path
+        self.library_id = str(zot.library_id)
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS items (
+                library_id TEXT NOT NULL,
+                item_key TEXT NOT NULL,
+                doi TEXT,
+                version INTEGER NOT NULL,
+                PRIMARY KEY (library_id, item_key)
+            );
+            CREATE INDEX IF NOT EXISTS items_doi ON items (library_id, doi);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                library_id TEXT PRIMARY KEY,
+                library_version INTEGER NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    @property
+    def library_version(self):
+        """Library version the mirror was last synced to, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT library_version FROM sync_state WHERE library_id = ?",
+                (self.library_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def sync(self):
+        """
+        Bring the mirror up to date. The first sync pages through the whole
+        library; later ones only fetch items changed since the stored version.
+
+        Returns:
+            int: Number of items added, updated or removed
+        """
+        scheduler = get_default_scheduler()
+        since = self.library_version
+        # Read the version first: anything modified meanwhile is re-fetched next time
+        current_version = scheduler.call('zotero', self.zot.last_modified_version)
+        if since is not None and since == current_version:
+            logger.info(f"Zotero mirror up to date (version {current_version})")
+            return 0
+
+        if since is None:
+            changed = scheduler.call('zotero', lambda: self.zot.everything(self.zot.items()))
+            deleted = []
+        else:
+            changed = scheduler.call('zotero', lambda: self.zot.everything(self.zot.items(since=since)))
+            deleted = scheduler.call('zotero', self.zot.deleted, since=since).get('items', [])
+
+        with self._lock:
+            if since is None:
+                self._conn.execute("DELETE FROM items WHERE library_id = ?", (self.library_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)",
+                [(self.library_id, item['key'],
+                  doi_key(item['data'].get('DOI')) or None, item['version'])
+                 for item in changed]
+            )
+            self._conn.executemany(
+                "DELETE FROM items WHERE library_id = ? AND item_key = ?",
+                [(self.library_id, key) for key in deleted]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+                (self.library_id, current_version)
+            )
+            self._conn.commit()
+
+        logger.info(f"Synced Zotero mirror to version {current_version}: "
+                    f"{len(changed)} changed, {len(deleted)} deleted")
+        return len(changed) + len(deleted)
+
+    def dois(self):
+        """Return the set of DOI keys (src.doi_utils.doi_key) in the mirrored library."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT doi FROM items WHERE library_id = ? AND doi IS NOT NULL",
+                (self.library_id,)
+            ).fetchall()
+        # Rows written before keys were canonical may still carry prefixes
+        return set(normalize_many((row[0] for row in rows), keys=True)) - {''}
+
+    def contains_doi(self, doi):
+        """Check whether a DOI is already in the library."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM items WHERE library_id = ? AND doi = ? LIMIT 1",
+                (self.library_id, doi_key(doi))
+            ).fetchone()
+        return row is not None
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
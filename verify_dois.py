@@ -1,26 +1,26 @@
 #!/usr/bin/env python3
 """
 Fact-check all papers in archive directory by verifying DOIs against CrossRef API.
-Uses only standard library (urllib) - no external dependencies.
+Uses only standard library (http.client via src/http_transport.py) - no external dependencies.
+DOIs are resolved in bulk CrossRef queries (src/crossref.py) and the results are
+shared with the monitor through the DOI cache in src/doi_cache.py.
 """
 
 import os
-import re
 import json
-import time
-import urllib.request
-import urllib.error
-from pathlib import Path
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from src import crossref
+from src.archive_index import load_archive_index, parse_archive_content
+from src.doi_utils import normalize_many
 
 ARCHIVE_DIR = "src/archive"
 REPORT_FILE = "doi_verification_report.json"
+DEFAULT_WORKERS = 3
 
 def parse_archive_file(filepath):
-    """Parse papers from a markdown archive file."""
-    papers = []
-    current_paper = None
-    current_category = "Unknown"
-    
+    """Parse papers with a DOI from a markdown archive file."""
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
     
@@ -28,101 +28,93 @@ def parse_archive_file(filepath):
     if "Papers Removed" in content:
         return []
     
-    for line in content.split('\n'):
-        # Detect category headers
-        if line.startswith('## ') and '(' in line and 'papers)' in line:
-            current_category = line[3:].split(' (')[0].strip()
-        elif line.startswith('## ') and not line.startswith('## Summary'):
-            current_category = line[3:].strip()
-            
-        # Start of a new paper
-        elif line.startswith('### '):
-            if current_paper and current_paper.get('doi'):
-                papers.append(current_paper)
-            current_paper = {
-                'title': line[4:].strip(), 
-                'category': current_category,
-                'source_file': os.path.basename(filepath)
-            }
-            
-        # Paper metadata
-        elif current_paper and line.startswith('**Authors:**'):
-            current_paper['authors'] = line[12:].strip()
-        elif current_paper and line.startswith('**DOI:**'):
-            doi = line[8:].strip()
-            # Clean up the DOI
-            doi = re.sub(r'\[?\d+\]?$', '', doi).strip()
-            prefixes = ['https://doi.org/', 'http://doi.org/', 'doi.org/', 'DOI: ', 'doi:']
-            for prefix in prefixes:
-                if doi.lower().startswith(prefix.lower()):
-                    doi = doi[len(prefix):]
-            current_paper['doi'] = doi.strip()
-    
-    # Add the last paper
-    if current_paper and current_paper.get('doi'):
-        papers.append(current_paper)
-        
-    return papers
+    papers = parse_archive_content(content, os.path.basename(filepath))
+    return [p for p in papers if p['doi']]
+
+def _to_result(doi, entry):
+    """Convert a CrossRef entry into a (doi, status, details) result."""
+    if entry['status'] == "VERIFIED":
+        return (doi, "VERIFIED", {
+            'real_title': entry['title'][:100],
+            'real_authors': entry['authors'][:3]
+        })
+    return (doi, entry['status'], entry['detail'])
 
 def verify_doi(doi):
-    """Verify a DOI against CrossRef API. Returns (doi, status, details)."""
+    """
+    Verify a DOI against CrossRef API. Returns (doi, status, details).
+    Lookups go through the shared DOI cache and the scheduler's CrossRef budget.
+    """
     if not doi:
         return (doi, "INVALID", "Empty DOI")
     
     # Skip preprints
-    if any(prefix in doi for prefix in ['10.48550/', '10.1101/', 'arXiv']):
+    if crossref.is_preprint(doi):
         return (doi, "PREPRINT", "Preprint - not verified")
     
-    try:
-        url = f"https://api.crossref.org/works/{doi}"
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'DOIVerifier/1.0 (mailto:contact@example.com)'
-        })
+    return _to_result(doi, crossref.lookup(doi))
+
+def build_report(results):
+    """
+    Build the verification report written to REPORT_FILE.
+    
+    Args:
+        results (dict): Papers by verification status, as returned by main()
         
-        with urllib.request.urlopen(req, timeout=15) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode('utf-8'))
-                real_title = data.get('message', {}).get('title', [''])[0]
-                real_authors = data.get('message', {}).get('author', [])
-                author_names = [f"{a.get('given', '')} {a.get('family', '')}".strip() for a in real_authors[:3]]
-                return (doi, "VERIFIED", {
-                    'real_title': real_title[:100],
-                    'real_authors': author_names
-                })
-                
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return (doi, "FAKE", "DOI not found in CrossRef")
-        return (doi, "ERROR", f"HTTP {e.code}")
-    except urllib.error.URLError as e:
-        return (doi, "ERROR", str(e.reason))
-    except Exception as e:
-        return (doi, "ERROR", str(e))
-    
-    return (doi, "ERROR", "Unknown error")
+    Returns:
+        dict: Summary counts plus the fake, verified, preprint and error papers
+    """
+    return {
+        'summary': {
+            'total': sum(len(papers) for papers in results.values()),
+            'verified': len(results.get('VERIFIED', [])),
+            'fake': len(results.get('FAKE', [])),
+            'preprints': len(results.get('PREPRINT', [])),
+            'errors': len(results.get('ERROR', []))
+        },
+        'fake_papers': results.get('FAKE', []),
+        'verified_papers': results.get('VERIFIED', []),
+        'preprints': results.get('PREPRINT', []),
+        'errors': results.get('ERROR', [])
+    }
 
-def main():
+def main(workers=DEFAULT_WORKERS):
+    """
+    Verify every archived paper and write the report.
+    
+    Args:
+        workers (int): Number of concurrent CrossRef requests
+    """
     print("=" * 60)
     print("DOI VERIFICATION - ALL ARCHIVE PAPERS")
     print("=" * 60)
     
-    # Find all archive files
-    archive_path = Path(ARCHIVE_DIR)
-    archive_files = sorted(archive_path.glob("papers_*.md"))
+    # Load all papers from the archive index (only changed files are reparsed)
+    index = load_archive_index(ARCHIVE_DIR)
+    all_papers = [
+        p for p in index.papers(prefix="papers_", skip_removal_logs=True)
+        if p['doi']
+    ]
+    archive_files = [name for name in index.files if name.startswith("papers_")]
     print(f"\nFound {len(archive_files)} archive files")
     
-    # Parse all papers
-    all_papers = []
-    for filepath in archive_files:
-        papers = parse_archive_file(filepath)
-        all_papers.extend(papers)
-        if papers:
-            print(f"  {filepath.name}: {len(papers)} papers")
+    counts = {}
+    for paper in all_papers:
+        counts[paper['source_file']] = counts.get(paper['source_file'], 0) + 1
+    for name, count in counts.items():
+        print(f"  {name}: {count} papers")
     
     print(f"\nTotal papers to verify: {len(all_papers)}")
     print("-" * 60)
     
-    # Verify DOIs with rate limiting
+    # Resolve all DOIs up front in bulk filter queries; the per-paper pass
+    # below then mostly reads the cache
+    crossref.verify_many(
+        p['doi'] for p in all_papers if p.get('doi') and not crossref.is_preprint(p['doi'])
+    )
+    
+    # Verify DOIs concurrently; the shared scheduler keeps all workers within
+    # CrossRef's polite-pool limits
     results = {
         'VERIFIED': [],
         'FAKE': [],
@@ -130,31 +122,35 @@ def main():
         'ERROR': [],
         'INVALID': []
     }
-    
-    for i, paper in enumerate(all_papers):
-        doi = paper.get('doi', '')
-        title_short = paper.get('title', '')[:40]
-        print(f"[{i+1}/{len(all_papers)}] {title_short}...", end=" ", flush=True)
-        
-        doi, status, details = verify_doi(doi)
-        paper['verification_status'] = status
-        paper['verification_details'] = details
-        
-        if status not in results:
-            results[status] = []
-        results[status].append(paper)
-        
-        if status == "VERIFIED":
-            print("✓")
-        elif status == "FAKE":
-            print("✗ FAKE")
-        elif status == "PREPRINT":
-            print("~ preprint")
-        else:
-            print(f"? {status}")
-        
-        # Rate limiting - be nice to CrossRef
-        time.sleep(0.3)
+    # The same paper often appears in several archives; verify each distinct
+    # DOI once and share its outcome
+    keys = normalize_many((p.get('doi', '') for p in all_papers), keys=True)
+    distinct = {}
+    for paper, key in zip(all_papers, keys):
+        distinct.setdefault(key, paper.get('doi', ''))
+    print(f"Distinct DOIs: {len(distinct)}")
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        verdicts = dict(zip(distinct, executor.map(verify_doi, distinct.values())))
+        for i, (paper, key) in enumerate(zip(all_papers, keys)):
+            _, status, details = verdicts[key]
+            title_short = paper.get('title', '')[:40]
+            print(f"[{i+1}/{len(all_papers)}] {title_short}...", end=" ", flush=True)
+            
+            paper['verification_status'] = status
+            paper['verification_details'] = details
+            
+            if status not in results:
+                results[status] = []
+            results[status].append(paper)
+            
+            if status == "VERIFIED":
+                print("✓")
+            elif status == "FAKE":
+                print("✗ FAKE")
+            elif status == "PREPRINT":
+                print("~ preprint")
+            else:
+                print(f"? {status}")
     
     # Print summary
     print("\n" + "=" * 60)
@@ -171,19 +167,7 @@ def main():
     print(f"  Errors:    {error_count}")
     
     # Save detailed report
-    report = {
-        'summary': {
-            'total': len(all_papers),
-            'verified': verified_count,
-            'fake': fake_count,
-            'preprints': preprint_count,
-            'errors': error_count
-        },
-        'fake_papers': results.get('FAKE', []),
-        'verified_papers': results.get('VERIFIED', []),
-        'preprints': results.get('PREPRINT', []),
-        'errors': results.get('ERROR', [])
-    }
+    report = build_report(results)
     
     with open(REPORT_FILE, 'w') as f:
         json.dump(report, f, indent=2)
@@ -213,4 +197,7 @@ def main():
     return results
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"concurrent CrossRef requests (default: {DEFAULT_WORKERS})")
+    main(workers=parser.parse_args().workers)